@@ -0,0 +1,25 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+
+# ==============================================================================
+# BANCOS SQLITE LOCAIS (HISTÓRICOS)
+# ==============================================================================
+
+def caminho_banco(nome_arquivo, variavel_ambiente):
+    """Caminho do banco: a variável de ambiente, se definida, senão ``nome_arquivo`` ao lado do app."""
+    return os.environ.get(variavel_ambiente, os.path.join(os.path.dirname(os.path.abspath(__file__)), nome_arquivo))
+
+
+@contextmanager
+def conectar(caminho):
+    """Conexão para uma operação: commit ao sair sem erro, rollback em caso de erro, sempre fechada.
+
+    Uma conexão por operação porque o Streamlit atende cada sessão em outra thread.
+    """
+    con = sqlite3.connect(caminho)
+    try:
+        with con:
+            yield con
+    finally:
+        con.close()
@@ -0,0 +1,66 @@
+"""Confere o localizador vetorizado de âncoras contra a varredura original e mede o cache de layout.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.bench_ancoras [--arquivos 200]
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.referencia import localizar_ancoras_legado
+import ponto
+from ponto import estatisticas_layout, localizar_ancoras
+from tests.test_ancoras import conferir_ancoras, planilha_gerada
+
+
+def _planilhas(n, variar_layout=True):
+    for seed in range(n):
+        yield planilha_gerada(seed, variar_layout)
+
+
+def _limpar_modelos():
+    ponto._modelos_layout.clear()
+
+
+def conferir_equivalencia(n=24):
+    planilhas = list(_planilhas(n))
+    # Arquivo sem estrutura reconhecível
+    planilhas.append(pd.DataFrame([['x', 'y']] * 50))
+    for df in planilhas:
+        conferir_ancoras(df)
+    print(f"Equivalência OK ({len(planilhas)} planilhas, com e sem cache de layout)")
+
+
+def medir(n):
+    planilhas = list(_planilhas(n, variar_layout=False))
+
+    inicio = time.perf_counter()
+    for df in planilhas:
+        localizar_ancoras_legado(df)
+    t_legado = time.perf_counter() - inicio
+
+    _limpar_modelos()
+    inicio = time.perf_counter()
+    for df in planilhas:
+        _limpar_modelos()
+        localizar_ancoras(df)
+    t_varredura = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for df in planilhas:
+        localizar_ancoras(df)
+    t_cache = time.perf_counter() - inicio
+
+    por = lambda t: t / n * 1000
+    print(f"{n} planilhas (ms por arquivo): varredura original {por(t_legado):.2f} | "
+          f"varredura vetorizada {por(t_varredura):.2f} | modelo em cache {por(t_cache):.3f}")
+    print(f"Cache de layout: {estatisticas_layout()}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--arquivos', type=int, default=200)
+    args = parser.parse_args()
+    conferir_equivalencia()
+    medir(args.arquivos)
@@ -0,0 +1,69 @@
+"""Confere o motor vetorizado de atrasos contra o laço original e mede o ganho.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.bench_atrasos [--dias 5000] [--sementes 30]
+"""
+import argparse
+import time
+from datetime import timedelta
+
+from benchmarks.geradores import gerar_ponto, para_bytes
+from benchmarks.referencia import processar_batidas_legado
+from ponto import comparar_batidas, detectar_atrasos, extrair_estrutura, montar_batidas, varrer_tolerancias
+from tests.test_atrasos import conferir_deteccao, ler_ponto_gerado
+from tests.test_reanalise import conferir_parametros_alterados
+
+
+def conferir_equivalencia(sementes=30, n_dias=120):
+    """Falha com AssertionError se algum arquivo gerado divergir do cálculo original."""
+    for seed in range(sementes):
+        conferir_deteccao(seed, n_dias)
+    print(f"Equivalência OK ({sementes} sementes x xlsx/csv x 3 tolerâncias)")
+
+
+def conferir_reanalise(sementes=10, n_dias=120):
+    """Horário e almoço alterados e a varredura de tolerâncias batem com a comparação completa."""
+    for seed in range(sementes):
+        conferir_parametros_alterados(seed, n_dias)
+    print(f"Re-análise OK ({sementes} sementes: horário alterado, almoço fixo, varredura)")
+
+
+def medir(n_dias=5000, repeticoes=3):
+    df = ler_ponto_gerado(para_bytes(gerar_ponto(n_dias, seed=1), 'csv'), 'csv')
+    _, markers, agendamento, linhas_dados = extrair_estrutura(df)
+    tolerancia = timedelta(minutes=5)
+
+    def cronometrar(func):
+        melhor = float('inf')
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            func(linhas_dados, markers, agendamento, tolerancia)
+            melhor = min(melhor, time.perf_counter() - inicio)
+        return melhor
+
+    t_legado = cronometrar(processar_batidas_legado)
+    t_vetorizado = cronometrar(detectar_atrasos)
+    print(f"{n_dias} linhas: laço original {t_legado * 1000:.1f} ms | vetorizado {t_vetorizado * 1000:.1f} ms "
+          f"({t_legado / t_vetorizado:.1f}x)")
+
+    # Re-análise: só a comparação, sobre as batidas já interpretadas
+    batidas = montar_batidas(None, markers, agendamento, linhas_dados)
+    inicio = time.perf_counter()
+    for minutos in range(0, 31):
+        comparar_batidas(batidas, timedelta(minutes=minutos))
+    t_laco = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    varrer_tolerancias(batidas, range(0, 31))
+    t_varredura = time.perf_counter() - inicio
+    print(f"{n_dias} linhas, 31 tolerâncias: comparação a cada valor {t_laco * 1000:.1f} ms | "
+          f"varredura única {t_varredura * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--dias', type=int, default=5000)
+    parser.add_argument('--sementes', type=int, default=30)
+    args = parser.parse_args()
+    conferir_equivalencia(args.sementes)
+    conferir_reanalise()
+    medir(args.dias)
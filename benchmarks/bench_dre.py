@@ -0,0 +1,79 @@
+"""Confere o índice do DRE contra a busca original por classificação e mede o tempo
+(índice e histórico mensal).
+
+Uso (na raiz do repositório):
+    python -m benchmarks.bench_dre [--linhas 20000] [--indicadores 48]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.geradores import arquivo_nomeado, gerar_dre, para_bytes
+from benchmarks.referencia import buscar_por_classificacao
+from cache import limpar_cache
+from dre import IndiceDRE
+from historico_dre import HistoricoDRE
+from tests.test_dre import conferir_indice, tabela_gerada, tabela_suja
+
+
+def conferir_equivalencia(sementes=5, n_linhas=2000):
+    for seed in range(sementes):
+        conferir_indice(tabela_suja(n_linhas, seed))
+    print(f"Equivalência OK ({sementes} sementes, {n_linhas} linhas)")
+
+
+def medir(n_linhas, n_indicadores):
+    df = tabela_gerada(n_linhas, seed=42)
+    codigos = df['Classificação'].drop_duplicates().head(n_indicadores).tolist()
+
+    inicio = time.perf_counter()
+    for codigo in codigos:
+        buscar_por_classificacao(df, codigo)
+    original = time.perf_counter() - inicio
+
+    IndiceDRE.de_dataframe(df.head(10))  # aquecimento
+    inicio = time.perf_counter()
+    indice = IndiceDRE.de_dataframe(df)
+    construcao = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    indice.buscar(codigos)
+    consulta = time.perf_counter() - inicio
+
+    print(f"{n_linhas} linhas, {len(codigos)} indicadores: busca original {original * 1000:.1f} ms | "
+          f"índice {construcao * 1000:.1f} ms (montagem) + {consulta * 1000:.2f} ms (consulta)")
+
+
+def medir_historico(n_meses=36, n_linhas=500):
+    arquivos = [
+        arquivo_nomeado(para_bytes(gerar_dre(n_linhas, seed=m)), f"DRE {2022 + m // 12}-{m % 12 + 1:02d}.xlsx")
+        for m in range(n_meses)
+    ]
+    with tempfile.TemporaryDirectory() as pasta:
+        historico = HistoricoDRE(os.path.join(pasta, 'historico.sqlite'))
+        inicio = time.perf_counter()
+        for arquivo in arquivos:
+            historico.registrar(arquivo)
+        primeira = time.perf_counter() - inicio
+
+        # Sem o cache de leitura em memória: simula outra sessão reenviando os arquivos
+        limpar_cache()
+        inicio = time.perf_counter()
+        assert not any(novo for _, novo in (historico.registrar(arquivo) for arquivo in arquivos))
+        serie = historico.serie()
+        reenvio = time.perf_counter() - inicio
+    assert len(serie) == n_meses
+    print(f"Histórico de {n_meses} meses ({n_linhas} linhas cada): 1º envio {primeira * 1000:.0f} ms | "
+          f"reenvio + série {reenvio * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--linhas', type=int, default=20_000)
+    parser.add_argument('--indicadores', type=int, default=48)
+    args = parser.parse_args()
+    conferir_equivalencia()
+    medir(500, 6)
+    medir(args.linhas, 6)
+    medir(args.linhas, args.indicadores)
+    medir_historico()
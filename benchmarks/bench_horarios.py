@@ -0,0 +1,62 @@
+"""Micro-benchmark da leitura de horários: função original x memo x lote por valores únicos.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.bench_horarios [--celulas 1000000]
+"""
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from benchmarks.referencia import converter_tempo_segundos_regex, limpar_celula_tempo_legado
+from ponto import _segundos_do_texto, converter_tempo_segundos, estatisticas_memo_horarios, limpar_celula_tempo
+from tests.test_horarios import conferir_horarios, todos_horarios, valores_estranhos
+
+
+def conferir_equivalencia():
+    valores = todos_horarios() + valores_estranhos(20_000)
+    conferir_horarios(valores)
+    print(f"Equivalência OK ({len(valores)} valores)")
+
+
+def _celulas(n, seed=1):
+    # Batidas realistas: horários em torno de 08:00/12:00/13:00/17:00 e alguns valores sujos
+    rnd = random.Random(seed)
+    estranhos = ['Falta', 'Folga', '', None, '*13:20']
+    bases = [8 * 60, 12 * 60, 13 * 60, 17 * 60]
+    return [
+        rnd.choice(estranhos) if rnd.random() < 0.03 else
+        f"{(b := rnd.choice(bases) + rnd.randint(-15, 30)) // 60:02d}:{b % 60:02d}"
+        for _ in range(n)
+    ]
+
+
+def _medir(rotulo, funcao, n):
+    inicio = time.perf_counter()
+    funcao()
+    decorrido = time.perf_counter() - inicio
+    print(f"{rotulo:<42} {decorrido * 1000:>9.1f} ms  ({decorrido / n * 1e9:>6.0f} ns/célula)")
+    return decorrido
+
+
+def medir(n):
+    celulas = _celulas(n)
+    serie = pd.Series(celulas, dtype=object)
+    print(f"{n} células, {len(set(map(str, celulas)))} textos distintos")
+
+    n_legado = min(n, 200_000)
+    legado = _medir(f"limpar_celula_tempo original ({n_legado})", lambda: [limpar_celula_tempo_legado(v) for v in celulas[:n_legado]], n_legado)
+    _segundos_do_texto.cache_clear()
+    memo = _medir(f"limpar_celula_tempo com memo ({n_legado})", lambda: [limpar_celula_tempo(v) for v in celulas[:n_legado]], n_legado)
+    _medir("lote original (str.extract)", lambda: converter_tempo_segundos_regex(serie), n)
+    _medir("lote por valores únicos", lambda: converter_tempo_segundos(serie), n)
+    print(f"Ganho por célula (memo x original): {legado / memo:.1f}x | memo: {estatisticas_memo_horarios()}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--celulas', type=int, default=1_000_000)
+    args = parser.parse_args()
+    conferir_equivalencia()
+    medir(args.celulas)
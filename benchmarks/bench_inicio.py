@@ -0,0 +1,119 @@
+"""Mede a partida a frio do app: tempo até o menu lateral, até a primeira página pronta
+e da primeira análise de ponto (upload feito ``--pausa`` segundos depois da abertura).
+
+Cada medição roda num interpretador novo (módulos do app fora do cache de
+import); o import do próprio Streamlit fica de fora, pois é igual para
+qualquer versão do app. Com --revisao, mede também uma versão anterior
+(exportada com git archive) para comparar.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.bench_inicio [--repeticoes 7] [--revisao HEAD~1]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.geradores import gerar_ponto, para_bytes
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Executado em um processo novo com o diretório do app como cwd
+_MEDICAO = r"""
+import json, os, sys, time
+sys.path.insert(0, os.getcwd())
+import io
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.testing.v1 import AppTest
+
+caminho_ponto, pausa = sys.argv[1], float(sys.argv[2])
+with open(caminho_ponto, 'rb') as f:
+    conteudo = f.read()
+
+marcas = {}
+radio_original = DeltaGenerator.radio
+def radio(self, *args, **kwargs):
+    resultado = radio_original(self, *args, **kwargs)
+    marcas.setdefault('menu', time.perf_counter())
+    return resultado
+DeltaGenerator.radio = radio
+
+inicio = time.perf_counter()
+at = AppTest.from_file(os.path.join(os.getcwd(), 'app.py'), default_timeout=120).run()
+fim = time.perf_counter()
+assert not at.exception, at.exception
+pandas_carregado = 'pandas' in sys.modules
+
+# O usuário escolhe o arquivo alguns segundos depois de a página abrir
+time.sleep(pausa)
+def upload(*args, **kwargs):
+    arquivo = io.BytesIO(conteudo)
+    arquivo.name = 'ponto.xlsx'
+    return arquivo
+st.file_uploader = upload
+inicio_upload = time.perf_counter()
+at.run()
+fim_upload = time.perf_counter()
+assert not at.exception and at.metric, at.exception
+
+print(json.dumps({
+    'menu_ms': (marcas['menu'] - inicio) * 1000,
+    'pagina_ms': (fim - inicio) * 1000,
+    'upload_ms': (fim_upload - inicio_upload) * 1000,
+    'pandas_carregado': pandas_carregado,
+}))
+"""
+
+
+def medir_arvore(diretorio, repeticoes, pausa):
+    resultados = []
+    with tempfile.TemporaryDirectory() as temporario:
+        # Gerado aqui para o processo medido não carregar o pandas antes da hora
+        caminho_ponto = os.path.join(temporario, 'ponto.xlsx')
+        with open(caminho_ponto, 'wb') as f:
+            f.write(para_bytes(gerar_ponto(31, seed=0)))
+        ambiente = {
+            **os.environ,
+            'HISTORICO_PONTO': os.path.join(temporario, 'ponto.sqlite'),
+            'HISTORICO_DRE': os.path.join(temporario, 'dre.sqlite'),
+            'PYTHONDONTWRITEBYTECODE': '1',
+        }
+        for _ in range(repeticoes):
+            saida = subprocess.run(
+                [sys.executable, '-c', _MEDICAO, caminho_ponto, str(pausa)], cwd=diretorio, env=ambiente,
+                capture_output=True, text=True, check=True,
+            ).stdout
+            resultados.append(json.loads(saida.strip().splitlines()[-1]))
+    return {
+        **{chave: statistics.median(r[chave] for r in resultados) for chave in ('menu_ms', 'pagina_ms', 'upload_ms')},
+        'pandas_carregado': resultados[-1]['pandas_carregado'],
+    }
+
+
+def exportar_revisao(revisao, destino):
+    arquivo = subprocess.run(['git', 'archive', revisao], cwd=RAIZ, capture_output=True, check=True).stdout
+    subprocess.run(['tar', '-x', '-C', destino], input=arquivo, check=True)
+
+
+def imprimir(rotulo, medida):
+    print(f"{rotulo:<14} menu lateral {medida['menu_ms']:>6.0f} ms | página inicial {medida['pagina_ms']:>6.0f} ms"
+          f" | primeiro upload {medida['upload_ms']:>6.0f} ms"
+          f" | pandas já carregado na página inicial: {'sim' if medida['pandas_carregado'] else 'não'}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-r', '--repeticoes', type=int, default=7)
+    parser.add_argument('--revisao', help="Revisão do git para comparar (ex.: HEAD~1)")
+    parser.add_argument('--pausa', type=float, default=2.0, help="Segundos entre a abertura e o upload (padrão: 2)")
+    args = parser.parse_args()
+
+    if args.revisao:
+        with tempfile.TemporaryDirectory() as pasta:
+            exportar_revisao(args.revisao, pasta)
+            imprimir(args.revisao, medir_arvore(pasta, args.repeticoes, args.pausa))
+    imprimir('árvore atual', medir_arvore(RAIZ, args.repeticoes, args.pausa))
@@ -0,0 +1,129 @@
+"""Compara tempo e pico de memória da leitura de XLSX: caminho original x leitura.py.
+
+Casos: pd.read_excel completo (caminho original das páginas), leitura podada
+do ponto (topo inteiro + colunas de batidas) e leitura só de Classificação e
+Movimento da DRE, com openpyxl (streaming) e, se instalado, calamine.
+
+Cada caso roda num processo novo. O pico de memória é o aumento do RSS máximo
+durante a leitura (no Linux o pico é zerado antes via /proc/self/clear_refs), o
+que também conta a memória do calamine (Rust); fora do Linux, usa tracemalloc.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.bench_leitura [--linhas 50000]
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.geradores import gerar_dre, gerar_ponto, para_bytes
+from tests.test_leitura_podada import MOTORES, conferir_colunas_dre, conferir_ponto_podado
+
+
+def _status_kib(campo):
+    with open('/proc/self/status') as f:
+        for linha in f:
+            if linha.startswith(campo + ':'):
+                return int(linha.split()[1])
+
+
+def _zerar_pico_rss():
+    """Zera o pico de RSS (VmHWM) e retorna o RSS atual em KiB; None fora do Linux."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return _status_kib('VmRSS')
+    except OSError:
+        return None
+
+
+def _caso(caminho, nome_caso, motor, fila):
+    import leitura
+    if motor:
+        leitura.MOTOR_XLSX = motor
+    with open(caminho, 'rb') as f:
+        conteudo = f.read()
+    buffer = io.BytesIO(conteudo)
+    buffer.name = os.path.basename(caminho)
+
+    rss_antes = _zerar_pico_rss()
+    if rss_antes is None:
+        tracemalloc.start()
+    inicio = time.perf_counter()
+    if nome_caso == 'original':
+        df = pd.read_excel(buffer, header=None)
+    elif nome_caso == 'podada':
+        from ponto import colunas_do_ponto
+        df = leitura.ler_planilha_podada(buffer, colunas_do_ponto)
+    else:
+        df = leitura.ler_colunas_por_cabecalho(buffer, 'Classificação', ('Classificação', 'Movimento'))
+    decorrido = time.perf_counter() - inicio
+    if rss_antes is None:
+        pico_mb = tracemalloc.get_traced_memory()[1] / 2**20
+    else:
+        pico_mb = (_status_kib('VmHWM') - rss_antes) / 1024
+    fila.put((decorrido, pico_mb, df.shape))
+
+
+def _rodar(caminho, nome_caso, motor=None):
+    ctx = multiprocessing.get_context('spawn')
+    fila = ctx.Queue()
+    processo = ctx.Process(target=_caso, args=(caminho, nome_caso, motor, fila))
+    processo.start()
+    resultado = fila.get()
+    processo.join()
+    return resultado
+
+
+def conferir_equivalencia():
+    """A leitura podada dá o mesmo resultado final que o pd.read_excel completo."""
+    import leitura
+
+    motor_original = leitura.MOTOR_XLSX
+    try:
+        for motor in MOTORES:
+            leitura.MOTOR_XLSX = motor
+            for seed in range(6):
+                conferir_ponto_podado(para_bytes(gerar_ponto(30 + seed * 40, seed=seed, prop_estranhas=0.3, col_batidas=seed % 3 + 1)))
+            for linhas_titulo in (3, 70):
+                conferir_colunas_dre(para_bytes(gerar_dre(500, linhas_titulo=linhas_titulo)))
+    finally:
+        leitura.MOTOR_XLSX = motor_original
+    print("Equivalência OK (ponto e DRE, leitura podada x pd.read_excel)")
+
+
+def main(n_linhas):
+    import leitura
+    motores = ['openpyxl'] + (['calamine'] if leitura.MOTOR_XLSX == 'calamine' else [])
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivos = {
+            'ponto': os.path.join(pasta, 'ponto.xlsx'),
+            'dre': os.path.join(pasta, 'dre.xlsx'),
+        }
+        with open(arquivos['ponto'], 'wb') as f:
+            f.write(para_bytes(gerar_ponto(n_linhas)))
+        with open(arquivos['dre'], 'wb') as f:
+            f.write(para_bytes(gerar_dre(n_linhas)))
+
+        casos = [('ponto', 'original', None)] + [('ponto', 'podada', m) for m in motores]
+        casos += [('dre', 'original', None)] + [('dre', 'colunas', m) for m in motores]
+        print(f"{n_linhas} linhas por arquivo")
+        for arquivo, nome_caso, motor in casos:
+            decorrido, pico_mb, forma = _rodar(arquivos[arquivo], nome_caso, motor)
+            rotulo = f"{arquivo:5s} {nome_caso:8s} {motor or 'pd.read_excel':13s}"
+            print(f"{rotulo} {decorrido:7.2f} s  pico +{pico_mb:7.1f} MB  {forma}")
+    if 'calamine' not in motores:
+        print("(python-calamine não instalado: só o openpyxl foi medido)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--linhas', type=int, default=50_000)
+    args = parser.parse_args()
+    conferir_equivalencia()
+    main(args.linhas)
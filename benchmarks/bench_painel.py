@@ -0,0 +1,52 @@
+"""Mede as consultas do painel de atrasos com vários anos de histórico sintético.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.bench_painel [--funcionarios 300] [--meses 36]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.geradores import popular_historico_ponto
+from historico_ponto import HistoricoPonto
+from tests.test_historico_ponto import conferir_consultas
+
+
+def medir(n_funcionarios, n_meses):
+    with tempfile.TemporaryDirectory() as pasta:
+        historico = HistoricoPonto(os.path.join(pasta, 'historico_ponto.sqlite'))
+        inicio = time.perf_counter()
+        popular_historico_ponto(historico, n_funcionarios, n_meses)
+        print(f"{n_funcionarios} funcionários x {n_meses} meses gravados em {time.perf_counter() - inicio:.1f} s "
+              f"({historico.resumo()['ocorrencias']} ocorrências)")
+
+        conferir_consultas(historico)
+        meses = historico.meses()
+        ultimo_ano = {'mes_inicio': meses[-12], 'mes_fim': meses[-1]}
+        consultas = [
+            ('resumo', lambda: historico.resumo()),
+            ('por mês', lambda: historico.por_mes()),
+            ('por dia da semana', lambda: historico.por_dia_semana()),
+            ('por funcionário (top 20)', lambda: historico.por_funcionario(limite=20)),
+            ('reincidentes (>= 6 meses)', lambda: historico.reincidentes(6)),
+            ('últimos 12 meses, por mês', lambda: historico.por_mes(**ultimo_ano)),
+            ('últimos 12 meses, reincidentes', lambda: historico.reincidentes(3, **ultimo_ano)),
+            ('1 funcionário, por mês', lambda: historico.por_mes(funcionarios=['FUNCIONÁRIO 0007'])),
+        ]
+        total = 0.0
+        for rotulo, consulta in consultas:
+            inicio = time.perf_counter()
+            consulta()
+            decorrido = time.perf_counter() - inicio
+            total += decorrido
+            print(f"{rotulo:<34} {decorrido * 1000:>8.1f} ms")
+        print(f"{'painel completo':<34} {total * 1000:>8.1f} ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--funcionarios', type=int, default=300)
+    parser.add_argument('--meses', type=int, default=36)
+    args = parser.parse_args()
+    medir(args.funcionarios, args.meses)
@@ -0,0 +1,75 @@
+"""Confere a extração e a conciliação Pix contra as versões originais e mede o tempo.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.bench_pix [--linhas 100000]
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.referencia import conciliar_pix_legado, extrair_lancamentos_pix_legado
+from pix import conciliar_pix, extrair_lancamentos_pix
+from tests.test_conciliacao_pix import conferir_conciliacao, gerar_lancamentos, lancamentos_fora_da_janela
+from tests.test_extracao_pix import conferir_lancamentos, planilha_com_ruido
+
+
+def conferir_equivalencia(n=3000, sementes=5):
+    for seed in range(sementes):
+        conferir_conciliacao(seed, n)
+    print(f"Equivalência OK ({sementes} sementes, {n} lançamentos)")
+
+
+def conferir_extracao(n=3000, sementes=5):
+    for seed in range(sementes):
+        conferir_lancamentos(planilha_com_ruido(n, seed))
+    print(f"Extração equivalente à original ({sementes} sementes, {n} lançamentos)")
+
+
+def medir_extracao(n):
+    df = planilha_com_ruido(n, seed=42)
+    for nome, funcao in (('original', extrair_lancamentos_pix_legado), ('vetorizada', extrair_lancamentos_pix)):
+        inicio = time.perf_counter()
+        lancamentos = funcao(df)
+        print(f"{n} lançamentos, extração {nome}: {(time.perf_counter() - inicio) * 1000:.1f} ms ({len(lancamentos)} lançamentos)")
+
+
+def medir(n, legado_ate=20_000):
+    pix_entries, bb_values = gerar_lancamentos(n, seed=42)
+    df_pix = pd.DataFrame(pix_entries)
+    df_bb = pd.DataFrame({'Valor': bb_values})
+
+    for tolerancia in (0.0, 0.05):
+        inicio = time.perf_counter()
+        df_conc, df_falt, df_extra = conciliar_pix(df_pix, df_bb, tolerancia=tolerancia)
+        decorrido = time.perf_counter() - inicio
+        print(f"{n} lançamentos, tolerância R$ {tolerancia:.2f}: {decorrido * 1000:.1f} ms "
+              f"({len(df_conc)} confirmados, {len(df_falt)} faltantes, {len(df_extra)} extras)")
+
+    if n <= legado_ate:
+        inicio = time.perf_counter()
+        conciliar_pix_legado(pix_entries, bb_values)
+        print(f"{n} lançamentos, comparação original: {(time.perf_counter() - inicio) * 1000:.1f} ms")
+    else:
+        print(f"(comparação original omitida acima de {legado_ate} lançamentos: O(n·m))")
+
+
+def medir_fora_da_janela(n=20_000):
+    """Tolerância com janela de datas quando nenhuma data cabe na janela (antes O(n·m): ~73 s com 20 mil)."""
+    df_pix, df_bb = lancamentos_fora_da_janela(n)
+    inicio = time.perf_counter()
+    df_conc, _, _ = conciliar_pix(df_pix, df_bb, tolerancia=0.05, janela_dias=3)
+    print(f"{n} x {n} lançamentos fora da janela, tolerância R$ 0.05: "
+          f"{(time.perf_counter() - inicio) * 1000:.1f} ms ({len(df_conc)} confirmados)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--linhas', type=int, default=100_000)
+    args = parser.parse_args()
+    conferir_extracao()
+    medir_extracao(args.linhas)
+    conferir_equivalencia()
+    medir(10_000)
+    medir(args.linhas)
+    medir_fora_da_janela()
@@ -0,0 +1,39 @@
+"""Confere as faixas de penalidade do vale contra o cálculo original e mede a folha em lote.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.bench_vale [--funcionarios 100000]
+"""
+import argparse
+import time
+
+from benchmarks.referencia import calcular_vale_legado
+from tests.test_vale import conferir_cargo, conferir_folha, gerar_quadro
+from vale import TABELA_CARGOS, calcular_folha
+
+
+def conferir_equivalencia(max_atrasos=40):
+    for cargo in TABELA_CARGOS:
+        conferir_cargo(cargo, max_atrasos)
+    print(f"Equivalência OK ({len(TABELA_CARGOS)} cargos x 0..{max_atrasos} atrasos)")
+
+
+def medir(n, legado_ate=200_000):
+    quadro = gerar_quadro(n)
+    inicio = time.perf_counter()
+    folha = calcular_folha(quadro)
+    print(f"{n} funcionários, folha vetorizada: {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    if n <= legado_ate:
+        inicio = time.perf_counter()
+        for cargo, qtd in zip(quadro['Cargo'], quadro['Atrasos']):
+            calcular_vale_legado(cargo, qtd)
+        print(f"{n} funcionários, cálculo original um a um: {(time.perf_counter() - inicio) * 1000:.1f} ms")
+        conferir_folha(quadro)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--funcionarios', type=int, default=100_000)
+    args = parser.parse_args()
+    conferir_equivalencia()
+    medir(args.funcionarios)
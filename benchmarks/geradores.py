@@ -0,0 +1,192 @@
+import io
+import random
+from datetime import time
+
+import numpy as np
+import pandas as pd
+
+# ==============================================================================
+# GERADORES DE DADOS SINTÉTICOS
+# ==============================================================================
+
+DIAS_SEMANA = ['Seg', 'Ter', 'Qua', 'Qui', 'Sex', 'Sáb', 'Dom']
+
+# Valores "sujos" que aparecem nas exportações do relógio de ponto
+_BATIDAS_ESTRANHAS = ['', 'Falta', 'Folga', '00:00', '8:5', '24:00', '07:59:30', '08:10:60', '12:3x', '*13:20', 'nan', None, 800, time(8, 7)]
+
+
+def _hhmm(minutos):
+    return f"{minutos // 60:02d}:{minutos % 60:02d}"
+
+
+def gerar_ponto(n_dias=31, seed=0, nome="FUNCIONÁRIO TESTE", prop_estranhas=0.05, col_horarios=1, col_batidas=2):
+    """Gera um DataFrame no layout do relógio de ponto (tabela SEG/TER... e ENTRADA 1/SAÍDA 1/ENTRADA 2).
+
+    ``col_horarios`` e ``col_batidas`` deslocam as duas tabelas para simular
+    variações do modelo de exportação.
+    """
+    rnd = random.Random(seed)
+    n_colunas = max(col_horarios + 7, col_batidas + 4) + 2
+    linhas = [[None] * n_colunas for _ in range(23)]
+
+    # Tabela de horários padrão (coluna de referência; horários em +2, +4, +6)
+    padroes = {
+        'SEG': ('08:00', '12:00', '13:00'), 'TER': ('08:00', '12:00', '13:00'),
+        'QUA': ('08:00', '12:00', '13:30'), 'QUI': ('07:30', '11:30', '12:30'),
+        'SEX': ('08:00', '12:00', '13:00'), 'SÁB': ('09:00', '13:00', None),
+    }
+    linhas[7][col_horarios] = 'DIA'
+    for i, (dia, (ent1, sai1, ent2)) in enumerate(padroes.items()):
+        linhas[8 + i][col_horarios] = dia
+        linhas[8 + i][col_horarios + 2] = ent1
+        linhas[8 + i][col_horarios + 4] = sai1
+        linhas[8 + i][col_horarios + 6] = ent2
+
+    linhas[18][0] = nome
+    linhas[20][col_batidas:col_batidas + 4] = ['ENTRADA 1', 'SAÍDA 1', 'ENTRADA 2', 'SAÍDA 2']
+    linhas[22][col_batidas] = 'Totais'
+
+
+    def batida(base):
+        if rnd.random() < prop_estranhas:
+            return rnd.choice(_BATIDAS_ESTRANHAS)
+        return _hhmm(base + rnd.randint(-10, 25))
+
+    for k in range(n_dias):
+        dia = DIAS_SEMANA[k % 7]
+        data = f"{k % 28 + 1:02d}/{(k // 28) % 12 + 1:02d}/2024 - {dia}"
+        linha = [data] + [None] * (n_colunas - 1)
+        linha[col_batidas:col_batidas + 4] = [batida(8 * 60), batida(12 * 60), batida(13 * 60), batida(17 * 60)]
+        linhas.append(linha)
+
+    return pd.DataFrame(linhas)
+
+
+def para_bytes(df, formato='xlsx'):
+    """Serializa um DataFrame gerado como o arquivo que o usuário faria upload."""
+    buffer = io.BytesIO()
+    if formato == 'xlsx':
+        df.to_excel(buffer, header=False, index=False)
+    else:
+        df.to_csv(buffer, header=False, index=False)
+    return buffer.getvalue()
+
+
+def arquivo_nomeado(conteudo, nome):
+    """BytesIO com ``name``, imitando o UploadedFile do Streamlit."""
+    buffer = io.BytesIO(conteudo)
+    buffer.name = nome
+    return buffer
+
+
+# Códigos usados na página Análise DRE (e alguns filhos para consultas hierárquicas)
+CODIGOS_DRE = ['03.1.1', '03.1.2', '04.1', '04.2', '04.2.1', '04.2.2', '04.2.9', '05.1.1.01.001']
+
+
+def _valor_br(centavos, sufixo=''):
+    inteiro = f"{centavos // 100:,}".replace(',', '.')
+    return f"{inteiro},{centavos % 100:02d}{sufixo}"
+
+
+def gerar_dre(n_linhas=200, seed=0, linhas_titulo=5):
+    """Gera um balancete/DRE com colunas Classificação e Movimento (valores "1.234,56D")."""
+    rnd = random.Random(seed)
+    colunas = ['Conta', 'Classificação', 'Descrição', 'Saldo Anterior', 'Débito', 'Crédito', 'Movimento', 'Saldo Atual']
+    linhas = [['EMPRESA TESTE LTDA'] + [None] * 7]
+    linhas += [[None] * 8 for _ in range(linhas_titulo - 1)]
+    linhas.append([f" {c} " for c in colunas])
+
+    codigos = list(CODIGOS_DRE)
+    while len(codigos) < n_linhas:
+        codigos.append('.'.join(f"{rnd.randint(1, 9):02d}" for _ in range(rnd.randint(2, 5))))
+    for i, codigo in enumerate(codigos[:n_linhas]):
+        movimento = _valor_br(rnd.randint(0, 100_000_000), rnd.choice(['C', 'D', '']))
+        linhas.append([i + 1, codigo, f"Conta {codigo}", _valor_br(rnd.randint(0, 10**9)), None, None, movimento, _valor_br(rnd.randint(0, 10**9))])
+    return pd.DataFrame(linhas)
+
+
+def gerar_planilha_pix(n_lancamentos=500, seed=0, linhas_por_bloco=20):
+    """Gera a planilha Pix: rótulos em C/H e valores em D/I, com subtotais "Total" por bloco.
+
+    Retorna (df, valores) com os valores (em reais) dos lançamentos, na ordem
+    das colunas D e depois I.
+    """
+    rnd = random.Random(seed)
+    metade = (n_lancamentos + 1) // 2
+    colunas = {'D': [], 'I': []}
+    for coluna, n in (('D', metade), ('I', n_lancamentos - metade)):
+        for k in range(n):
+            centavos = rnd.randint(500, 50_000)
+            colunas[coluna].append((f"Cliente {rnd.randint(1, 9999):04d}", centavos / 100))
+            if (k + 1) % linhas_por_bloco == 0:
+                soma = sum(v for _, v in colunas[coluna][-linhas_por_bloco:] if isinstance(v, float))
+                colunas[coluna].append(("Total do dia", round(soma, 2)))
+
+    n_linhas = max(len(colunas['D']), len(colunas['I'])) + 2
+    linhas = [[None] * 10 for _ in range(n_linhas)]
+    linhas[0][2], linhas[0][7] = 'PIX RECEBIDOS', 'PIX RECEBIDOS'
+    for coluna, (c_rotulo, c_valor) in (('D', (2, 3)), ('I', (7, 8))):
+        for i, (rotulo, valor) in enumerate(colunas[coluna]):
+            linhas[i + 2][c_rotulo] = rotulo
+            linhas[i + 2][c_valor] = valor
+
+    valores = [v for coluna in 'DI' for rotulo, v in colunas[coluna] if rotulo != "Total do dia"]
+    return pd.DataFrame(linhas), valores
+
+
+def gerar_extrato_bb(valores_pix, seed=0, prop_faltantes=0.05, n_extras=None, n_outros=None):
+    """Gera o CSV do extrato BB (separado por ';', latin1) com os Pix QR Code e outros lançamentos.
+
+    Parte de ``valores_pix`` fica de fora (faltantes), entram ``n_extras`` Pix
+    que não estão na planilha e ``n_outros`` lançamentos de outros históricos.
+    """
+    rnd = random.Random(seed)
+    n_extras = len(valores_pix) // 20 if n_extras is None else n_extras
+    n_outros = len(valores_pix) if n_outros is None else n_outros
+
+    lancamentos = [('Pix-Recebido QR Code', round(v * 100)) for v in valores_pix if rnd.random() >= prop_faltantes]
+    lancamentos += [('Pix-Recebido QR Code', rnd.randint(500, 50_000)) for _ in range(n_extras)]
+    lancamentos += [(rnd.choice(['Pix-Enviado', 'Tarifa Pacote Serviços', 'Pagamento de Título', 'Transferência recebida']),
+                     rnd.randint(100, 500_000)) for _ in range(n_outros)]
+    rnd.shuffle(lancamentos)
+
+    cabecalho = ['Data', 'Dependencia Origem', 'Lote', 'Documento', 'Cod. Histórico', 'Detalhamento',
+                 'Conta', 'Agência', 'Tipo', 'Histórico', 'Valor', 'C/D']
+    linhas = [';'.join(f'"{c}"' for c in cabecalho)]
+    for i, (historico, centavos) in enumerate(lancamentos):
+        campos = [f"{i % 28 + 1:02d}/01/2024", '0000', str(14000 + i % 50), str(100000 + i), '821',
+                  'Operação Pix', '12345-6', '1234', 'C', historico, _valor_br(centavos), 'C']
+        linhas.append(';'.join(f'"{c}"' for c in campos))
+    return ('\r\n'.join(linhas) + '\r\n').encode('latin1')
+
+
+# ==============================================================================
+# HISTÓRICO DO PAINEL DE ATRASOS
+# ==============================================================================
+
+def _atrasos_do_mes(rng, ano, mes, n):
+    dias = rng.choice(np.arange(1, 29), size=n, replace=False)
+    manha = rng.random(n) < 0.7
+    almoco = ~manha | (rng.random(n) < 0.2)
+    detalhes = [
+        ", ".join(m for m, ativo in (("Manhã (08:12)", a), ("Volta Almoço (Lim 13:05 vs Real 13:20)", b)) if ativo)
+        for a, b in zip(manha, almoco)
+    ]
+    return pd.DataFrame({
+        'Data': [f"{d:02d}/{mes:02d}/{ano}" for d in dias],
+        'Dia': rng.choice(DIAS_SEMANA[:6], size=n),
+        'Qtd': manha.astype('int64') + almoco.astype('int64'),
+        'Detalhes': detalhes,
+    })
+
+
+def popular_historico_ponto(historico, n_funcionarios, n_meses, seed=0):
+    """Grava no ``HistoricoPonto`` um arquivo por funcionário e mês, a partir de jan/2022."""
+    rng = np.random.default_rng(seed)
+    # Poucos funcionários concentram a maior parte dos atrasos
+    propensao = rng.gamma(0.6, 6, size=n_funcionarios)
+    for m in range(n_meses):
+        ano, mes = 2022 + m // 12, m % 12 + 1
+        for f in range(n_funcionarios):
+            df = _atrasos_do_mes(rng, ano, mes, min(int(rng.poisson(propensao[f])), 20))
+            historico.registrar(f"{f}-{ano}-{mes}", f"ponto_{f}_{ano}{mes:02d}.xlsx", f"FUNCIONÁRIO {f:04d}", f"{ano}-{mes:02d}", df)
@@ -0,0 +1,219 @@
+import pandas as pd
+import re
+from datetime import datetime, timedelta
+
+from ponto import formatar_visual
+
+# ==============================================================================
+# IMPLEMENTAÇÃO ORIGINAL (LINHA A LINHA) - USADA COMO REFERÊNCIA
+# ==============================================================================
+# Cópia fiel do passo 5 de processar_ponto antes do motor vetorizado.
+# Serve para conferir que detectar_atrasos produz exatamente o mesmo resultado
+# e para medir o ganho de desempenho.
+
+def limpar_celula_tempo_legado(valor_celula):
+    """Leitura original de uma célula de horário (re.sub + strptime a cada chamada)."""
+    if pd.isna(valor_celula): return None
+    s = str(valor_celula).strip()
+    # Remove caracteres inválidos, mantém dígitos e :
+    s = re.sub(r'[^\d:]', '', s)
+    if not s: return None
+    try:
+        t = datetime.strptime(s, "%H:%M")
+        return timedelta(hours=t.hour, minutes=t.minute)
+    except ValueError:
+        try:
+            t = datetime.strptime(s, "%H:%M:%S")
+            return timedelta(hours=t.hour, minutes=t.minute, seconds=t.second)
+        except ValueError:
+            return None
+
+
+def processar_batidas_legado(linhas_dados, markers, agendamento, tolerancia=timedelta(minutes=5)):
+    dias_com_atraso = []
+    total_ocorrencias_geral = 0
+
+    for idx, row in linhas_dados.iterrows():
+        data_str = str(row[0])
+        if pd.isna(data_str) or '-' not in data_str: continue
+
+        partes = data_str.split('-')
+        if len(partes) < 2: continue
+        data_val = partes[0].strip()
+        dow_val = partes[1].strip()
+
+        if 'Sáb' in dow_val or 'Sab' in dow_val: chave_dow = 'Sáb'
+        elif 'Dom' in dow_val: chave_dow = 'Dom'
+        else: chave_dow = dow_val
+
+        if chave_dow not in agendamento or agendamento[chave_dow] is None: continue
+        padrao = agendamento[chave_dow]
+
+        real_ent1 = limpar_celula_tempo_legado(row[markers['col_ent1_real']])
+        real_sai1 = limpar_celula_tempo_legado(row[markers['col_sai1_real']])
+        real_ent2 = limpar_celula_tempo_legado(row[markers['col_ent2_real']])
+
+        motivos = []
+
+        if padrao['std_ent1'] and real_ent1:
+            limite = padrao['std_ent1'] + tolerancia
+            if real_ent1 > limite:
+                motivos.append(f"Manhã ({formatar_visual(real_ent1)})")
+
+        if padrao['std_ent2'] and padrao['std_sai1'] and real_sai1 and real_ent2:
+            duracao = padrao['std_ent2'] - padrao['std_sai1']
+            limite = real_sai1 + duracao + tolerancia
+            if real_ent2 > limite:
+                motivos.append(f"Volta Almoço (Lim {formatar_visual(limite)} vs Real {formatar_visual(real_ent2)})")
+
+        if motivos:
+            qtd = len(motivos)
+            total_ocorrencias_geral += qtd
+            dias_com_atraso.append({'Data': data_val, 'Dia': chave_dow, 'Qtd': qtd, 'Detalhes': ", ".join(motivos)})
+
+    return pd.DataFrame(dias_com_atraso), total_ocorrencias_geral
+
+
+def conciliar_pix_legado(pix_entries, bb_values):
+    """Comparação original da página Conferência Pix (busca e remoção em lista)."""
+    bb_pool = list(bb_values)
+    missing_entries = []
+    matched_entries = []
+
+    for entry in pix_entries:
+        val = entry['valor']
+        if val in bb_pool:
+            bb_pool.remove(val)
+            matched_entries.append(entry)
+        else:
+            missing_entries.append(entry)
+
+    return matched_entries, missing_entries, bb_pool
+
+
+def extrair_lancamentos_pix_legado(df_pix):
+    """Extração original da planilha Pix (iterrows e float() por linha, só C/D e H/I)."""
+    pix_entries = []
+
+    if len(df_pix.columns) > 3:
+        col_d = df_pix[[2, 3]].dropna()
+        for index, row in col_d.iterrows():
+            label = str(row[2]) if pd.notna(row[2]) else ""
+            if "Total" not in label:
+                try:
+                    val = float(row[3])
+                    pix_entries.append({'valor': val, 'linha': index + 1, 'coluna': 'D'})
+                except:
+                    pass
+
+    if len(df_pix.columns) > 8:
+        col_i = df_pix[[7, 8]].dropna()
+        for index, row in col_i.iterrows():
+            label = str(row[7]) if pd.notna(row[7]) else ""
+            if "Total" not in label:
+                try:
+                    val = float(row[8])
+                    pix_entries.append({'valor': val, 'linha': index + 1, 'coluna': 'I'})
+                except:
+                    pass
+
+    return pix_entries
+
+
+def localizar_ancoras_legado(df):
+    """Varredura original (iterrows) das âncoras; retorna ``markers`` ou None."""
+    markers = {}
+
+    # A) Procurar "SEG" (Cabeçalho do Horário Padrão) nas primeiras 30 linhas
+    found_seg = False
+    for r_idx, row in df.head(30).iterrows():
+        for c_idx, val in row.items():
+            if str(val).strip().upper() == "SEG":
+                markers['seg_row'] = r_idx
+                markers['seg_col'] = c_idx
+                found_seg = True
+                break
+        if found_seg: break
+
+    if not found_seg:
+        return None
+
+    # B) Procurar "ENTRADA 1" (Cabeçalho dos Dados)
+    found_header = False
+    for r_idx, row in df.head(40).iterrows():
+        if r_idx < 15: continue
+        for c_idx, val in row.items():
+            txt = str(val).strip().upper()
+            if "ENTRADA 1" in txt:
+                markers['header_row'] = r_idx
+                markers['col_ent1_real'] = c_idx
+
+                # Procura Saída 1 e Entrada 2 na mesma linha
+                for c2_idx in range(c_idx + 1, len(row)):
+                    txt2 = str(row[c2_idx]).strip().upper()
+                    if "SAÍDA 1" in txt2 or "SAIDA 1" in txt2:
+                        markers['col_sai1_real'] = c2_idx
+                    if "ENTRADA 2" in txt2:
+                        markers['col_ent2_real'] = c2_idx
+                found_header = True
+                break
+        if found_header: break
+
+    if 'col_ent1_real' not in markers or 'col_sai1_real' not in markers or 'col_ent2_real' not in markers:
+        return None
+
+    return markers
+
+
+def limpar_valor_financeiro(valor):
+    if pd.isna(valor) or str(valor).strip() == '': return 0.0
+    s = str(valor).strip().upper().replace('C', '').replace('D', '')
+    s = s.replace('.', '').replace(',', '.')
+    try: return float(s)
+    except ValueError: return 0.0
+
+
+def buscar_por_classificacao(df, codigo):
+    """Busca original da página DRE (varredura completa por código)."""
+    linha = df[df['Classificação'] == codigo]
+    if not linha.empty:
+        valor_bruto = linha['Movimento'].values[0]
+        return limpar_valor_financeiro(valor_bruto)
+    return 0.0
+
+
+_RE_HORARIO = r'^(2[0-3]|[0-1]\d|\d):([0-5]\d|\d)(?::([0-5]\d|\d))?$'
+
+def converter_tempo_segundos_regex(serie):
+    """Versão em lote anterior ao memo (str.extract em todas as linhas)."""
+    validos = serie[serie.notna()]
+    limpos = validos.astype(str).str.replace(r'[^\d:]', '', regex=True)
+    partes = limpos.str.extract(_RE_HORARIO).astype(float)
+    segundos = partes[0] * 3600 + partes[1] * 60 + partes[2].fillna(0)
+    return segundos.reindex(serie.index)
+
+
+def calcular_vale_legado(cargo, qtd_atrasos):
+    """Cálculo original da página Vale Alimentação: (valor_final, diferenca, mensagem, cor_alerta)."""
+    tabela_cargos = {"Junior": 252.07, "Premium": 348.45, "Senior": 444.84, "Master": 548.64}
+    valor_base_mensal = tabela_cargos[cargo]
+    valor_diario = valor_base_mensal / 30
+    if qtd_atrasos < 3:
+        valor_final = valor_base_mensal
+        mensagem_penalidade = "✅ Nenhuma penalidade aplicada (Menos de 3 atrasos)."
+        cor_alerta = "success"
+    elif qtd_atrasos == 3:
+        desconto = 2 * valor_diario
+        valor_final = valor_base_mensal - desconto
+        mensagem_penalidade = f"⚠️ Penalidade: Desconto de 2 dias (R$ {desconto:.2f})."
+        cor_alerta = "warning"
+    elif 4 <= qtd_atrasos <= 7:
+        desconto = 7 * valor_diario
+        valor_final = valor_base_mensal - desconto
+        mensagem_penalidade = f"⛔ Penalidade: Desconto de 7 dias (R$ {desconto:.2f})."
+        cor_alerta = "error"
+    else:
+        valor_final = 148.27
+        mensagem_penalidade = "🚨 Penalidade Máxima: Redução para valor fixo de cesta básica."
+        cor_alerta = "error"
+    return valor_final, valor_final - valor_base_mensal, mensagem_penalidade, cor_alerta
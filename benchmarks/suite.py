@@ -0,0 +1,183 @@
+"""Mede, sem Streamlit, cada etapa dos quatro fluxos (ponto, Pix, extrato BB e DRE)
+com dados sintéticos e grava o resultado em JSON para comparar versões.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.suite [--tamanho medio] [--saida resultado.json]
+    python -m benchmarks.suite --comparar base.json [--limite 1.25]
+
+Com --comparar, cada etapa é comparada pela mediana com o JSON anterior e o
+comando sai com código 1 se alguma ficar mais lenta que ``limite`` vezes.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+import leitura
+from benchmarks.geradores import (
+    arquivo_nomeado, gerar_dre, gerar_extrato_bb, gerar_planilha_pix, gerar_ponto, para_bytes,
+)
+from dre import INDICADORES_DRE, IndiceDRE, calcular_indicadores
+from leitura import ler_colunas_por_cabecalho, ler_planilha_podada
+from pix import conciliar_pix, extrair_lancamentos_pix, ler_extrato_bb, ler_planilha_pix
+from ponto import colunas_do_ponto, detectar_atrasos, extrair_estrutura
+
+TAMANHOS = {
+    'pequeno': {'dias': 31, 'lancamentos': 500, 'linhas_dre': 300},
+    'medio': {'dias': 365, 'lancamentos': 5_000, 'linhas_dre': 2_000},
+    'grande': {'dias': 3_000, 'lancamentos': 50_000, 'linhas_dre': 20_000},
+}
+
+
+def _versao():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+        sujo = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], capture_output=True, text=True).stdout.strip())
+        return f"{commit}{'-modificado' if sujo else ''}"
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _cronometrar(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return {
+        'mediana_ms': round(statistics.median(tempos), 3),
+        'min_ms': round(min(tempos), 3),
+        'repeticoes': repeticoes,
+    }
+
+
+def _etapas(params, seed):
+    """(nome, função) de cada etapa, com as entradas já geradas e serializadas."""
+    # Ponto
+    bytes_ponto = para_bytes(gerar_ponto(params['dias'], seed=seed))
+    df_ponto = ler_planilha_podada(arquivo_nomeado(bytes_ponto, 'ponto.xlsx'), colunas_do_ponto)
+    _, markers, agendamento, linhas_dados = extrair_estrutura(df_ponto)
+
+    # Pix
+    df_planilha, valores = gerar_planilha_pix(params['lancamentos'], seed=seed)
+    bytes_pix = para_bytes(df_planilha)
+    bytes_bb = gerar_extrato_bb(valores, seed=seed)
+    df_pix = ler_planilha_pix(arquivo_nomeado(bytes_pix, 'pix.xlsx'))
+    df_lancamentos = extrair_lancamentos_pix(df_pix)
+    df_bb = ler_extrato_bb(arquivo_nomeado(bytes_bb, 'extrato.csv'))
+
+    # DRE
+    bytes_dre = para_bytes(gerar_dre(params['linhas_dre'], seed=seed))
+    df_dre = ler_colunas_por_cabecalho(arquivo_nomeado(bytes_dre, 'dre.xlsx'), 'Classificação', ('Classificação', 'Movimento'))
+
+    tolerancia = timedelta(minutes=5)
+    return [
+        ('ponto.leitura', lambda: ler_planilha_podada(arquivo_nomeado(bytes_ponto, 'ponto.xlsx'), colunas_do_ponto)),
+        ('ponto.estrutura', lambda: extrair_estrutura(df_ponto)),
+        ('ponto.atrasos', lambda: detectar_atrasos(linhas_dados, markers, agendamento, tolerancia)),
+        ('pix.leitura_planilha', lambda: ler_planilha_pix(arquivo_nomeado(bytes_pix, 'pix.xlsx'))),
+        ('pix.extracao', lambda: extrair_lancamentos_pix(df_pix)),
+        ('pix.leitura_extrato', lambda: ler_extrato_bb(arquivo_nomeado(bytes_bb, 'extrato.csv'))),
+        ('pix.conciliacao', lambda: conciliar_pix(df_lancamentos, df_bb)),
+        ('pix.conciliacao_tolerancia', lambda: conciliar_pix(df_lancamentos, df_bb, tolerancia=0.05)),
+        ('dre.leitura', lambda: ler_colunas_por_cabecalho(arquivo_nomeado(bytes_dre, 'dre.xlsx'), 'Classificação', ('Classificação', 'Movimento'))),
+        ('dre.extracao', lambda: calcular_indicadores(IndiceDRE.de_dataframe(df_dre).buscar(INDICADORES_DRE))),
+    ]
+
+
+def executar(params, repeticoes=5, seed=0, filtro=None):
+    etapas = {}
+    for nome, funcao in _etapas(params, seed):
+        if filtro and not any(f in nome for f in filtro):
+            continue
+        funcao()  # aquecimento (imports preguiçosos, caches de layout)
+        etapas[nome] = _cronometrar(funcao, repeticoes)
+        print(f"{nome:<28} {etapas[nome]['mediana_ms']:>10.1f} ms", flush=True)
+
+    return {
+        'versao': _versao(),
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'ambiente': {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'motor_xlsx': leitura.MOTOR_XLSX,
+            'plataforma': platform.platform(),
+        },
+        'parametros': {**params, 'repeticoes': repeticoes, 'seed': seed},
+        'etapas': etapas,
+    }
+
+
+def _tamanho(params):
+    return {k: params.get(k) for k in ('dias', 'lancamentos', 'linhas_dre', 'seed')}
+
+
+def comparar(atual, anterior, limite, minimo_ms=1.0):
+    """Imprime a razão atual/anterior por etapa e retorna as etapas que passaram do limite.
+
+    Diferenças menores que ``minimo_ms`` não contam como regressão (ruído de etapas rápidas).
+    """
+    regressoes = []
+    if _tamanho(anterior.get('parametros', {})) != _tamanho(atual['parametros']):
+        print("Atenção: parâmetros diferentes dos da medição anterior.", file=sys.stderr)
+    print(f"\nComparação com {anterior.get('versao') or '?'} ({anterior.get('data', '?')}):")
+    for nome, medida in atual['etapas'].items():
+        base = anterior.get('etapas', {}).get(nome)
+        if not base or not base['mediana_ms']:
+            print(f"{nome:<28} (sem medição anterior)")
+            continue
+        razao = medida['mediana_ms'] / base['mediana_ms']
+        regrediu = razao > limite and medida['mediana_ms'] - base['mediana_ms'] > minimo_ms
+        marca = '  <-- REGRESSÃO' if regrediu else ''
+        print(f"{nome:<28} {base['mediana_ms']:>10.1f} -> {medida['mediana_ms']:>10.1f} ms  ({razao:.2f}x){marca}")
+        if regrediu:
+            regressoes.append(nome)
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark das etapas de ponto, Pix e DRE com dados sintéticos.")
+    parser.add_argument('--tamanho', choices=TAMANHOS, default='medio')
+    parser.add_argument('--dias', type=int, help="Dias no arquivo de ponto (sobrepõe o tamanho)")
+    parser.add_argument('--lancamentos', type=int, help="Lançamentos na planilha Pix (sobrepõe o tamanho)")
+    parser.add_argument('--linhas-dre', type=int, help="Linhas do DRE (sobrepõe o tamanho)")
+    parser.add_argument('-r', '--repeticoes', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-e', '--etapas', nargs='+', help="Mede só as etapas cujo nome contém estes textos (ex.: pix dre.leitura)")
+    parser.add_argument('-o', '--saida', help="Caminho do JSON com o resultado")
+    parser.add_argument('--comparar', help="JSON de uma medição anterior")
+    parser.add_argument('--limite', type=float, default=1.25, help="Razão de tempo acima da qual a etapa é regressão (padrão: 1.25)")
+    parser.add_argument('--minimo-ms', type=float, default=1.0, help="Diferença mínima (ms) para contar como regressão (padrão: 1)")
+    args = parser.parse_args(argv)
+
+    params = dict(TAMANHOS[args.tamanho])
+    for chave in ('dias', 'lancamentos', 'linhas_dre'):
+        if getattr(args, chave) is not None:
+            params[chave] = getattr(args, chave)
+
+    resultado = executar(params, args.repeticoes, args.seed, args.etapas)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"Resultado gravado em {args.saida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            anterior = json.load(f)
+        regressoes = comparar(resultado, anterior, args.limite, args.minimo_ms)
+        if regressoes:
+            print(f"{len(regressoes)} etapa(s) mais lenta(s) que {args.limite}x: {', '.join(regressoes)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,127 @@
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+from desempenho import etapa
+
+# ==============================================================================
+# CACHE DE LEITURA DE ARQUIVOS (POR HASH DO CONTEÚDO)
+# ==============================================================================
+# O Streamlit reexecuta o script inteiro a cada clique; sem cache, cada rerun
+# volta a chamar read_excel/read_csv sobre o mesmo upload. Aqui o resultado do
+# parser fica guardado pela combinação hash dos bytes + parser + opções.
+
+class CacheLRU:
+    """Cache em memória com limite de itens, descarte LRU e contadores de acerto/falha."""
+
+    def __init__(self, max_itens=32):
+        self.max_itens = max_itens
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, chave):
+        with self._lock:
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return True, self._itens[chave]
+            self.falhas += 1
+            return False, None
+
+    def guardar(self, chave, valor):
+        with self._lock:
+            self._itens[chave] = valor
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+
+    def limpar(self):
+        with self._lock:
+            self._itens.clear()
+            self.acertos = 0
+            self.falhas = 0
+
+    def estatisticas(self):
+        total = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'itens': len(self._itens),
+            'max_itens': self.max_itens,
+            'taxa_acerto': self.acertos / total if total else 0.0,
+        }
+
+
+_cache_leitura = CacheLRU(max_itens=32)
+
+
+def bytes_do_arquivo(arquivo):
+    """Bytes de um upload (UploadedFile/BytesIO) ou arquivo aberto, sem alterar a posição."""
+    if hasattr(arquivo, 'getvalue'):
+        return arquivo.getvalue()
+    posicao = arquivo.tell()
+    arquivo.seek(0)
+    conteudo = arquivo.read()
+    arquivo.seek(posicao)
+    return conteudo
+
+
+def copia_nomeada(arquivo):
+    """BytesIO independente, com o conteúdo e o ``name`` do arquivo (pode ir para outra thread)."""
+    copia = io.BytesIO(bytes_do_arquivo(arquivo))
+    copia.name = getattr(arquivo, 'name', '')
+    return copia
+
+
+def hash_conteudo(conteudo):
+    return hashlib.blake2b(conteudo, digest_size=16).hexdigest()
+
+
+def _copiar(valor):
+    # Quem chama pode alterar o DataFrame (ex.: renomear colunas); o cache guarda o original.
+    # O leitor já carregou o pandas; importar aqui mantém este módulo leve para o menu do app.
+    import pandas as pd
+
+    if isinstance(valor, (pd.DataFrame, pd.Series)):
+        return valor.copy()
+    if isinstance(valor, tuple):
+        return tuple(_copiar(v) for v in valor)
+    return valor
+
+
+def ler_cacheado(arquivo, leitor, **opcoes):
+    """Executa ``leitor(buffer, **opcoes)`` com cache pelo conteúdo do arquivo.
+
+    ``leitor`` recebe um BytesIO novo (com o mesmo ``name`` do original), então
+    pode ser ``pd.read_excel``, ``pd.read_csv`` ou uma função própria com
+    tentativas de encoding. Exceções não são guardadas no cache.
+    """
+    conteudo = bytes_do_arquivo(arquivo)
+    nome = getattr(arquivo, 'name', '')
+    chave = (
+        hash_conteudo(conteudo),
+        getattr(leitor, '__module__', ''),
+        getattr(leitor, '__qualname__', repr(leitor)),
+        tuple(sorted((k, repr(v)) for k, v in opcoes.items())),
+    )
+
+    encontrado, valor = _cache_leitura.obter(chave)
+    with etapa(f"leitura:{chave[2]}", cache='acerto' if encontrado else 'falha', bytes=len(conteudo)):
+        if not encontrado:
+            buffer = io.BytesIO(conteudo)
+            buffer.name = nome
+            valor = leitor(buffer, **opcoes)
+            _cache_leitura.guardar(chave, valor)
+        return _copiar(valor)
+
+
+def estatisticas_cache():
+    """Contadores do cache de leitura (acertos, falhas, itens, taxa_acerto)."""
+    return _cache_leitura.estatisticas()
+
+
+def limpar_cache():
+    _cache_leitura.limpar()
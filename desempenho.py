@@ -0,0 +1,166 @@
+import cProfile
+import functools
+import io
+import json
+import logging
+import os
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+# ==============================================================================
+# INSTRUMENTAÇÃO DAS ETAPAS (TEMPOS, CONTADORES, PERFIL E LOG ESTRUTURADO)
+# ==============================================================================
+# Cada execução do script (um rerun do Streamlit, uma chamada da linha de
+# comando) abre uma Execucao; as etapas marcadas com ``etapa``/``cronometrado``
+# registram nela o tempo e contadores (linhas, acertos de cache...). Fora de
+# uma execução e sem log ligado, as marcações não medem nada.
+#
+# Log estruturado: com LOG_DESEMPENHO=- (stderr) ou LOG_DESEMPENHO=caminho,
+# cada etapa e cada execução viram uma linha JSON no logger 'desempenho'.
+
+logger = logging.getLogger('desempenho')
+
+_execucao = ContextVar('execucao_desempenho', default=None)
+
+
+class Execucao:
+    """Etapas medidas em uma execução, na ordem em que começaram."""
+
+    def __init__(self, rotulo=None, perfil=False):
+        self.rotulo = rotulo
+        self.inicio = time.perf_counter()
+        self.total_ms = None
+        self.etapas = []
+        # Execuções de outras threads (tarefas em segundo plano) usadas por esta
+        self.anexadas = []
+        self._pilha = []
+        self.perfil = cProfile.Profile() if perfil else None
+
+    def tabela(self):
+        """DataFrame com Etapa (recuada pelo aninhamento), tempo em ms e contadores."""
+        import pandas as pd
+
+        linhas = [
+            {'Etapa': ('\u2003' * (e['nivel'] - 1) + '↳ ' if e['nivel'] else '') + e['etapa'], 'Tempo (ms)': round(e['ms'], 1), **e['contadores']}
+            for e in self.etapas
+        ]
+        return pd.DataFrame(linhas).convert_dtypes() if linhas else pd.DataFrame(columns=['Etapa', 'Tempo (ms)'])
+
+    def perfil_texto(self, limite=30, ordem='cumulative'):
+        """Funções mais custosas do cProfile (texto do pstats), ou None sem perfil."""
+        if self.perfil is None:
+            return None
+        saida = io.StringIO()
+        pstats.Stats(self.perfil, stream=saida).strip_dirs().sort_stats(ordem).print_stats(limite)
+        return saida.getvalue()
+
+
+def _registrar_log(registro):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps(registro, ensure_ascii=False, default=str))
+
+
+def iniciar_execucao(rotulo=None, perfil=False):
+    """Abre uma nova execução no contexto atual (substitui a anterior) e a retorna."""
+    execucao = Execucao(rotulo, perfil)
+    _execucao.set(execucao)
+    if execucao.perfil is not None:
+        execucao.perfil.enable()
+    return execucao
+
+
+def finalizar_execucao():
+    """Fecha a execução atual (para o perfil, emite o log) e a retorna, ou None se não houver."""
+    execucao = _execucao.get()
+    if execucao is None:
+        return None
+    if execucao.perfil is not None:
+        execucao.perfil.disable()
+    execucao.total_ms = (time.perf_counter() - execucao.inicio) * 1000
+    _execucao.set(None)
+    _registrar_log({
+        'evento': 'execucao', 'rotulo': execucao.rotulo, 'ms': round(execucao.total_ms, 3),
+        'etapas': len(execucao.etapas), 'data': datetime.now().isoformat(timespec='seconds'),
+    })
+    return execucao
+
+
+def execucao_atual():
+    return _execucao.get()
+
+
+def anexar_execucao(outra):
+    """Liga à execução atual uma execução feita em outra thread, para o painel mostrar as duas."""
+    execucao = _execucao.get()
+    if execucao is not None and outra is not None and outra not in execucao.anexadas:
+        execucao.anexadas.append(outra)
+
+
+@contextmanager
+def etapa(nome, **contadores):
+    """Mede o bloco como a etapa ``nome``.
+
+    Entrega o dict de contadores, que o bloco pode completar (ex.:
+    ``medida['linhas'] = len(df)``). Etapas dentro de etapas ficam aninhadas.
+    """
+    execucao = _execucao.get()
+    if execucao is None and not logger.isEnabledFor(logging.INFO):
+        yield contadores
+        return
+
+    registro = {'etapa': nome, 'nivel': 0, 'ms': None, 'contadores': contadores}
+    if execucao is not None:
+        # Entra na lista já na abertura, para a etapa-mãe vir antes das aninhadas
+        registro['nivel'] = len(execucao._pilha)
+        execucao._pilha.append(nome)
+        execucao.etapas.append(registro)
+    inicio = time.perf_counter()
+    try:
+        yield contadores
+    finally:
+        ms = registro['ms'] = (time.perf_counter() - inicio) * 1000
+        if execucao is not None:
+            execucao._pilha.pop()
+        _registrar_log({
+            'evento': 'etapa', 'etapa': nome, 'ms': round(ms, 3),
+            'execucao': execucao.rotulo if execucao is not None else None, **contadores,
+        })
+
+
+def cronometrado(nome=None, contagem=None):
+    """Decorador: cada chamada da função é uma ``etapa`` (nome padrão: modulo.funcao).
+
+    ``contagem``, se dada, recebe o resultado e devolve um dict de contadores
+    para a etapa (ex.: ``lambda df: {'linhas': len(df)}``).
+    """
+    def decorar(funcao):
+        rotulo = nome or f"{funcao.__module__}.{funcao.__qualname__}"
+
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            with etapa(rotulo) as medida:
+                resultado = funcao(*args, **kwargs)
+                if contagem is not None:
+                    medida.update(contagem(resultado))
+                return resultado
+        return envolvida
+    return decorar
+
+
+def configurar_log(destino=None):
+    """Liga o log JSON do logger 'desempenho' ('-' = stderr, senão caminho de arquivo).
+
+    Sem ``destino``, usa a variável LOG_DESEMPENHO; se ela também não existir, não faz nada.
+    """
+    destino = destino or os.environ.get('LOG_DESEMPENHO')
+    if not destino or logger.handlers:
+        return
+    handler = logging.StreamHandler(sys.stderr) if destino == '-' else logging.FileHandler(destino, encoding='utf-8')
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
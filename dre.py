@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+
+from cache import ler_cacheado
+from desempenho import etapa
+from leitura import ler_colunas_por_cabecalho
+from tarefas import informar_progresso
+
+# ==============================================================================
+# ÍNDICE DE CLASSIFICAÇÕES (DRE)
+# ==============================================================================
+# A coluna 'Movimento' é limpa uma única vez, de forma vetorizada, e os códigos
+# ficam ordenados com somas acumuladas. Assim cada indicador custa uma busca
+# binária, inclusive as somas hierárquicas ("todos os filhos de 04.2").
+
+# Sufixo que pede a soma dos descendentes de um código (ex.: '04.2.*')
+SUFIXO_FILHOS = '.*'
+
+# Contas usadas pelos indicadores da página Análise DRE
+INDICADORES_DRE = {
+    'receita_bruta': '03.1.1',
+    'deducoes': '03.1.2',
+    'custos_servicos': '04.1',
+    'lucro_liquido': '05.1.1.01.001',
+    'ebitda': '04.2.9',
+    'despesas_operacionais': '04.2',
+}
+
+
+def limpar_movimento(serie):
+    """Converte a coluna 'Movimento' ("1.234,56C", "789,00D") em float; vazios e inválidos viram 0.0."""
+    texto = serie.astype(str).str.strip().str.upper()
+    texto = texto.str.replace('C', '', regex=False).str.replace('D', '', regex=False)
+    texto = texto.str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+    return pd.to_numeric(texto, errors='coerce').fillna(0.0).astype(float)
+
+
+def valores_por_codigo(df):
+    """Série código -> valor de um DRE com as colunas 'Classificação' e 'Movimento'.
+
+    Códigos repetidos ficam com a primeira ocorrência, como na busca original.
+    """
+    codigos = df['Classificação']
+    # Só células de texto casam com os códigos (números e vazios ficam de fora)
+    eh_texto = np.array([isinstance(c, str) for c in codigos.tolist()], dtype=bool)
+    valores = limpar_movimento(df['Movimento'])[eh_texto]
+    valores.index = codigos[eh_texto]
+    return valores[~valores.index.duplicated(keep='first')]
+
+
+class IndiceDRE:
+    """Códigos de classificação ordenados, com somas acumuladas para consultas por prefixo."""
+
+    def __init__(self, valores):
+        codigos = valores.index.to_numpy(dtype=str)
+        ordem = np.argsort(codigos, kind='stable')
+        self.codigos = codigos[ordem]
+        self.valores = valores.to_numpy(dtype=float)[ordem]
+
+        # Nos códigos ordenados, os descendentes vêm logo depois do pai:
+        # é folha quem não é prefixo (seguido de '.') do código seguinte
+        folha = np.ones(len(self.codigos), dtype=bool)
+        if len(self.codigos) > 1:
+            folha[:-1] = ~np.char.startswith(self.codigos[1:], np.char.add(self.codigos[:-1], '.'))
+        self.folha = folha
+        self._acumulado_folhas = np.concatenate([[0.0], np.cumsum(np.where(folha, self.valores, 0.0))])
+
+    @classmethod
+    def de_dataframe(cls, df):
+        return cls(valores_por_codigo(df))
+
+    @classmethod
+    def consolidar(cls, dfs):
+        """Índice de vários DREs (ex.: empresas do grupo) com os valores somados por código."""
+        series = [valores_por_codigo(df) for df in dfs]
+        if not series:
+            return cls(pd.Series(dtype=float))
+        return cls(pd.concat(series).groupby(level=0).sum())
+
+    def _valores_exatos(self, codigos):
+        if not len(self.codigos):
+            return np.zeros(len(codigos))
+        pos = np.minimum(np.searchsorted(self.codigos, codigos), len(self.codigos) - 1)
+        return np.where(self.codigos[pos] == codigos, self.valores[pos], 0.0)
+
+    def _somas_filhos(self, codigos):
+        # Descendentes de '04.2' ficam em ['04.2.', '04.2/'), pois '/' vem logo depois de '.'
+        inicio = np.searchsorted(self.codigos, np.char.add(codigos, '.'), side='left')
+        fim = np.searchsorted(self.codigos, np.char.add(codigos, '/'), side='left')
+        return self._acumulado_folhas[fim] - self._acumulado_folhas[inicio]
+
+    def valor(self, codigo):
+        """Valor do código exato (0.0 se não existir)."""
+        return float(self._valores_exatos(np.array([codigo], dtype=str))[0])
+
+    def soma_filhos(self, codigo):
+        """Soma das contas-folha abaixo de ``codigo`` (sem contar subtotais duas vezes)."""
+        return float(self._somas_filhos(np.array([codigo], dtype=str))[0])
+
+    def buscar(self, codigos):
+        """Valores de vários indicadores de uma vez.
+
+        ``codigos`` é uma lista ou um dict nome -> código; códigos terminados em
+        ``'.*'`` somam os descendentes. Retorna um dict com as mesmas chaves.
+        """
+        if not isinstance(codigos, dict):
+            codigos = {c: c for c in codigos}
+        nomes = list(codigos)
+        if not nomes:
+            return {}
+        alvos = np.array([codigos[n] for n in nomes], dtype=str)
+        filhos = np.char.endswith(alvos, SUFIXO_FILHOS)
+        raizes = np.array([a[:-len(SUFIXO_FILHOS)] if f else a for a, f in zip(alvos.tolist(), filhos)], dtype=str)
+        valores = np.where(filhos, self._somas_filhos(raizes), self._valores_exatos(raizes))
+        return dict(zip(nomes, valores.tolist()))
+
+
+# ==============================================================================
+# INDICADORES
+# ==============================================================================
+
+def calcular_indicadores(valores):
+    """ROL, margens e eficiência a partir dos valores de ``INDICADORES_DRE``."""
+    rol = valores['receita_bruta'] - valores['deducoes']
+    if rol:
+        margem_bruta = (rol - valores['custos_servicos']) / rol
+        margem_liquida = valores['lucro_liquido'] / rol
+        margem_ebitda = valores['ebitda'] / rol
+        eficiencia_operacional = valores['despesas_operacionais'] / rol
+    else:
+        margem_bruta = margem_liquida = margem_ebitda = eficiencia_operacional = 0.0
+    return {
+        **valores,
+        'rol': rol,
+        'margem_bruta': margem_bruta,
+        'margem_liquida': margem_liquida,
+        'margem_ebitda': margem_ebitda,
+        'eficiencia_operacional': eficiencia_operacional,
+    }
+
+
+def ler_dre(arquivo):
+    """Colunas Classificação e Movimento de um arquivo DRE (com cache por conteúdo)."""
+    return ler_cacheado(arquivo, ler_colunas_por_cabecalho, rotulo='Classificação', colunas=('Classificação', 'Movimento'))
+
+
+def indicadores_dos_arquivos(arquivos):
+    """Indicadores do DRE consolidado de um ou mais arquivos."""
+    dfs = []
+    for i, arquivo in enumerate(arquivos):
+        informar_progresso(i / len(arquivos), f"Lendo {getattr(arquivo, 'name', 'DRE')} ({i + 1} de {len(arquivos)})...")
+        dfs.append(ler_dre(arquivo))
+    with etapa('dre.indicadores', arquivos=len(dfs), linhas=sum(len(df) for df in dfs)):
+        indice = IndiceDRE.consolidar(dfs)
+        return calcular_indicadores(indice.buscar(INDICADORES_DRE))
@@ -0,0 +1,144 @@
+import os
+import re
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from banco_local import caminho_banco, conectar
+from cache import bytes_do_arquivo, hash_conteudo
+from dre import indicadores_dos_arquivos
+from tarefas import informar_progresso
+
+# ==============================================================================
+# HISTÓRICO MENSAL DO DRE (SQLITE LOCAL)
+# ==============================================================================
+# Cada arquivo é lido uma única vez: os indicadores extraídos ficam gravados por
+# período (AAAA-MM) junto com o hash do conteúdo. Reenviar o mesmo arquivo é só
+# uma consulta ao banco, e as tendências vêm direto da tabela.
+
+CAMINHO_HISTORICO = caminho_banco('historico_dre.sqlite', 'HISTORICO_DRE')
+
+COLUNAS_INDICADORES = [
+    'receita_bruta', 'deducoes', 'custos_servicos', 'lucro_liquido', 'ebitda', 'despesas_operacionais',
+    'rol', 'margem_bruta', 'margem_liquida', 'margem_ebitda', 'eficiencia_operacional',
+]
+
+_MESES = {
+    'jan': 1, 'fev': 2, 'mar': 3, 'abr': 4, 'mai': 5, 'jun': 6,
+    'jul': 7, 'ago': 8, 'set': 9, 'out': 10, 'nov': 11, 'dez': 12,
+}
+_NOMES_MESES = 'jan(?:eiro)?|fev(?:ereiro)?|mar(?:ço|co)?|abr(?:il)?|mai(?:o)?|jun(?:ho)?|jul(?:ho)?|ago(?:sto)?|set(?:embro)?|out(?:ubro)?|nov(?:embro)?|dez(?:embro)?'
+_SEP = r'[-_./ ]?'
+_RE_ANO_MES = re.compile(rf'(?<!\d)(20\d{{2}}){_SEP}(0[1-9]|1[0-2])(?!\d)')
+_RE_MES_ANO = re.compile(rf'(?<!\d)(0?[1-9]|1[0-2]){_SEP}(20\d{{2}})(?!\d)')
+_RE_NOME_MES = re.compile(rf'(?<![a-zç])({_NOMES_MESES}){_SEP}(20\d{{2}}|\d{{2}})(?!\d)', re.IGNORECASE)
+
+
+class ErroHistorico(Exception):
+    """Arquivo que não pode entrar no histórico (mensagem pronta para exibição)."""
+
+
+def periodo_do_nome(nome):
+    """Período 'AAAA-MM' a partir do nome do arquivo ('DRE 2024-01.xlsx', 'dre_01_2024.csv', 'DRE jan-24.xlsx')."""
+    base = os.path.splitext(os.path.basename(nome))[0]
+    if m := _RE_ANO_MES.search(base):
+        return f"{m.group(1)}-{m.group(2)}"
+    if m := _RE_MES_ANO.search(base):
+        return f"{m.group(2)}-{int(m.group(1)):02d}"
+    if m := _RE_NOME_MES.search(base):
+        ano = m.group(2) if len(m.group(2)) == 4 else f"20{m.group(2)}"
+        return f"{ano}-{_MESES[m.group(1).lower()[:3]]:02d}"
+    return None
+
+
+class HistoricoDRE:
+    """Indicadores do DRE por período, gravados em SQLite (uma linha por mês)."""
+
+    def __init__(self, caminho=CAMINHO_HISTORICO):
+        self.caminho = caminho
+        with self._conectar() as con:
+            colunas = ', '.join(f"{c} REAL NOT NULL" for c in COLUNAS_INDICADORES)
+            con.execute(
+                f"CREATE TABLE IF NOT EXISTS indicadores_dre ("
+                f"periodo TEXT PRIMARY KEY, hash TEXT NOT NULL, arquivo TEXT, gravado_em TEXT, {colunas})"
+            )
+            con.execute("CREATE INDEX IF NOT EXISTS idx_indicadores_dre_hash ON indicadores_dre (hash)")
+
+    def _conectar(self):
+        return conectar(self.caminho)
+
+    def periodo_do_hash(self, hash_arquivo):
+        with self._conectar() as con:
+            linha = con.execute("SELECT periodo FROM indicadores_dre WHERE hash = ?", (hash_arquivo,)).fetchone()
+        return linha[0] if linha else None
+
+    def gravar(self, periodo, hash_arquivo, arquivo, indicadores):
+        """Grava (ou substitui) os indicadores do período."""
+        colunas = ['periodo', 'hash', 'arquivo', 'gravado_em'] + COLUNAS_INDICADORES
+        valores = [periodo, hash_arquivo, arquivo, datetime.now().isoformat(timespec='seconds')]
+        valores += [float(indicadores[c]) for c in COLUNAS_INDICADORES]
+        with self._conectar() as con:
+            con.execute(
+                f"INSERT OR REPLACE INTO indicadores_dre ({', '.join(colunas)}) VALUES ({', '.join('?' * len(colunas))})",
+                valores,
+            )
+
+    def registrar(self, arquivo):
+        """Lê o arquivo e grava seus indicadores, a menos que o conteúdo já esteja no histórico.
+
+        Retorna (periodo, novo): ``novo`` é False quando o mesmo conteúdo já
+        estava gravado (nada é lido). Levanta ``ErroHistorico`` se o período
+        não puder ser identificado pelo nome do arquivo.
+        """
+        hash_arquivo = hash_conteudo(bytes_do_arquivo(arquivo))
+        periodo = self.periodo_do_hash(hash_arquivo)
+        if periodo is not None:
+            return periodo, False
+
+        periodo = periodo_do_nome(arquivo.name)
+        if periodo is None:
+            raise ErroHistorico(f"{arquivo.name}: período não identificado no nome (use, por exemplo, 'DRE 2024-01.xlsx').")
+        self.gravar(periodo, hash_arquivo, arquivo.name, indicadores_dos_arquivos([arquivo]))
+        return periodo, True
+
+    def registrar_arquivos(self, arquivos):
+        """``registrar`` para cada arquivo, informando o progresso (para rodar como tarefa).
+
+        Retorna (novos, erros): os períodos gravados agora e, por hash do
+        conteúdo, as mensagens dos arquivos que não entraram no histórico; um
+        arquivo com erro não interrompe os demais.
+        """
+        novos, erros = [], {}
+        for i, arquivo in enumerate(arquivos, start=1):
+            informar_progresso((i - 1) / len(arquivos), f"{arquivo.name} ({i} de {len(arquivos)})")
+            try:
+                periodo, novo = self.registrar(arquivo)
+                if novo:
+                    novos.append(periodo)
+            except ErroHistorico as e:
+                erros[hash_conteudo(bytes_do_arquivo(arquivo))] = str(e)
+            except Exception as e:
+                erros[hash_conteudo(bytes_do_arquivo(arquivo))] = f"{arquivo.name}: erro ao processar o arquivo: {e}"
+        return novos, erros
+
+    def serie(self):
+        """Indicadores por período (índice 'AAAA-MM' em ordem) com o crescimento mês a mês."""
+        with self._conectar() as con:
+            df = pd.read_sql_query(
+                f"SELECT periodo, arquivo, {', '.join(COLUNAS_INDICADORES)} FROM indicadores_dre ORDER BY periodo", con,
+                index_col='periodo',
+            )
+        # Só há crescimento mês a mês quando o período anterior guardado é o mês
+        # imediatamente anterior; depois de uma lacuna (2024-01 -> 2024-03) fica NaN
+        meses = pd.PeriodIndex(df.index, freq='M').asi8
+        consecutivo = np.diff(meses, prepend=meses[:1] - 2) == 1
+        # Mês anterior zerado não tem crescimento (NaN), como o "if rol_anterior else" da página
+        for coluna, origem in (('crescimento_rol', 'rol'), ('crescimento_lucro', 'lucro_liquido')):
+            crescimento = df[origem].pct_change(fill_method=None).replace([np.inf, -np.inf], np.nan)
+            df[coluna] = crescimento.where(consecutivo)
+        return df
+
+    def remover(self, periodo):
+        with self._conectar() as con:
+            con.execute("DELETE FROM indicadores_dre WHERE periodo = ?", (periodo,))
@@ -0,0 +1,201 @@
+from datetime import datetime
+
+import pandas as pd
+
+from banco_local import caminho_banco, conectar
+from desempenho import etapa
+from ponto import DIAS_AGENDAMENTO
+
+# ==============================================================================
+# HISTÓRICO DE ATRASOS (SQLITE LOCAL) PARA O PAINEL DA EMPRESA
+# ==============================================================================
+# Cada análise de ponto grava um resumo por arquivo (funcionário, mês, hash do
+# conteúdo) e uma linha por dia com ocorrência. O painel só consulta agregados
+# indexados; nenhum arquivo de ponto é relido.
+
+CAMINHO_HISTORICO_PONTO = caminho_banco('historico_ponto.sqlite', 'HISTORICO_PONTO')
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS arquivos_ponto (
+    hash TEXT PRIMARY KEY,
+    arquivo TEXT,
+    funcionario TEXT NOT NULL,
+    mes TEXT,
+    tolerancia_min REAL,
+    dias_com_atraso INTEGER NOT NULL,
+    total_ocorrencias INTEGER NOT NULL,
+    gravado_em TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_arquivos_ponto_func_mes ON arquivos_ponto (funcionario, mes);
+
+CREATE TABLE IF NOT EXISTS ocorrencias_ponto (
+    hash TEXT NOT NULL,
+    funcionario TEXT NOT NULL,
+    mes TEXT,
+    data TEXT,
+    dia TEXT,
+    qtd INTEGER NOT NULL,
+    manha INTEGER NOT NULL,
+    almoco INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ocorrencias_ponto_mes_func ON ocorrencias_ponto (mes, funcionario);
+CREATE INDEX IF NOT EXISTS idx_ocorrencias_ponto_func_mes ON ocorrencias_ponto (funcionario, mes);
+CREATE INDEX IF NOT EXISTS idx_ocorrencias_ponto_hash ON ocorrencias_ponto (hash);
+"""
+
+
+def _datas_iso(datas):
+    return pd.to_datetime(pd.Series(datas, dtype=object), format='%d/%m/%Y', errors='coerce')
+
+
+def mes_predominante(datas):
+    """Mês ('AAAA-MM') mais frequente entre datas 'dd/mm/aaaa' do arquivo, ou None."""
+    meses = _datas_iso(datas).dt.strftime('%Y-%m').dropna()
+    return meses.mode().iloc[0] if not meses.empty else None
+
+
+SEM_NOME = 'Sem nome'
+
+# Tolerância das análises gravadas (a mesma do lote); simulações na página não são gravadas
+TOLERANCIA_PADRAO_MIN = 5
+
+
+def nome_funcionario(nome):
+    return SEM_NOME if pd.isna(nome) or not str(nome).strip() else str(nome).strip()
+
+
+class HistoricoPonto:
+    """Resultados das análises de ponto por funcionário e mês, com consultas agregadas para o painel."""
+
+    def __init__(self, caminho=CAMINHO_HISTORICO_PONTO):
+        self.caminho = caminho
+        with self._conectar() as con:
+            con.executescript(_ESQUEMA)
+
+    def _conectar(self):
+        return conectar(self.caminho)
+
+    def registrar(self, hash_arquivo, arquivo, funcionario, mes, df_atrasos, tolerancia_min=TOLERANCIA_PADRAO_MIN):
+        """Grava o resultado de um arquivo; substitui o mesmo conteúdo e o mesmo funcionário/mês.
+
+        Arquivos sem nome de funcionário legível são substituídos só pelo
+        mesmo conteúdo (vários "Sem nome" no mesmo mês são pessoas diferentes).
+        """
+        funcionario = nome_funcionario(funcionario)
+        if df_atrasos is None or df_atrasos.empty:
+            df_atrasos = pd.DataFrame(columns=['Data', 'Dia', 'Qtd', 'Detalhes'])
+
+        datas = _datas_iso(df_atrasos['Data'])
+        detalhes = df_atrasos['Detalhes'].astype(str)
+        ocorrencias = pd.DataFrame({
+            'hash': hash_arquivo,
+            'funcionario': funcionario,
+            'mes': datas.dt.strftime('%Y-%m').fillna(mes).to_numpy(dtype=object),
+            'data': datas.dt.strftime('%Y-%m-%d').to_numpy(dtype=object),
+            'dia': df_atrasos['Dia'].to_numpy(dtype=object),
+            'qtd': df_atrasos['Qtd'].astype('int64').to_numpy(),
+            'manha': detalhes.str.contains('Manhã', regex=False).astype('int64').to_numpy(),
+            'almoco': detalhes.str.contains('Volta Almoço', regex=False).astype('int64').to_numpy(),
+        })
+        ocorrencias = ocorrencias.astype(object).where(ocorrencias.notna(), None)
+
+        with self._conectar() as con:
+            # Mesmo arquivo ou nova versão do mesmo funcionário/mês: a gravação anterior sai
+            antigos = [h for (h,) in con.execute(
+                "SELECT hash FROM arquivos_ponto WHERE hash = ? OR (funcionario = ? AND mes = ? AND funcionario != ?)",
+                (hash_arquivo, funcionario, mes, SEM_NOME),
+            )]
+            for h in antigos:
+                con.execute("DELETE FROM ocorrencias_ponto WHERE hash = ?", (h,))
+                con.execute("DELETE FROM arquivos_ponto WHERE hash = ?", (h,))
+
+            con.execute(
+                "INSERT INTO arquivos_ponto VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (hash_arquivo, arquivo, funcionario, mes, float(tolerancia_min), len(df_atrasos),
+                 int(ocorrencias['qtd'].sum()), datetime.now().isoformat(timespec='seconds')),
+            )
+            con.executemany(
+                "INSERT INTO ocorrencias_ponto VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ocorrencias.itertuples(index=False, name=None),
+            )
+
+    # --------------------------------------------------------------------------
+    # Consultas do painel
+    # --------------------------------------------------------------------------
+
+    def _consultar(self, sql, parametros=()):
+        with etapa('historico_ponto.consulta') as medida, self._conectar() as con:
+            df = pd.read_sql_query(sql, con, params=parametros)
+            medida['linhas'] = len(df)
+            return df
+
+    @staticmethod
+    def _filtro(mes_inicio=None, mes_fim=None, funcionarios=None):
+        condicoes, parametros = [], []
+        if mes_inicio:
+            condicoes.append("mes >= ?")
+            parametros.append(mes_inicio)
+        if mes_fim:
+            condicoes.append("mes <= ?")
+            parametros.append(mes_fim)
+        if funcionarios:
+            condicoes.append(f"funcionario IN ({', '.join('?' * len(funcionarios))})")
+            parametros.extend(funcionarios)
+        return ("WHERE " + " AND ".join(condicoes)) if condicoes else "", parametros
+
+    def meses(self):
+        return self._consultar("SELECT DISTINCT mes FROM arquivos_ponto WHERE mes IS NOT NULL ORDER BY mes")['mes'].tolist()
+
+    def funcionarios(self):
+        return self._consultar("SELECT DISTINCT funcionario FROM arquivos_ponto ORDER BY funcionario")['funcionario'].tolist()
+
+    def resumo(self, **filtro):
+        """Totais do período: arquivos, funcionários, dias com atraso e ocorrências."""
+        where, parametros = self._filtro(**filtro)
+        df = self._consultar(
+            f"SELECT COUNT(*) AS arquivos, COUNT(DISTINCT funcionario) AS funcionarios, "
+            f"COALESCE(SUM(dias_com_atraso), 0) AS dias_com_atraso, COALESCE(SUM(total_ocorrencias), 0) AS ocorrencias "
+            f"FROM arquivos_ponto {where}",
+            parametros,
+        )
+        return {k: int(v) for k, v in df.iloc[0].items()}
+
+    def por_mes(self, **filtro):
+        where, parametros = self._filtro(**filtro)
+        return self._consultar(
+            f'SELECT mes AS "Mês", SUM(qtd) AS "Ocorrências", SUM(manha) AS "Manhã", SUM(almoco) AS "Almoço", '
+            f'COUNT(DISTINCT funcionario) AS "Funcionários" FROM ocorrencias_ponto {where} GROUP BY mes ORDER BY mes',
+            parametros,
+        )
+
+    def por_dia_semana(self, **filtro):
+        where, parametros = self._filtro(**filtro)
+        df = self._consultar(
+            f'SELECT dia AS "Dia", SUM(qtd) AS "Ocorrências", SUM(manha) AS "Manhã", SUM(almoco) AS "Almoço" '
+            f'FROM ocorrencias_ponto {where} GROUP BY dia',
+            parametros,
+        )
+        ordem = {dia: i for i, dia in enumerate(DIAS_AGENDAMENTO)}
+        return df.sort_values('Dia', key=lambda dias: dias.map(ordem).fillna(len(ordem))).reset_index(drop=True)
+
+    def por_funcionario(self, limite=None, **filtro):
+        where, parametros = self._filtro(**filtro)
+        sql = (
+            f'SELECT funcionario AS "Funcionário", COUNT(*) AS "Arquivos", SUM(dias_com_atraso) AS "Dias com Atraso", '
+            f'SUM(total_ocorrencias) AS "Ocorrências" FROM arquivos_ponto {where} '
+            f'GROUP BY funcionario ORDER BY "Ocorrências" DESC, funcionario'
+        )
+        if limite:
+            sql += f" LIMIT {int(limite)}"
+        return self._consultar(sql, parametros)
+
+    def reincidentes(self, min_meses=3, **filtro):
+        """Funcionários com ocorrências em pelo menos ``min_meses`` meses diferentes do período."""
+        where, parametros = self._filtro(**filtro)
+        return self._consultar(
+            f'SELECT funcionario AS "Funcionário", COUNT(DISTINCT mes) AS "Meses com Atraso", '
+            f'SUM(qtd) AS "Ocorrências", MAX(mes) AS "Último Mês" FROM ocorrencias_ponto {where} '
+            f'GROUP BY funcionario HAVING COUNT(DISTINCT mes) >= ? '
+            f'ORDER BY "Meses com Atraso" DESC, "Ocorrências" DESC, funcionario',
+            [*parametros, int(min_meses)],
+        )
@@ -0,0 +1,261 @@
+import codecs
+import csv
+
+import numpy as np
+import pandas as pd
+
+# ==============================================================================
+# LEITURA DE PLANILHAS (XLSX / CSV)
+# ==============================================================================
+# Todas as páginas leem os uploads por aqui. O tipo do arquivo vem dos bytes
+# iniciais (não da extensão) e, no CSV, encoding e separador são detectados
+# uma vez numa amostra do início; o arquivo inteiro é então lido uma única vez
+# pelo motor C do pandas, direto do buffer do upload.
+#
+# Com o python-calamine instalado, os XLSX são lidos por ele (~8x mais rápido
+# que o openpyxl). Sem ele, os XLSX são percorridos em modo somente leitura
+# (streaming) do openpyxl e, depois do cabeçalho, só as colunas usadas pela
+# etapa seguinte são guardadas.
+
+try:
+    import python_calamine  # noqa: F401
+    MOTOR_XLSX = 'calamine'
+except ImportError:
+    MOTOR_XLSX = 'openpyxl'
+
+# Linhas lidas por inteiro para localizar cabeçalhos antes de podar as colunas
+LINHAS_CABECALHO = 50
+
+# Amostra do início do CSV usada para detectar encoding e separador
+AMOSTRA_BYTES = 64 * 1024
+LINHAS_AMOSTRA = 20
+SEPARADORES = ';,\t|'
+
+_ASSINATURA_XLSX = b'PK\x03\x04'
+_ASSINATURA_XLS = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+
+class ErroLeitura(ValueError):
+    """Arquivo vazio, em formato não suportado ou ilegível (mensagem pronta para exibição)."""
+
+
+def amostra_do_arquivo(arquivo, tamanho=AMOSTRA_BYTES):
+    """Até ``tamanho`` bytes a partir da posição atual, sem movê-la.
+
+    Em BytesIO/UploadedFile a amostra sai do buffer interno, sem ler nem
+    copiar o resto do arquivo.
+    """
+    posicao = arquivo.tell()
+    if hasattr(arquivo, 'getbuffer'):
+        with arquivo.getbuffer() as buffer:
+            return bytes(buffer[posicao:posicao + tamanho])
+    amostra = arquivo.read(tamanho)
+    arquivo.seek(posicao)
+    return amostra
+
+
+def tipo_arquivo(arquivo):
+    """'xlsx', 'xls' ou 'csv', pelos bytes iniciais. Levanta ``ErroLeitura`` se vazio ou binário desconhecido."""
+    amostra = amostra_do_arquivo(arquivo, 1024)
+    if not amostra.strip():
+        raise ErroLeitura("O arquivo está vazio.")
+    if amostra.startswith(_ASSINATURA_XLSX):
+        return 'xlsx'
+    if amostra.startswith(_ASSINATURA_XLS):
+        return 'xls'
+    if b'\x00' in amostra:
+        raise ErroLeitura("Formato de arquivo não reconhecido: envie uma planilha Excel (.xlsx) ou CSV.")
+    return 'csv'
+
+
+def detectar_encoding(amostra):
+    """Escolhe o encoding a partir de um prefixo do arquivo: UTF-8 se válido, senão latin1."""
+    if amostra.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        # final=False tolera um caractere multibyte cortado no fim da amostra
+        codecs.getincrementaldecoder('utf-8')().decode(amostra, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'latin1'
+
+
+def detectar_separador(texto):
+    """Separador do CSV entre ``SEPARADORES``, pelas primeiras linhas do texto ("," se nenhum aparecer).
+
+    Um separador que aparece o mesmo número de vezes em todas as linhas ganha,
+    na ordem de ``SEPARADORES`` (';' antes de ','): numa linha sem aspas como
+    ``01/03/2024;Pix;150,00`` os dois são consistentes e a vírgula é decimal.
+    """
+    linhas = [linha for linha in texto.splitlines()[:LINHAS_AMOSTRA + 1] if linha.strip()]
+    if len(linhas) > 1:
+        # A última linha pode ter sido cortada pela amostra
+        linhas = linhas[:-1]
+    for sep in SEPARADORES:
+        contagens = {linha.count(sep) for linha in linhas}
+        if len(contagens) == 1 and contagens != {0}:
+            return sep
+    try:
+        return csv.Sniffer().sniff('\n'.join(linhas), delimiters=SEPARADORES).delimiter
+    except csv.Error:
+        contagens = {sep: sum(linha.count(sep) for linha in linhas) for sep in SEPARADORES}
+        melhor = max(contagens, key=contagens.get)
+        return melhor if contagens[melhor] else ','
+
+
+def formato_csv(arquivo):
+    """(encoding, separador) do CSV, detectados numa amostra do início do arquivo."""
+    amostra = amostra_do_arquivo(arquivo)
+    encoding = detectar_encoding(amostra)
+    return encoding, detectar_separador(amostra.decode(encoding, errors='ignore'))
+
+
+def ler_csv(arquivo, **opcoes):
+    """Lê um CSV com o motor C, com encoding e separador detectados (``opcoes`` vão para o ``pd.read_csv``)."""
+    encoding, sep = formato_csv(arquivo)
+    posicao = arquivo.tell()
+    try:
+        try:
+            return pd.read_csv(arquivo, sep=sep, encoding=encoding, **opcoes)
+        except UnicodeDecodeError:
+            # Amostra em UTF-8 válido, mas um byte latin1 mais adiante (raro): única releitura
+            arquivo.seek(posicao)
+            return pd.read_csv(arquivo, sep=sep, encoding='latin1', **opcoes)
+    except pd.errors.EmptyDataError as e:
+        raise ErroLeitura("O arquivo CSV não tem dados.") from e
+    except pd.errors.ParserError as e:
+        raise ErroLeitura(f"CSV malformado (separador {sep!r}): {e}") from e
+
+
+def _ler_excel(arquivo, header=None, **opcoes):
+    posicao = arquivo.tell()
+    if MOTOR_XLSX != 'openpyxl':
+        try:
+            return pd.read_excel(arquivo, header=header, engine=MOTOR_XLSX, **opcoes)
+        except Exception:
+            # Arquivos que o calamine não entende ainda podem abrir no openpyxl
+            arquivo.seek(posicao)
+    try:
+        return pd.read_excel(arquivo, header=header, engine='openpyxl', **opcoes)
+    except Exception as e:
+        raise ErroLeitura(f"Não foi possível abrir a planilha Excel: {e}") from e
+
+
+def ler_planilha(arquivo, header=None, **opcoes):
+    """Lê XLSX/XLS ou CSV (tipo detectado pelo conteúdo), por padrão sem cabeçalho.
+
+    ``opcoes`` (nrows, usecols, dtype...) vão para o ``read_excel``/``read_csv``.
+    Levanta ``ErroLeitura`` com uma mensagem pronta para exibição.
+    """
+    if tipo_arquivo(arquivo) == 'csv':
+        return ler_csv(arquivo, header=header, **opcoes)
+    return _ler_excel(arquivo, header=header, **opcoes)
+
+
+def _converter_celula(valor):
+    # Mesmas conversões do leitor openpyxl do pandas: vazio -> NaN, 8.0 -> 8
+    if valor is None or valor == '':
+        return np.nan
+    if isinstance(valor, float) and valor.is_integer():
+        return int(valor)
+    return valor
+
+
+def _linhas_xlsx(arquivo):
+    import openpyxl
+
+    wb = openpyxl.load_workbook(arquivo, read_only=True, data_only=True, keep_links=False)
+    try:
+        yield from wb.worksheets[0].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def ler_planilha_podada(arquivo, escolher_colunas, linhas_cabecalho=LINHAS_CABECALHO):
+    """Lê a planilha guardando todas as colunas só no topo.
+
+    As primeiras ``linhas_cabecalho`` linhas vêm completas e são passadas (como
+    DataFrame) para ``escolher_colunas``, que devolve as posições das colunas
+    necessárias dali em diante, ou None para manter todas. Nas linhas seguintes
+    as demais colunas ficam vazias (NaN) e não chegam a ser convertidas.
+
+    A poda só acontece no streaming do openpyxl; CSV e calamine leem o arquivo
+    inteiro, porque já são rápidos.
+    """
+    if MOTOR_XLSX != 'openpyxl' or tipo_arquivo(arquivo) != 'xlsx':
+        return ler_planilha(arquivo)
+
+    topo, resto = [], []
+    manter = None
+    ultima_nao_vazia = -1
+    for i, linha in enumerate(_linhas_xlsx(arquivo)):
+        if any(v is not None and v != '' for v in linha):
+            ultima_nao_vazia = i
+        if i < linhas_cabecalho:
+            celulas = [_converter_celula(v) for v in linha]
+            # Células vazias no fim da linha não contam para a largura (como no pd.read_excel)
+            while celulas and not isinstance(celulas[-1], str) and pd.isna(celulas[-1]):
+                celulas.pop()
+            topo.append(celulas)
+            continue
+        if i == linhas_cabecalho:
+            manter = escolher_colunas(pd.DataFrame(topo))
+            if manter is None:
+                manter = list(range(len(linha)))
+        resto.append([_converter_celula(linha[c]) if c < len(linha) else np.nan for c in manter])
+
+    # Linhas vazias no fim da planilha são descartadas, como no pd.read_excel
+    n_resto = max(0, ultima_nao_vazia + 1 - len(topo))
+    topo = topo[:ultima_nao_vazia + 1]
+    df_topo = pd.DataFrame(topo)
+    if n_resto == 0:
+        return df_topo
+    df_resto = pd.DataFrame(resto[:n_resto], columns=manter)
+    largura = max(len(df_topo.columns), max(manter) + 1)
+    return pd.concat(
+        [df_topo.reindex(columns=range(largura)), df_resto.reindex(columns=range(largura))],
+        ignore_index=True,
+    )
+
+
+def _linha_do_rotulo(df, rotulo):
+    encontrados = df.index[df.apply(lambda row: row.astype(str).str.contains(rotulo).any(), axis=1)]
+    return encontrados[0] if len(encontrados) else None
+
+
+def _colunas_do_cabecalho(df, idx_header, colunas):
+    nomes = [str(v).strip() for v in df.iloc[idx_header]]
+    faltando = [c for c in colunas if c not in nomes]
+    if faltando:
+        raise ValueError(f"Colunas não encontradas: {', '.join(faltando)}.")
+    return [nomes.index(c) for c in colunas]
+
+
+def ler_colunas_por_cabecalho(arquivo, rotulo, colunas):
+    """Lê só as ``colunas`` de uma tabela cujo cabeçalho contém ``rotulo``.
+
+    Retorna um DataFrame com as linhas abaixo do cabeçalho e as colunas na
+    ordem pedida. Levanta ``ValueError`` se o cabeçalho ou alguma coluna não
+    for encontrado.
+    """
+    def escolher(topo):
+        idx = _linha_do_rotulo(topo, rotulo)
+        if idx is None:
+            return None
+        try:
+            return _colunas_do_cabecalho(topo, idx, colunas)
+        except ValueError:
+            return None
+
+    df = ler_planilha_podada(arquivo, escolher)
+    idx_header = _linha_do_rotulo(df.head(LINHAS_CABECALHO), rotulo)
+    if idx_header is None:
+        # Cabeçalho fora do topo (caso raro): procura na planilha toda
+        idx_header = _linha_do_rotulo(df, rotulo)
+        if idx_header is None:
+            raise ValueError(f"Cabeçalho com '{rotulo}' não encontrado.")
+
+    posicoes = _colunas_do_cabecalho(df, idx_header, colunas)
+    resultado = df.iloc[idx_header + 1:, posicoes].reset_index(drop=True)
+    resultado.columns = list(colunas)
+    return resultado
@@ -0,0 +1,233 @@
+import argparse
+import io
+import multiprocessing
+import os
+import sys
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from cache import hash_conteudo
+from desempenho import configurar_log, etapa
+from historico_ponto import CAMINHO_HISTORICO_PONTO, HistoricoPonto, mes_predominante
+from ponto import ErroPonto, carregar_batidas, comparar_batidas
+from tarefas import informar_progresso
+
+# ==============================================================================
+# PROCESSAMENTO EM LOTE (PONTO)
+# ==============================================================================
+
+EXTENSOES_PONTO = ('.csv', '.xlsx')
+COLUNAS_LOTE = ['Arquivo', 'Funcionário', 'Dias com Atraso', 'Total de Ocorrências', 'Erro']
+
+# Um único pool de processos por processo do servidor, dividido por todos os
+# lotes em andamento (de qualquer usuário). Os processos nascem por
+# 'forkserver' (ou 'spawn'), nunca por fork da thread que pediu o lote: o fork
+# copiaria travas presas naquele instante por outras threads (cache de
+# leitura, cache de layout) e o processo filho travaria nelas.
+MAX_PROCESSOS = int(os.environ.get('LOTE_MAX_PROCESSOS', os.cpu_count() or 1))
+
+_pool = None
+_lock_pool = threading.Lock()
+
+
+def _contexto_processos():
+    metodos = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in metodos else 'spawn')
+
+
+def pool_processos():
+    """O pool de processos compartilhado (criado no primeiro uso, com ``MAX_PROCESSOS`` workers)."""
+    global _pool
+    with _lock_pool:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=MAX_PROCESSOS, mp_context=_contexto_processos())
+        return _pool
+
+
+def _descartar_pool(pool):
+    # Um worker morto quebra o pool inteiro; o próximo lote cria outro
+    global _pool
+    with _lock_pool:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _expandir_zip(nome, conteudo):
+    with zipfile.ZipFile(io.BytesIO(conteudo)) as zf:
+        for info in zf.infolist():
+            if info.is_dir() or not info.filename.lower().endswith(EXTENSOES_PONTO):
+                continue
+            # Ignora lixo do macOS (__MACOSX/._arquivo.xlsx)
+            if os.path.basename(info.filename).startswith('._'):
+                continue
+            yield f"{nome}/{info.filename}", zf.read(info)
+
+
+def coletar_arquivos(entradas):
+    """Normaliza as entradas do lote em uma lista de (nome, bytes).
+
+    Cada entrada pode ser um caminho (arquivo, pasta ou ZIP), uma tupla
+    (nome, bytes) ou um objeto de arquivo com ``name`` (ex.: UploadedFile).
+    Arquivos ZIP e pastas são expandidos em seus XLSX/CSV. Caminhos de
+    arquivos comuns ficam com bytes ``None`` e são lidos pelo processo de
+    trabalho.
+    """
+    itens = []
+    for entrada in entradas:
+        if isinstance(entrada, tuple):
+            nome, conteudo = entrada
+        elif isinstance(entrada, (str, os.PathLike)):
+            caminho = os.fspath(entrada)
+            if os.path.isdir(caminho):
+                for raiz, _, arquivos in os.walk(caminho):
+                    for arq in sorted(arquivos):
+                        if arq.lower().endswith(EXTENSOES_PONTO + ('.zip',)):
+                            itens.extend(coletar_arquivos([os.path.join(raiz, arq)]))
+                continue
+            nome = caminho
+            if not nome.lower().endswith('.zip'):
+                # Leitura adiada para o processo de trabalho (erros viram linha de erro)
+                itens.append((nome, None))
+                continue
+            try:
+                with open(caminho, 'rb') as f:
+                    conteudo = f.read()
+            except OSError:
+                itens.append((nome, None))
+                continue
+        else:
+            nome = entrada.name
+            conteudo = entrada.getvalue() if hasattr(entrada, 'getvalue') else entrada.read()
+
+        if nome.lower().endswith('.zip'):
+            try:
+                itens.extend(_expandir_zip(nome, conteudo))
+            except zipfile.BadZipFile:
+                # Mantém o ZIP inválido no lote para que o erro apareça no consolidado
+                itens.append((nome, conteudo))
+        else:
+            itens.append((nome, conteudo))
+    return itens
+
+
+def _processar_item(item):
+    nome, conteudo = item
+    try:
+        if conteudo is None:
+            with open(nome, 'rb') as f:
+                conteudo = f.read()
+        buffer = io.BytesIO(conteudo)
+        buffer.name = nome
+        batidas = carregar_batidas(buffer)
+        df_resultado, total = comparar_batidas(batidas)
+    except ErroPonto as e:
+        return {'Arquivo': nome, 'Funcionário': None, 'Dias com Atraso': 0, 'Total de Ocorrências': 0, 'Erro': str(e)}
+    except OSError as e:
+        return {'Arquivo': nome, 'Funcionário': None, 'Dias com Atraso': 0, 'Total de Ocorrências': 0, 'Erro': f"Erro ao ler o arquivo: {e}"}
+    except Exception as e:
+        return {'Arquivo': nome, 'Funcionário': None, 'Dias com Atraso': 0, 'Total de Ocorrências': 0, 'Erro': f"Erro inesperado: {e}"}
+    return {
+        'Arquivo': nome,
+        'Funcionário': batidas.nome,
+        'Dias com Atraso': len(df_resultado),
+        'Total de Ocorrências': total,
+        'Erro': None,
+        # Usados só para gravar no histórico (fora das COLUNAS_LOTE)
+        '_hash': hash_conteudo(conteudo),
+        '_mes': mes_predominante(batidas.datas),
+        '_atrasos': df_resultado,
+    }
+
+
+def _marcar_repetidos(resultados):
+    # O mesmo conteúdo em duas entradas (ex.: no ZIP e na pasta) conta uma vez
+    # só: as cópias seguintes ficam no consolidado como erro, sem atrasos
+    primeiro = {}
+    for r in resultados:
+        if r['Erro'] is not None:
+            continue
+        if r['_hash'] in primeiro:
+            r.update({'Dias com Atraso': 0, 'Total de Ocorrências': 0, 'Erro': f"Conteúdo repetido de {primeiro[r['_hash']]} (não contado)"})
+        else:
+            primeiro[r['_hash']] = r['Arquivo']
+
+
+def _mapear(executor, n_processos, itens, resultados):
+    chunksize = max(1, len(itens) // (n_processos * 4))
+    for resultado in executor.map(_processar_item, itens, chunksize=chunksize):
+        resultados.append(resultado)
+        informar_progresso(len(resultados) / len(itens), f"{len(resultados)} de {len(itens)} arquivos")
+
+
+def processar_lote(entradas, max_workers=None, historico=None):
+    """Processa vários arquivos de ponto em paralelo e consolida o resultado.
+
+    Retorna um DataFrame com uma linha por arquivo (colunas ``COLUNAS_LOTE``).
+    Falhas em um arquivo são registradas na coluna 'Erro' sem interromper o lote;
+    um conteúdo já visto no lote (mesmo hash) também vira linha de erro e não
+    soma atrasos de novo.
+    Sem ``max_workers`` usa o pool compartilhado (``pool_processos``); com
+    ``max_workers=1`` (ou um único arquivo) roda no processo atual. Com um
+    ``HistoricoPonto``, os resultados são gravados nele (pelo processo principal).
+    """
+    itens = coletar_arquivos(entradas)
+    if not itens:
+        return pd.DataFrame(columns=COLUNAS_LOTE)
+
+    with etapa('lote.processamento', arquivos=len(itens)) as medida:
+        resultados = []
+        if max_workers == 1 or len(itens) == 1:
+            for item in itens:
+                resultados.append(_processar_item(item))
+                informar_progresso(len(resultados) / len(itens), f"{len(resultados)} de {len(itens)} arquivos")
+        elif max_workers is None:
+            pool = pool_processos()
+            try:
+                _mapear(pool, MAX_PROCESSOS, itens, resultados)
+            except BrokenProcessPool:
+                _descartar_pool(pool)
+                raise
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=_contexto_processos()) as executor:
+                _mapear(executor, max_workers, itens, resultados)
+        _marcar_repetidos(resultados)
+        medida['erros'] = sum(r['Erro'] is not None for r in resultados)
+
+    if historico is not None:
+        with etapa('lote.historico'):
+            for r in resultados:
+                if r['Erro'] is None:
+                    historico.registrar(r['_hash'], os.path.basename(r['Arquivo']), r['Funcionário'], r['_mes'], r['_atrasos'])
+
+    return pd.DataFrame(resultados, columns=COLUNAS_LOTE)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Análise de atrasos em lote (arquivos de ponto XLSX/CSV, pastas ou ZIP).")
+    parser.add_argument('entradas', nargs='+', help="Arquivos, pastas ou ZIPs com os arquivos de ponto")
+    parser.add_argument('-o', '--saida', help="Caminho do CSV consolidado (padrão: imprime na tela)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Número de processos (padrão: o pool compartilhado, LOTE_MAX_PROCESSOS ou nº de CPUs)")
+    parser.add_argument('--historico', nargs='?', const=CAMINHO_HISTORICO_PONTO, help="Grava os resultados no histórico do painel (caminho opcional do banco)")
+    args = parser.parse_args(argv)
+
+    configurar_log()
+    historico = HistoricoPonto(args.historico) if args.historico else None
+    df = processar_lote(args.entradas, max_workers=args.workers, historico=historico)
+    if args.saida:
+        df.to_csv(args.saida, index=False, sep=';', encoding='utf-8-sig')
+    else:
+        print(df.to_string(index=False))
+
+    erros = df['Erro'].notna().sum()
+    if erros:
+        print(f"{erros} arquivo(s) com erro.", file=sys.stderr)
+    return 1 if erros == len(df) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,5 @@
+"""Páginas do app Streamlit, uma por módulo; cada uma expõe ``exibir()``.
+
+As regras de negócio ficam nos módulos da raiz (ponto, pix, dre, vale...),
+que não dependem do Streamlit.
+"""
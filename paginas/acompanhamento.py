@@ -0,0 +1,55 @@
+import streamlit as st
+
+from desempenho import anexar_execucao
+from tarefas import fila_compartilhada
+
+# ==============================================================================
+# ACOMPANHAMENTO DE TAREFAS EM SEGUNDO PLANO
+# ==============================================================================
+# Enquanto a tarefa roda, só um fragmento com as barras de progresso é
+# reexecutado (a cada INTERVALO_ATUALIZACAO s). Quando todas terminam, o app
+# inteiro é reexecutado e a página segue com os resultados.
+
+INTERVALO_ATUALIZACAO = 0.5
+
+# Tarefas curtas terminam dentro desta espera e não chegam a mostrar progresso
+ESPERA_INICIAL = 0.5
+
+
+def enviar_tarefa(chave, funcao, *args, descricao=None, **kwargs):
+    """Agenda na fila compartilhada (ver ``FilaTarefas.enviar``) e retorna a tarefa."""
+    return fila_compartilhada().enviar(chave, funcao, *args, descricao=descricao, **kwargs)
+
+
+def descartar_tarefa(tarefa):
+    """Esquece a tarefa terminada (ver ``FilaTarefas.descartar``), para trabalhos que mudam estado e não devem ser reaproveitados."""
+    fila_compartilhada().descartar(tarefa.id)
+
+
+def aguardar_tarefas(*tarefas):
+    """Retorna quando todas as tarefas terminaram; até lá mostra o progresso e interrompe a página.
+
+    As etapas medidas nas tarefas entram no painel de desempenho desta execução.
+    """
+    for tarefa in tarefas:
+        tarefa.aguardar(timeout=ESPERA_INICIAL)
+    if all(tarefa.terminada for tarefa in tarefas):
+        for tarefa in tarefas:
+            anexar_execucao(tarefa.execucao)
+        return
+
+    ids = [tarefa.id for tarefa in tarefas]
+
+    @st.fragment(run_every=INTERVALO_ATUALIZACAO)
+    def progresso():
+        fila = fila_compartilhada()
+        atuais = [fila.obter(i) for i in ids]
+        for tarefa in atuais:
+            if tarefa is not None:
+                st.progress(tarefa.progresso, text=f"{tarefa.descricao}: {tarefa.mensagem}")
+        if all(tarefa is None or tarefa.terminada for tarefa in atuais):
+            st.rerun()
+
+    progresso()
+    st.caption("Você pode mexer nos outros controles: o processamento continua e não é refeito.")
+    st.stop()
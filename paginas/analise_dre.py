@@ -0,0 +1,158 @@
+import pandas as pd
+import streamlit as st
+
+from dre import indicadores_dos_arquivos
+from cache import bytes_do_arquivo, copia_nomeada, hash_conteudo
+from historico_dre import HistoricoDRE
+from paginas.acompanhamento import aguardar_tarefas, descartar_tarefa, enviar_tarefa
+from paginas.seguranca import check_password
+
+# ==============================================================================
+# PÁGINA: ANÁLISE DRE (PROTEGIDA POR SENHA)
+# ==============================================================================
+
+def exibir():
+    if not check_password():
+        st.stop()
+    
+    historico_dre = HistoricoDRE()
+    serie_dre = historico_dre.serie()
+
+    st.sidebar.markdown("### Dados Mês Anterior (DRE)")
+    # Com histórico gravado, o mês anterior padrão é o último período guardado
+    rol_padrao, lucro_padrao = 647538.80, 228305.24
+    if not serie_dre.empty:
+        rol_padrao = max(float(serie_dre['rol'].iloc[-1]), 0.0)
+        lucro_padrao = max(float(serie_dre['lucro_liquido'].iloc[-1]), 0.0)
+        st.sidebar.caption(f"Padrão: último período do histórico ({serie_dre.index[-1]}).")
+    rol_anterior = st.sidebar.number_input("ROL Mês Anterior (R$)", min_value=0.0, value=rol_padrao, step=1000.0, format="%.2f")
+    lucro_anterior = st.sidebar.number_input("Lucro Líq. Mês Anterior (R$)", min_value=0.0, value=lucro_padrao, step=1000.0, format="%.2f")
+    
+    st.title("📊 Automação de Análise DRE")
+    st.markdown("Extração automática de indicadores financeiros via Classificação Contábil.")
+    modo_dre = st.radio("Modo", ["Mês atual", "Histórico mensal"], horizontal=True)
+
+    if modo_dre == "Mês atual":
+        uploaded_files_dre = st.file_uploader(
+            "Faça upload do arquivo DRE (CSV ou Excel) — vários arquivos são consolidados",
+            type=['csv', 'xlsx'], accept_multiple_files=True, key="dre_uploader",
+        )
+
+        if uploaded_files_dre:
+            tarefa = enviar_tarefa(
+                ('dre', tuple(hash_conteudo(bytes_do_arquivo(a)) for a in uploaded_files_dre)), indicadores_dos_arquivos,
+                [copia_nomeada(a) for a in uploaded_files_dre], descricao=f"DRE: {len(uploaded_files_dre)} arquivo(s)",
+            )
+            aguardar_tarefas(tarefa)
+            try:
+                ind = tarefa.resultado()
+                if len(uploaded_files_dre) > 1:
+                    st.caption(f"DRE consolidado de {len(uploaded_files_dre)} arquivos.")
+
+                rol_atual = ind['rol']
+                lucro_liquido_atual = ind['lucro_liquido']
+                crescimento_rol = (rol_atual - rol_anterior) / rol_anterior if rol_anterior else 0
+                crescimento_lucro = (lucro_liquido_atual - lucro_anterior) / lucro_anterior if lucro_anterior else 0
+
+                st.divider()
+                st.subheader("Resultados Consolidados")
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("ROL Atual", f"R$ {rol_atual:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.'))
+                    st.metric("Lucro Líquido", f"R$ {lucro_liquido_atual:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.'))
+                with col2:
+                    st.metric("Margem Bruta", f"{ind['margem_bruta']:.2%}")
+                    st.metric("Margem Líquida", f"{ind['margem_liquida']:.2%}")
+                with col3:
+                    st.metric("Margem EBITDA", f"{ind['margem_ebitda']:.2%}")
+                    st.metric("Efic. Operacional", f"{ind['eficiencia_operacional']:.2%}")
+                with col4:
+                    st.metric("Cresc. ROL", f"{crescimento_rol:.2%}", delta_color="normal")
+                    st.metric("Cresc. Lucro", f"{crescimento_lucro:.2%}", delta_color="normal")
+                st.divider()
+                with st.expander("Verificar valores extraídos"):
+                    st.write(f"**Receita Bruta (03.1.1):** {ind['receita_bruta']}")
+                    st.write(f"**Deduções (03.1.2):** {ind['deducoes']}")
+                    st.write(f"**Custos (04.1):** {ind['custos_servicos']}")
+                    st.write(f"**EBITDA Base (04.2.9):** {ind['ebitda']}")
+                    st.write(f"**Despesas Operacionais (04.2):** {ind['despesas_operacionais']}")
+
+            except Exception as e:
+                st.error(f"Erro ao processar o arquivo: {e}")
+                st.info("Verifique se o arquivo tem as colunas 'Classificação' e 'Movimento'.")
+
+    else:
+        st.caption("Envie um arquivo por mês, com o período no nome (ex.: 'DRE 2024-01.xlsx'). "
+                   "Cada arquivo é lido uma vez e fica guardado no histórico local.")
+        uploaded_historico = st.file_uploader(
+            "Arquivos DRE mensais (CSV ou Excel)", type=['csv', 'xlsx'],
+            accept_multiple_files=True, key="dre_historico_uploader",
+        )
+
+        # Só vai para a fila o que ainda não está no histórico (consulta pelo hash)
+        # nem falhou nesta sessão: um arquivo sem período no nome ou ilegível não
+        # chega ao banco e seria reenviado a cada interação. A falha é esquecida
+        # quando o arquivo sai do upload, e enviá-lo de novo tenta outra vez
+        enviados = {hash_conteudo(bytes_do_arquivo(a)): a for a in uploaded_historico or []}
+        falhas = {h: erro for h, erro in st.session_state.get('dre_historico_falhas', {}).items() if h in enviados}
+        pendentes = {
+            h: arquivo for h, arquivo in enviados.items()
+            if h not in falhas and historico_dre.periodo_do_hash(h) is None
+        }
+        if pendentes:
+            tarefa = enviar_tarefa(
+                ('dre_historico', historico_dre.caminho, tuple(pendentes)),
+                historico_dre.registrar_arquivos, [copia_nomeada(a) for a in pendentes.values()],
+                descricao=f"Histórico DRE: {len(pendentes)} arquivo(s)",
+            )
+            aguardar_tarefas(tarefa)
+            try:
+                novos, erros = tarefa.resultado()
+            except Exception as e:
+                novos, erros = [], dict.fromkeys(pendentes, f"Erro ao gravar o histórico: {e}")
+            # A gravação já aconteceu: reenviar os mesmos arquivos depois de
+            # remover um período precisa de uma tarefa nova
+            descartar_tarefa(tarefa)
+            falhas.update(erros)
+            if novos:
+                st.success(f"{len(novos)} período(s) gravado(s) no histórico: {', '.join(sorted(novos))}.")
+                serie_dre = historico_dre.serie()
+        st.session_state['dre_historico_falhas'] = falhas
+        for erro in dict.fromkeys(falhas.values()):
+            st.error(erro)
+
+        if serie_dre.empty:
+            st.info("Histórico vazio. Envie os DREs mensais para ver as tendências.")
+        else:
+            ultimo = serie_dre.iloc[-1]
+            st.subheader(f"Último período: {serie_dre.index[-1]}")
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("ROL", f"R$ {ultimo['rol']:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.'),
+                        None if pd.isna(ultimo['crescimento_rol']) else f"{ultimo['crescimento_rol']:.2%}")
+            col2.metric("Lucro Líquido", f"R$ {ultimo['lucro_liquido']:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.'),
+                        None if pd.isna(ultimo['crescimento_lucro']) else f"{ultimo['crescimento_lucro']:.2%}")
+            col3.metric("Margem EBITDA", f"{ultimo['margem_ebitda']:.2%}")
+            col4.metric("Efic. Operacional", f"{ultimo['eficiencia_operacional']:.2%}")
+
+            st.markdown("**ROL e Lucro Líquido (R$)**")
+            st.bar_chart(serie_dre[['rol', 'lucro_liquido']].rename(columns={'rol': 'ROL', 'lucro_liquido': 'Lucro Líquido'}))
+            st.markdown("**Margens**")
+            st.line_chart(serie_dre[['margem_bruta', 'margem_liquida', 'margem_ebitda', 'eficiencia_operacional']].rename(columns={
+                'margem_bruta': 'Margem Bruta', 'margem_liquida': 'Margem Líquida',
+                'margem_ebitda': 'Margem EBITDA', 'eficiencia_operacional': 'Efic. Operacional',
+            }))
+            st.markdown("**Crescimento mês a mês**")
+            st.line_chart(serie_dre[['crescimento_rol', 'crescimento_lucro']].rename(columns={
+                'crescimento_rol': 'Cresc. ROL', 'crescimento_lucro': 'Cresc. Lucro',
+            }))
+
+            with st.expander("Tabela do histórico"):
+                st.dataframe(serie_dre.style.format({
+                    'rol': 'R$ {:,.2f}', 'lucro_liquido': 'R$ {:,.2f}', 'ebitda': 'R$ {:,.2f}',
+                    'margem_bruta': '{:.2%}', 'margem_liquida': '{:.2%}', 'margem_ebitda': '{:.2%}',
+                    'eficiencia_operacional': '{:.2%}', 'crescimento_rol': '{:.2%}', 'crescimento_lucro': '{:.2%}',
+                }, na_rep='-'))
+                periodo_remover = st.selectbox("Remover período do histórico", [''] + list(serie_dre.index))
+                if periodo_remover and st.button("Remover"):
+                    historico_dre.remover(periodo_remover)
+                    st.rerun()
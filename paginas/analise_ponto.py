@@ -0,0 +1,132 @@
+from datetime import timedelta
+
+import streamlit as st
+
+from desempenho import etapa
+
+# ==============================================================================
+# PÁGINA: ANÁLISE DE PONTO
+# ==============================================================================
+# pandas/openpyxl só são carregados quando chega o primeiro arquivo; até lá a
+# página é só o upload.
+
+def exibir():
+    st.title("📂 Análise de Atrasos (Ponto)")
+    st.markdown("Faça o upload do arquivo para verificar atrasos na entrada e no almoço.")
+    modo_ponto = st.radio("Modo", ["Arquivo único", "Lote (vários arquivos ou ZIP)"], horizontal=True)
+
+    if modo_ponto == "Arquivo único":
+        arquivo = st.file_uploader("Carregue o arquivo de Ponto (XLSX ou CSV)", type=['csv', 'xlsx'])
+
+        if arquivo:
+            from cache import bytes_do_arquivo, copia_nomeada, hash_conteudo
+            from historico_ponto import TOLERANCIA_PADRAO_MIN, HistoricoPonto, mes_predominante
+            from ponto import (
+                ErroPonto, agendamento_para_tabela, carregar_batidas, comparar_batidas, tabela_para_agendamento, varrer_tolerancias,
+            )
+            from paginas.acompanhamento import aguardar_tarefas, enviar_tarefa
+
+            # A leitura roda na fila em segundo plano; reruns só consultam o andamento
+            hash_ponto = hash_conteudo(bytes_do_arquivo(arquivo))
+            tarefa = enviar_tarefa(
+                ('ponto', hash_ponto), carregar_batidas, copia_nomeada(arquivo), descricao=f"Ponto: {arquivo.name}",
+            )
+            aguardar_tarefas(tarefa)
+            try:
+                batidas = tarefa.resultado()
+            except ErroPonto as e:
+                st.error(str(e))
+                batidas = None
+            
+            if batidas is not None:
+                # Trocar estes parâmetros só refaz a comparação (o arquivo já está interpretado)
+                with st.expander("⚙️ Parâmetros da análise"):
+                    tolerancia_min = st.slider("Tolerância (minutos)", min_value=0, max_value=30, value=5)
+                    duracao_almoco = None
+                    if st.checkbox("Usar duração fixa de almoço"):
+                        duracao_almoco = timedelta(minutes=st.number_input("Duração do almoço (minutos)", min_value=0, max_value=240, value=60, step=5))
+                    st.markdown("**Horário padrão** (HH:MM; dia sem horários = sem expediente)")
+                    tabela_horario = st.data_editor(
+                        agendamento_para_tabela(batidas.agendamento), hide_index=True, disabled=['Dia'],
+                        use_container_width=True, key=f"horario_{arquivo.name}",
+                    )
+                agendamento = tabela_para_agendamento(tabela_horario)
+                df_resultado, total_ocorrencias = comparar_batidas(
+                    batidas, timedelta(minutes=tolerancia_min), agendamento=agendamento, duracao_almoco=duracao_almoco,
+                )
+
+                st.success(f"Funcionário: **{batidas.nome}**")
+                st.session_state['ultimo_total_atrasos'] = total_ocorrencias
+
+                # Alimenta o painel com a análise padrão do arquivo (horário do próprio
+                # arquivo, tolerância padrão), uma vez por conteúdo: as simulações com
+                # outros parâmetros ficam só na tela
+                if st.session_state.get('ultimo_ponto_gravado') != hash_ponto:
+                    parametros_padrao = (
+                        tolerancia_min == TOLERANCIA_PADRAO_MIN and duracao_almoco is None and agendamento == batidas.agendamento
+                    )
+                    df_padrao = df_resultado if parametros_padrao else comparar_batidas(batidas, timedelta(minutes=TOLERANCIA_PADRAO_MIN))[0]
+                    HistoricoPonto().registrar(hash_ponto, arquivo.name, batidas.nome, mes_predominante(batidas.datas), df_padrao)
+                    st.session_state['ultimo_ponto_gravado'] = hash_ponto
+                col1, col2 = st.columns(2)
+                with col1:
+                    qtd_dias = len(df_resultado) if df_resultado is not None else 0
+                    st.metric("Dias com Atraso", qtd_dias)
+                with col2:
+                    st.metric("Total de Ocorrências", total_ocorrencias, delta_color="inverse")
+                st.divider()
+                if df_resultado is not None and not df_resultado.empty:
+                    st.warning(f"Irregularidades encontradas: {total_ocorrencias}")
+                    with etapa('render.ponto', linhas=len(df_resultado)):
+                        st.dataframe(df_resultado, use_container_width=True, hide_index=True, column_config={"Qtd": st.column_config.NumberColumn("Qtd", format="%d", width="small")})
+                else:
+                    st.balloons(); st.success("Tudo limpo! Nenhum atraso.")
+
+                with st.expander("📈 Simular tolerâncias (0 a 30 minutos)"):
+                    df_varredura = varrer_tolerancias(batidas, range(0, 31), agendamento=agendamento, duracao_almoco=duracao_almoco)
+                    st.bar_chart(df_varredura.set_index('Tolerância (min)')[['Atrasos Manhã', 'Atrasos Almoço']])
+                    st.dataframe(df_varredura, use_container_width=True, hide_index=True)
+
+    else:
+        arquivos_lote = st.file_uploader("Carregue os arquivos de Ponto (XLSX, CSV ou um ZIP)", type=['csv', 'xlsx', 'zip'], accept_multiple_files=True)
+
+        if arquivos_lote and st.button("Processar lote"):
+            from cache import hash_conteudo
+            from historico_ponto import HistoricoPonto
+            from lote import processar_lote
+            from paginas.acompanhamento import enviar_tarefa
+
+            entradas = [(a.name, a.getvalue()) for a in arquivos_lote]
+            tarefa = enviar_tarefa(
+                ('lote', tuple(hash_conteudo(conteudo) for _, conteudo in entradas)), processar_lote, entradas,
+                historico=HistoricoPonto(), descricao=f"Lote: {len(entradas)} arquivo(s)",
+            )
+            st.session_state['tarefa_lote'] = tarefa.id
+
+        if 'tarefa_lote' in st.session_state:
+            from paginas.acompanhamento import aguardar_tarefas
+            from tarefas import fila_compartilhada
+
+            tarefa = fila_compartilhada().obter(st.session_state['tarefa_lote'])
+            if tarefa is not None:
+                aguardar_tarefas(tarefa)
+                try:
+                    st.session_state['ultimo_lote'] = tarefa.resultado()
+                except Exception as e:
+                    st.error(f"Erro ao processar o lote: {e}")
+            del st.session_state['tarefa_lote']
+
+        df_lote = st.session_state.get('ultimo_lote')
+        if df_lote is not None:
+            df_ok = df_lote[df_lote['Erro'].isna()]
+            df_erros = df_lote[df_lote['Erro'].notna()]
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Arquivos processados", len(df_ok))
+            col2.metric("Arquivos com erro", len(df_erros), delta_color="inverse")
+            col3.metric("Total de Ocorrências", int(df_ok['Total de Ocorrências'].sum()))
+            st.divider()
+            st.dataframe(df_ok.drop(columns=['Erro']), use_container_width=True, hide_index=True)
+            if not df_erros.empty:
+                with st.expander(f"⚠️ {len(df_erros)} arquivo(s) não processado(s)"):
+                    st.dataframe(df_erros[['Arquivo', 'Erro']], use_container_width=True, hide_index=True)
+            st.download_button("⬇️ Baixar consolidado (CSV)", df_lote.to_csv(index=False, sep=';').encode('utf-8-sig'), file_name="consolidado_ponto.csv", mime="text/csv")
@@ -0,0 +1,116 @@
+import streamlit as st
+
+from cache import bytes_do_arquivo, copia_nomeada, hash_conteudo, ler_cacheado
+from desempenho import etapa
+from paginas.acompanhamento import aguardar_tarefas, enviar_tarefa
+from paginas.tabelas import exibir_tabela
+
+# ==============================================================================
+# PÁGINA: CONFERÊNCIA PIX
+# ==============================================================================
+# O módulo pix (pandas) só é carregado quando os dois arquivos chegam.
+
+def _ler_lancamentos_pix(arquivo):
+    from pix import extrair_lancamentos_pix, ler_planilha_pix
+
+    return extrair_lancamentos_pix(ler_cacheado(arquivo, ler_planilha_pix))
+
+
+def exibir():
+    st.title("💸 Conferência de Pix: Excel vs Extrato BB")
+    st.markdown("""
+    **Instruções:**
+    1. Faça upload da Planilha de Pix (.xlsx ou .csv)
+    2. Faça upload do Extrato do Banco (.csv)
+    3. O sistema irá comparar os valores e indicar a **Linha do Excel** para conferência.
+    """)
+
+    # Upload dos arquivos
+    uploaded_pix = st.file_uploader("Carregar Planilha Pix (Excel .xlsx ou CSV)", type=["xlsx", "csv"])
+    uploaded_bb = st.file_uploader("Carregar Extrato BB (CSV)", type=["csv"])
+    tolerancia_pix = st.number_input("Tolerância de valor (R$)", min_value=0.0, value=0.0, step=0.01, format="%.2f", help="Diferença máxima aceita entre planilha e banco para considerar o lançamento confirmado.")
+
+    if uploaded_pix and uploaded_bb:
+        from pix import ErroExtrato, conciliar_pix, ler_extrato_bb
+
+        st.divider()
+
+        # As duas leituras rodam em paralelo na fila em segundo plano
+        hash_pix = hash_conteudo(bytes_do_arquivo(uploaded_pix))
+        hash_bb = hash_conteudo(bytes_do_arquivo(uploaded_bb))
+        tarefa_pix = enviar_tarefa(
+            ('pix_planilha', hash_pix), _ler_lancamentos_pix,
+            copia_nomeada(uploaded_pix), descricao=f"Planilha Pix: {uploaded_pix.name}",
+        )
+        tarefa_bb = enviar_tarefa(
+            ('pix_extrato', hash_bb), ler_cacheado,
+            copia_nomeada(uploaded_bb), ler_extrato_bb, descricao=f"Extrato BB: {uploaded_bb.name}",
+        )
+        aguardar_tarefas(tarefa_pix, tarefa_bb)
+
+        # --- PROCESSAMENTO DA PLANILHA PIX ---
+        try:
+            pix_entries = tarefa_pix.resultado()
+            
+            if pix_entries.empty:
+                st.warning("⚠️ Nenhum valor encontrado na planilha Pix.")
+            else:
+                st.success(f"✅ Planilha Pix processada: {len(pix_entries)} lançamentos.")
+            
+        except Exception as e:
+            st.error(f"Erro ao ler planilha Pix: {e}")
+            st.stop()
+
+        # --- PROCESSAMENTO DO EXTRATO BB ---
+        try:
+            df_bb_values = tarefa_bb.resultado().copy()
+            st.success(f"✅ Extrato BB processado: {len(df_bb_values)} lançamentos de QR Code.")
+        except ErroExtrato as e:
+            st.error(str(e))
+            st.stop()
+        except Exception as e:
+            st.error(f"Erro ao ler Extrato BB: {e}")
+            st.stop()
+
+        # --- COMPARAÇÃO ---
+        if not pix_entries.empty and not df_bb_values.empty:
+            
+            df_matched, df_missing, df_extra = conciliar_pix(pix_entries, df_bb_values, tolerancia=tolerancia_pix)
+            
+            st.divider()
+            st.subheader("📊 Resultados Detalhados")
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Confirmados", len(df_matched))
+            col2.metric("Faltam no Banco", len(df_missing), delta_color="inverse")
+            col3.metric("Sobram no Banco", len(df_extra), delta_color="off")
+            
+            st.markdown("---")
+            c1, c2 = st.columns(2)
+            
+            with c1:
+                st.subheader("⚠️ Faltam no Extrato BB")
+                st.markdown("**Estão na Planilha (Pix), mas não no Banco.**")
+                if not df_missing.empty:
+                    df_missing = df_missing[['linha', 'coluna', 'valor']]
+                    with etapa('render.pix_faltantes', linhas=len(df_missing)):
+                        exibir_tabela(
+                            df_missing, 'pix_faltam_no_banco', (hash_pix, hash_bb, tolerancia_pix), coluna_valor='valor', altura=500,
+                            column_config={
+                                'linha': st.column_config.NumberColumn("linha", format="%d"),
+                                'valor': st.column_config.NumberColumn("valor", format="R$ %.2f"),
+                            },
+                        )
+                else:
+                    st.info("Nada faltando.")
+                    
+            with c2:
+                st.subheader("❓ Extras no Extrato BB")
+                st.markdown("**Estão no Banco, mas não na Planilha.**")
+                if not df_extra.empty:
+                    with etapa('render.pix_extras', linhas=len(df_extra)):
+                        exibir_tabela(
+                            df_extra, 'pix_sobram_no_banco', (hash_pix, hash_bb, tolerancia_pix), coluna_valor='Valor', altura=500,
+                            column_config={'Valor': st.column_config.NumberColumn("Valor", format="R$ %.2f")},
+                        )
+                else:
+                    st.success("Nada sobrando.")
@@ -0,0 +1,57 @@
+import streamlit as st
+
+from historico_ponto import HistoricoPonto
+
+# ==============================================================================
+# PÁGINA: PAINEL DE ATRASOS (HISTÓRICO DA EMPRESA)
+# ==============================================================================
+
+def exibir():
+    st.title("📈 Painel de Atrasos da Empresa")
+    st.markdown("Consolidado de todas as análises de ponto já feitas (arquivo único ou lote), por funcionário e mês.")
+    historico_ponto = HistoricoPonto()
+    meses_ponto = historico_ponto.meses()
+
+    if not meses_ponto:
+        st.info("Histórico vazio. Analise arquivos de ponto para alimentar o painel.")
+    else:
+        col_f1, col_f2 = st.columns([1, 2])
+        with col_f1:
+            if len(meses_ponto) > 1:
+                mes_inicio, mes_fim = st.select_slider("Período", options=meses_ponto, value=(meses_ponto[0], meses_ponto[-1]))
+            else:
+                mes_inicio = mes_fim = meses_ponto[0]
+                st.caption(f"Período: {mes_inicio}")
+        with col_f2:
+            funcionarios_sel = st.multiselect("Funcionários (vazio = todos)", historico_ponto.funcionarios())
+        filtro = {'mes_inicio': mes_inicio, 'mes_fim': mes_fim, 'funcionarios': funcionarios_sel}
+
+        resumo = historico_ponto.resumo(**filtro)
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Arquivos analisados", resumo['arquivos'])
+        col2.metric("Funcionários", resumo['funcionarios'])
+        col3.metric("Dias com Atraso", resumo['dias_com_atraso'])
+        col4.metric("Total de Ocorrências", resumo['ocorrencias'])
+        st.divider()
+
+        st.markdown("**Ocorrências por mês**")
+        df_mes = historico_ponto.por_mes(**filtro)
+        st.bar_chart(df_mes.set_index('Mês')[['Manhã', 'Almoço']])
+
+        c1, c2 = st.columns(2)
+        with c1:
+            st.markdown("**Por dia da semana**")
+            df_dia = historico_ponto.por_dia_semana(**filtro)
+            st.bar_chart(df_dia.set_index('Dia')[['Manhã', 'Almoço']], sort=False)
+        with c2:
+            st.markdown("**Funcionários com mais ocorrências**")
+            df_func = historico_ponto.por_funcionario(limite=15, **filtro)
+            st.bar_chart(df_func, x='Funcionário', y='Ocorrências', horizontal=True, sort='-Ocorrências')
+
+        st.subheader("🔁 Reincidentes")
+        min_meses = st.number_input("Meses com atraso (mínimo)", min_value=2, value=3, step=1)
+        df_reincidentes = historico_ponto.reincidentes(min_meses, **filtro)
+        if df_reincidentes.empty:
+            st.success("Nenhum funcionário reincidente no período.")
+        else:
+            st.dataframe(df_reincidentes, use_container_width=True, hide_index=True)
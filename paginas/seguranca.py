@@ -0,0 +1,24 @@
+import streamlit as st
+
+# ==============================================================================
+# FUNÇÃO DE SEGURANÇA (SENHA)
+# ==============================================================================
+def check_password():
+    """Retorna True se o usuário tiver a senha correta."""
+    
+    def password_entered():
+        if st.session_state["password"] == "1406":
+            st.session_state["password_correct"] = True
+            del st.session_state["password"]
+        else:
+            st.session_state["password_correct"] = False
+
+    if "password_correct" not in st.session_state:
+        st.text_input("🔒 Área Restrita. Digite a senha:", type="password", on_change=password_entered, key="password")
+        return False
+    elif not st.session_state["password_correct"]:
+        st.text_input("🔒 Área Restrita. Digite a senha:", type="password", on_change=password_entered, key="password")
+        st.error("😕 Senha incorreta.")
+        return False
+    else:
+        return True
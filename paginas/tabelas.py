@@ -0,0 +1,104 @@
+import io
+
+import numpy as np
+import streamlit as st
+
+from cache import CacheLRU
+
+# ==============================================================================
+# TABELAS GRANDES: PAGINAÇÃO, BUSCA E DOWNLOAD
+# ==============================================================================
+# Só a página atual da tabela vai para o navegador, formatada por
+# column_config (sem Styler, que monta a formatação célula a célula). Busca e
+# filtro de valor rodam no servidor. O arquivo completo para download só é
+# gerado no clique e fica guardado pela chave do resultado.
+
+LINHAS_POR_PAGINA = 200
+
+_cache_exportacao = CacheLRU(max_itens=8)
+
+
+def exportar(df, chave, formato):
+    """Bytes do ``df`` em 'csv' (';' e vírgula decimal) ou 'xlsx', gerados uma vez por ``chave``."""
+    encontrado, conteudo = _cache_exportacao.obter((chave, formato))
+    if not encontrado:
+        if formato == 'csv':
+            conteudo = df.to_csv(index=False, sep=';', decimal=',').encode('utf-8-sig')
+        else:
+            buffer = io.BytesIO()
+            df.to_excel(buffer, index=False)
+            conteudo = buffer.getvalue()
+        _cache_exportacao.guardar((chave, formato), conteudo)
+    return conteudo
+
+
+def _texto_busca(serie):
+    # Valores com duas casas ("150.00"), como aparecem na tabela
+    if serie.dtype.kind == 'f':
+        return np.char.mod('%.2f', serie.to_numpy())
+    return serie.astype(str).str.lower().to_numpy(dtype=str)
+
+
+def filtrar(df, busca='', coluna_valor=None, minimo=None, maximo=None):
+    """Linhas com ``busca`` em alguma coluna e ``coluna_valor`` entre ``minimo`` e ``maximo``."""
+    mascara = np.ones(len(df), dtype=bool)
+    if coluna_valor is not None:
+        valores = df[coluna_valor].to_numpy()
+        if minimo is not None:
+            mascara &= valores >= minimo
+        if maximo is not None:
+            mascara &= valores <= maximo
+    termo = busca.strip().lower()
+    if termo:
+        # Aceita vírgula decimal na busca por valor
+        termo_numero = termo.replace('.', '').replace(',', '.') if ',' in termo else termo
+        encontrado = np.zeros(len(df), dtype=bool)
+        for coluna in df.columns:
+            textos = _texto_busca(df[coluna])
+            alvo = termo_numero if df[coluna].dtype.kind == 'f' else termo
+            encontrado |= np.char.find(textos, alvo) >= 0
+        mascara &= encontrado
+    return df if mascara.all() else df[mascara]
+
+
+def exibir_tabela(df, nome, chave_dados, column_config=None, coluna_valor=None, altura='auto'):
+    """Tabela paginada com busca, filtro de valor e download (CSV/XLSX) do resultado completo.
+
+    ``nome`` prefixa as chaves dos widgets e dá nome aos arquivos;
+    ``chave_dados`` identifica o conteúdo de ``df`` (ex.: hashes dos uploads
+    e parâmetros); junto com ``nome``, é a chave dos arquivos já gerados, então
+    duas tabelas do mesmo resultado não trocam de download.
+    """
+    busca = st.text_input("Buscar", key=f"{nome}_busca", placeholder="Linha, coluna ou valor (ex.: 150,00)")
+    minimo = maximo = None
+    if coluna_valor is not None:
+        col_min, col_max = st.columns(2)
+        minimo = col_min.number_input("Valor mínimo", value=None, step=1.0, format="%.2f", key=f"{nome}_minimo")
+        maximo = col_max.number_input("Valor máximo", value=None, step=1.0, format="%.2f", key=f"{nome}_maximo")
+
+    filtrado = filtrar(df, busca, coluna_valor, minimo, maximo)
+    paginas = max(1, -(-len(filtrado) // LINHAS_POR_PAGINA))
+    pagina = 1
+    if paginas > 1:
+        # A chave muda com o número de páginas: um filtro novo volta para a página 1
+        pagina = st.number_input(f"Página (de {paginas})", min_value=1, max_value=paginas, value=1, step=1, key=f"{nome}_pagina_{paginas}")
+    inicio = (pagina - 1) * LINHAS_POR_PAGINA
+    st.dataframe(
+        filtrado.iloc[inicio:inicio + LINHAS_POR_PAGINA], column_config=column_config,
+        height=altura, hide_index=True, use_container_width=True,
+    )
+    filtro = f" (filtradas de {len(df)})" if len(filtrado) != len(df) else ""
+    if filtrado.empty:
+        st.caption(f"Nenhuma linha encontrada{filtro}.")
+    else:
+        st.caption(f"Linhas {inicio + 1}–{min(inicio + LINHAS_POR_PAGINA, len(filtrado))} de {len(filtrado)}{filtro}.")
+
+    col_csv, col_xlsx = st.columns(2)
+    col_csv.download_button(
+        "⬇️ CSV completo", lambda: exportar(df, (nome, chave_dados), 'csv'), file_name=f"{nome}.csv",
+        mime="text/csv", on_click="ignore", key=f"{nome}_csv",
+    )
+    col_xlsx.download_button(
+        "⬇️ Excel completo", lambda: exportar(df, (nome, chave_dados), 'xlsx'), file_name=f"{nome}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", on_click="ignore", key=f"{nome}_xlsx",
+    )
@@ -0,0 +1,81 @@
+import streamlit as st
+
+from cache import ler_cacheado
+from historico_ponto import HistoricoPonto
+from vale import (
+    TABELA_CARGOS, atrasos_por_funcionario, calcular_folha, calcular_vale_funcionario, folha_para_csv, folha_para_xlsx, ler_quadro,
+)
+
+# ==============================================================================
+# PÁGINA: CÁLCULO DE VALE ALIMENTAÇÃO
+# ==============================================================================
+
+def exibir():
+    st.title("💰 Calculadora de Vale Alimentação")
+    modo_vale = st.radio("Modo", ["Individual", "Folha (quadro de funcionários)"], horizontal=True)
+
+    if modo_vale == "Individual":
+        col_input1, col_input2 = st.columns(2)
+        with col_input1: cargo_selecionado = st.selectbox("Selecione o Cargo", list(TABELA_CARGOS.keys()))
+        valor_inicial_atrasos = st.session_state.get('ultimo_total_atrasos', 0)
+        with col_input2: qtd_atrasos = st.number_input("Quantidade Total de Atrasos", min_value=0, value=valor_inicial_atrasos, step=1)
+
+        st.divider()
+        vale = calcular_vale_funcionario(cargo_selecionado, qtd_atrasos)
+
+        st.subheader("Resultado do Cálculo")
+        col_res1, col_res2, col_res3 = st.columns(3)
+        with col_res1: st.metric("Valor Base (30 dias)", f"R$ {vale['valor_base']:.2f}")
+        with col_res2: diferenca = vale['desconto']; st.metric("Desconto / Ajuste", f"R$ {diferenca:.2f}", delta=f"{diferenca:.2f}")
+        with col_res3: st.metric("Valor a Receber", f"R$ {vale['valor_final']:.2f}")
+
+        if vale['nivel'] == "success": st.success(vale['mensagem'])
+        elif vale['nivel'] == "warning": st.warning(vale['mensagem'])
+        else: st.error(vale['mensagem'])
+
+    else:
+        st.markdown("Envie o quadro com as colunas **Funcionário** e **Cargo** (e, se quiser, **Atrasos**). "
+                    "Onde não houver atrasos no quadro, eles vêm da fonte escolhida abaixo, casando pelo nome.")
+        arquivo_quadro = st.file_uploader("Quadro de funcionários (XLSX ou CSV)", type=['csv', 'xlsx'], key="vale_quadro")
+
+        fontes = ["Somente o quadro"]
+        if st.session_state.get('ultimo_lote') is not None:
+            fontes.append("Último lote de ponto")
+        historico_ponto = HistoricoPonto()
+        meses_ponto = historico_ponto.meses()
+        if meses_ponto:
+            fontes.append("Painel de Atrasos (mês)")
+        fonte_atrasos = st.radio("Atrasos de", fontes, horizontal=True)
+
+        atrasos = None
+        if fonte_atrasos == "Último lote de ponto":
+            atrasos = atrasos_por_funcionario(st.session_state['ultimo_lote'])
+        elif fonte_atrasos == "Painel de Atrasos (mês)":
+            mes_vale = st.selectbox("Mês", meses_ponto[::-1])
+            atrasos = atrasos_por_funcionario(historico_ponto.por_funcionario(mes_inicio=mes_vale, mes_fim=mes_vale))
+
+        if arquivo_quadro:
+            try:
+                quadro = ler_cacheado(arquivo_quadro, ler_quadro)
+            except Exception as e:
+                st.error(f"Erro ao ler o quadro: {e}")
+                st.stop()
+
+            folha = calcular_folha(quadro, atrasos)
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Funcionários", len(folha))
+            col2.metric("Com penalidade", int((folha['Desconto'] < 0).sum()))
+            col3.metric("Total Descontos", f"R$ {-folha['Desconto'].sum():.2f}")
+            col4.metric("Total a Pagar", f"R$ {folha['Valor a Receber'].sum():.2f}")
+            if folha['Observação'].notna().any():
+                st.warning(f"{int(folha['Observação'].notna().sum())} funcionário(s) com observação (cargo desconhecido ou sem atrasos apurados).")
+
+            st.dataframe(folha, use_container_width=True, hide_index=True, column_config={
+                "Valor Base": st.column_config.NumberColumn(format="R$ %.2f"),
+                "Desconto": st.column_config.NumberColumn(format="R$ %.2f"),
+                "Valor a Receber": st.column_config.NumberColumn(format="R$ %.2f"),
+            })
+            col_d1, col_d2 = st.columns(2)
+            col_d1.download_button("⬇️ Baixar folha (CSV)", folha_para_csv(folha), file_name="folha_vale_alimentacao.csv", mime="text/csv")
+            col_d2.download_button("⬇️ Baixar folha (Excel)", folha_para_xlsx(folha), file_name="folha_vale_alimentacao.xlsx",
+                                   mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
@@ -0,0 +1,403 @@
+import bisect
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from desempenho import cronometrado
+from leitura import amostra_do_arquivo, detectar_encoding, ler_planilha, tipo_arquivo
+from tarefas import informar_progresso
+
+# ==============================================================================
+# PLANILHA PIX
+# ==============================================================================
+
+@cronometrado('pix.leitura_planilha', contagem=lambda df: {'linhas': len(df)})
+def ler_planilha_pix(arquivo):
+    informar_progresso(0.05, "Lendo a planilha Pix...")
+    return ler_planilha(arquivo)
+
+
+# Pares (coluna do rótulo, coluna do valor) do layout original: C/D e H/I
+PARES_PIX = ((2, 3), (7, 8))
+
+# Outros pares entram se, nas linhas com as duas células preenchidas, ao menos
+# esta fração tiver texto no rótulo e número no valor
+MIN_FRACAO_PAR = 0.9
+MIN_LANCAMENTOS_PAR = 3
+
+COLUNAS_LANCAMENTOS = ['valor', 'centavos', 'linha', 'coluna']
+
+
+def letra_coluna(indice):
+    """Letra da coluna no Excel para o índice (0 -> 'A', 26 -> 'AA')."""
+    letras = ''
+    indice += 1
+    while indice:
+        indice, resto = divmod(indice - 1, 26)
+        letras = chr(ord('A') + resto) + letras
+    return letras
+
+
+def _coluna_de_valores(serie):
+    # Só colunas numéricas ou de células mistas (object/texto). pd.to_numeric
+    # transformaria datas em nanossegundos e booleanos em 0/1
+    if pd.api.types.is_bool_dtype(serie):
+        return False
+    return (
+        pd.api.types.is_numeric_dtype(serie) or pd.api.types.is_object_dtype(serie)
+        or pd.api.types.is_string_dtype(serie)
+    )
+
+
+def _par_preenchido(df_pix, col_rotulo, col_valor):
+    par = df_pix[[col_rotulo, col_valor]].dropna()
+    if not _coluna_de_valores(df_pix[col_valor]):
+        return par[col_rotulo], pd.Series(np.nan, index=par.index)
+    return par[col_rotulo], pd.to_numeric(par[col_valor], errors='coerce')
+
+
+def detectar_pares_pix(df_pix):
+    """Pares (rótulo, valor) da planilha: os de ``PARES_PIX`` e outros com o mesmo formato.
+
+    Um par extra é uma coluna de textos seguida de uma coluna de números, em
+    pelo menos ``MIN_LANCAMENTOS_PAR`` linhas e ``MIN_FRACAO_PAR`` das linhas
+    em que as duas estão preenchidas.
+    """
+    colunas = list(df_pix.columns)
+    pares = [par for par in PARES_PIX if par[1] in colunas]
+    ocupadas = {c for par in pares for c in par}
+    for col_rotulo, col_valor in zip(colunas, colunas[1:]):
+        if col_rotulo in ocupadas or col_valor in ocupadas:
+            continue
+        rotulos, valores = _par_preenchido(df_pix, col_rotulo, col_valor)
+        if len(rotulos) < MIN_LANCAMENTOS_PAR:
+            continue
+        rotulo_texto = rotulos.map(type).eq(str) & pd.to_numeric(rotulos, errors='coerce').isna()
+        validos = int((rotulo_texto & valores.notna()).sum())
+        if validos >= MIN_LANCAMENTOS_PAR and validos >= MIN_FRACAO_PAR * len(rotulos):
+            pares.append((col_rotulo, col_valor))
+            ocupadas.update((col_rotulo, col_valor))
+    return sorted(pares)
+
+
+@cronometrado('pix.extracao', contagem=lambda lancamentos: {'lancamentos': len(lancamentos)})
+def extrair_lancamentos_pix(df_pix, pares=None):
+    """Lançamentos dos pares de colunas (rótulo, valor), sem as linhas de "Total".
+
+    Por padrão os pares vêm de ``detectar_pares_pix`` (C/D, H/I e outros do
+    mesmo formato). Retorna DataFrame com 'valor', 'centavos' (int64), 'linha'
+    (linha do Excel) e 'coluna' (letra da coluna do valor), par a par e na
+    ordem das linhas. Valores que não são números são ignorados.
+    """
+    blocos = []
+    for col_rotulo, col_valor in (detectar_pares_pix(df_pix) if pares is None else pares):
+        rotulos, valores = _par_preenchido(df_pix, col_rotulo, col_valor)
+        manter = valores.notna() & ~rotulos.astype(str).str.contains("Total", regex=False)
+        valores = valores[manter].astype(float)
+        blocos.append(pd.DataFrame({
+            'valor': valores.to_numpy(),
+            'centavos': para_centavos(valores),
+            'linha': (valores.index.to_numpy() + 1).astype('int32'),
+            'coluna': letra_coluna(col_valor),
+        }))
+
+    if not blocos:
+        return pd.DataFrame({c: pd.Series(dtype=t) for c, t in zip(COLUNAS_LANCAMENTOS, ['float64', 'int64', 'int32', 'category'])})
+    lancamentos = pd.concat(blocos, ignore_index=True)
+    lancamentos['coluna'] = lancamentos['coluna'].astype('category')
+    return lancamentos
+
+# ==============================================================================
+# LEITURA DO EXTRATO BB (STREAMING)
+# ==============================================================================
+
+class ErroExtrato(Exception):
+    """Extrato BB ilegível ou fora do layout esperado (mensagem pronta para exibição)."""
+
+
+COL_HISTORICO_BB = 9
+COL_VALOR_BB = 10
+# Layout fixo do BB: o separador não é detectado (a vírgula decimal dos valores
+# confundiria a detecção em arquivos sem aspas)
+SEP_BB = ';'
+FILTRO_PIX_BB = "Pix-Recebido QR Code"
+
+
+def converter_numero_br(serie):
+    """Converte textos no formato brasileiro ("1.234,56") em float; inválidos viram NaN."""
+    texto = serie.astype(str).str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+    return pd.to_numeric(texto, errors='coerce')
+
+
+def _valores_pix_bb(arquivo, encoding, tamanho_bloco, posicao, tamanho):
+    valores = []
+    blocos = pd.read_csv(
+        arquivo, sep=SEP_BB, header=None, encoding=encoding, dtype=str,
+        usecols=[COL_HISTORICO_BB, COL_VALOR_BB], chunksize=tamanho_bloco,
+    )
+    for bloco in blocos:
+        mask = bloco[COL_HISTORICO_BB].str.contains(FILTRO_PIX_BB, case=False, na=False, regex=False)
+        valores.append(converter_numero_br(bloco.loc[mask, COL_VALOR_BB]).dropna())
+        # Bytes já consumidos pelo parser (aproximado: ele lê à frente)
+        lidos = arquivo.tell() - posicao
+        informar_progresso(0.95 * lidos / tamanho if tamanho else 0.0, f"Extrato BB: {lidos / 2**20:.1f} de {tamanho / 2**20:.1f} MB lidos")
+    return valores
+
+
+@cronometrado('pix.leitura_extrato', contagem=lambda df: {'lancamentos': len(df)})
+def ler_extrato_bb(arquivo, tamanho_bloco=100_000):
+    """Lê do extrato BB só os valores de "Pix-Recebido QR Code", em blocos.
+
+    Detecta o encoding uma vez pelo início do arquivo e carrega apenas as colunas
+    de histórico e valor, filtrando cada bloco assim que é lido; a memória usada
+    não cresce com o tamanho do extrato. Retorna DataFrame com a coluna 'Valor'.
+    """
+    if tipo_arquivo(arquivo) != 'csv':
+        raise ErroExtrato("❌ O extrato do Banco deve ser o CSV exportado pelo BB.")
+    encoding = detectar_encoding(amostra_do_arquivo(arquivo))
+    posicao = arquivo.tell()
+    tamanho = arquivo.seek(0, 2) - posicao
+    arquivo.seek(posicao)
+
+    try:
+        try:
+            valores = _valores_pix_bb(arquivo, encoding, tamanho_bloco, posicao, tamanho)
+        except UnicodeDecodeError:
+            if encoding == 'latin1':
+                raise
+            # Início em ASCII/UTF-8, mas um byte latin1 mais adiante ("Transferência"):
+            # descarta os blocos lidos e recomeça uma única vez em latin1
+            arquivo.seek(posicao)
+            valores = _valores_pix_bb(arquivo, 'latin1', tamanho_bloco, posicao, tamanho)
+    except ValueError as e:
+        # usecols fora do arquivo: menos colunas que o layout do BB
+        if 'usecols' in str(e).lower():
+            raise ErroExtrato("❌ Arquivo do Banco inválido.") from e
+        raise
+
+    serie = pd.concat(valores, ignore_index=True) if valores else pd.Series(dtype=float)
+    return pd.DataFrame({'Valor': serie.astype(float)})
+
+# ==============================================================================
+# CONCILIAÇÃO PIX (PLANILHA x EXTRATO BB)
+# ==============================================================================
+# Os valores são comparados em centavos inteiros: 10.1 e 10.10000001 viram 1010
+# e casam, ao contrário da comparação exata de floats.
+
+# Separa centavos e dias numa única chave ordenável (valor, data)
+_ESCALA_CHAVE = 10**6
+
+
+def para_centavos(valores):
+    """Converte valores em reais (floats) para centavos inteiros (int64)."""
+    return np.rint(np.asarray(valores, dtype=float) * 100).astype('int64')
+
+
+def _em_dias(datas):
+    return pd.to_datetime(pd.Series(datas)).to_numpy(dtype='datetime64[D]').astype('int64')
+
+
+def _parear_exato(centavos_pix, centavos_bb):
+    # k-ésima ocorrência de um valor na planilha casa com a k-ésima ocorrência no extrato,
+    # na ordem original (mesmo resultado do antigo "val in bb_pool / bb_pool.remove(val)")
+    pix = pd.DataFrame({'c': centavos_pix, 'pos_pix': np.arange(len(centavos_pix))})
+    bb = pd.DataFrame({'c': centavos_bb, 'pos_bb': np.arange(len(centavos_bb))})
+    pix['k'] = pix.groupby('c').cumcount()
+    bb['k'] = bb.groupby('c').cumcount()
+    pares = pix.merge(bb, on=['c', 'k'], how='inner')
+    return pares['pos_pix'].to_numpy(), pares['pos_bb'].to_numpy()
+
+
+def _proximo_livre(proximo, k):
+    # Primeira posição livre a partir de k, com compressão de caminho
+    raiz = k
+    while proximo[raiz] != raiz:
+        raiz = proximo[raiz]
+    while proximo[k] != raiz:
+        proximo[k], k = raiz, proximo[k]
+    return raiz
+
+
+def _parear_ordenado(chaves_a, chaves_b, tolerancia, datas_a=None, datas_b=None, janela_dias=None):
+    """Casamento guloso de duas listas por chave com |a - b| <= tolerancia.
+
+    Percorre as duas listas ordenadas (dois ponteiros); cada elemento de ``a``
+    fica com o primeiro elemento livre de ``b`` dentro da janela, o que (sem
+    datas) maximiza o número de pares. Se houver datas e ``janela_dias``, o par também precisa
+    respeitar a distância máxima em dias (ver ``_parear_ordenado_com_datas``).
+    Retorna posições originais (pos_a, pos_b).
+    """
+    if janela_dias is not None and datas_a is not None and datas_b is not None:
+        return _parear_ordenado_com_datas(chaves_a, chaves_b, tolerancia, datas_a, datas_b, janela_dias)
+
+    ordem_a = np.argsort(chaves_a, kind='stable')
+    ordem_b = np.argsort(chaves_b, kind='stable')
+    a = chaves_a[ordem_a].tolist()
+    b = chaves_b[ordem_b].tolist()
+
+    pares_a, pares_b = [], []
+    j = 0
+    for i, chave in enumerate(a):
+        while j < len(b) and b[j] < chave - tolerancia:
+            j += 1
+        if j < len(b) and b[j] <= chave + tolerancia:
+            pares_a.append(i)
+            pares_b.append(j)
+            j += 1
+
+    return ordem_a[np.asarray(pares_a, dtype='int64')], ordem_b[np.asarray(pares_b, dtype='int64')]
+
+
+def _parear_ordenado_com_datas(chaves_a, chaves_b, tolerancia, datas_a, datas_b, janela_dias):
+    # ``b`` é agrupado por valor e, dentro de cada valor, ordenado por data. Para
+    # cada ``a`` (em ordem de valor) só são visitados os valores de ``b`` ainda
+    # com lançamentos livres dentro da tolerância; em cada um, uma busca binária
+    # acha a primeira data da janela e ponteiros "próximo livre" pulam os já
+    # casados. Nenhum lançamento recusado pela data é revisitado: o custo é
+    # O((n + m) log m) vezes o número de valores distintos na tolerância
+    # (no máximo 2 * tolerancia + 1 centavos), em vez de O(n * m).
+    ordem_a = np.lexsort((datas_a, chaves_a))
+    ordem_b = np.lexsort((datas_b, chaves_b))
+    a = chaves_a[ordem_a]
+    da = datas_a[ordem_a].tolist()
+    vb = chaves_b[ordem_b]
+    db = datas_b[ordem_b].tolist()
+
+    valores, inicio = np.unique(vb, return_index=True)
+    fim = np.append(inicio[1:], len(vb)).tolist()
+    primeiro_grupo = np.searchsorted(valores, a - tolerancia, side='left').tolist()
+    alem_do_grupo = np.searchsorted(valores, a + tolerancia, side='right').tolist()
+    inicio = inicio.tolist()
+
+    proximo = list(range(len(db) + 1))
+    # Grupos (valores de ``b``) já esgotados também são pulados
+    proximo_grupo = list(range(len(valores) + 1))
+    pares_a, pares_b = [], []
+    for i, data in enumerate(da):
+        g = _proximo_livre(proximo_grupo, primeiro_grupo[i])
+        while g < alem_do_grupo[i]:
+            k = _proximo_livre(proximo, bisect.bisect_left(db, data - janela_dias, inicio[g], fim[g]))
+            if k < fim[g] and db[k] <= data + janela_dias:
+                pares_a.append(i)
+                pares_b.append(k)
+                proximo[k] = k + 1
+                if _proximo_livre(proximo, inicio[g]) >= fim[g]:
+                    proximo_grupo[g] = g + 1
+                break
+            g = _proximo_livre(proximo_grupo, g + 1)
+
+    return ordem_a[np.asarray(pares_a, dtype='int64')], ordem_b[np.asarray(pares_b, dtype='int64')]
+
+
+def _parear_mais_proximo(chaves_a, chaves_b, janela):
+    """Casa chaves de ``a`` com chaves de ``b`` (|a - b| <= janela), sempre o par mais próximo primeiro.
+
+    Com chaves (centavos, dia), só há pares do mesmo valor, e os de datas mais
+    próximas saem antes, seja qual for o lado que tem mais lançamentos; no
+    empate fica o mais antigo. Na sequência ordenada das duas listas juntas, o
+    par livre mais próximo é sempre de vizinhos: um heap guarda a distância dos
+    vizinhos de lados opostos e uma lista ligada tira os já casados. Sem limite
+    de janela, cada valor casa o máximo de lançamentos. Retorna posições
+    originais (pos_a, pos_b).
+    """
+    chaves = np.concatenate([chaves_a, chaves_b])
+    ordem = np.argsort(chaves, kind='stable')
+    valores = chaves[ordem].tolist()
+    de_b = (ordem >= len(chaves_a)).tolist()
+    n = len(valores)
+    anterior = list(range(-1, n - 1))
+    proximo = list(range(1, n + 1))
+    livre = [True] * n
+
+    heap = [
+        (valores[i + 1] - valores[i], i, i + 1) for i in range(n - 1)
+        if de_b[i] != de_b[i + 1] and valores[i + 1] - valores[i] <= janela
+    ]
+    heapq.heapify(heap)
+    pares_a, pares_b = [], []
+    while heap:
+        _, i, j = heapq.heappop(heap)
+        if not (livre[i] and livre[j]):
+            continue
+        livre[i] = livre[j] = False
+        if de_b[i]:
+            i, j = j, i
+        pares_a.append(i)
+        pares_b.append(j)
+        # Os vizinhos de fora do par passam a ser vizinhos entre si
+        esquerda, direita = anterior[min(i, j)], proximo[max(i, j)]
+        if esquerda >= 0:
+            proximo[esquerda] = direita
+        if direita < n:
+            anterior[direita] = esquerda
+        if esquerda >= 0 and direita < n and de_b[esquerda] != de_b[direita] and valores[direita] - valores[esquerda] <= janela:
+            heapq.heappush(heap, (valores[direita] - valores[esquerda], esquerda, direita))
+
+    pos_a = ordem[np.asarray(pares_a, dtype='int64')]
+    pos_b = ordem[np.asarray(pares_b, dtype='int64')] - len(chaves_a)
+    return pos_a, pos_b
+
+
+@cronometrado('pix.conciliacao', contagem=lambda r: {'confirmados': len(r[0]), 'faltantes': len(r[1]), 'extras': len(r[2])})
+def conciliar_pix(df_pix, df_bb, tolerancia=0.0, janela_dias=None):
+    """Concilia os lançamentos da planilha Pix com os do extrato BB.
+
+    ``df_pix`` precisa da coluna 'valor' (a coluna 'centavos' de
+    ``extrair_lancamentos_pix``, se houver, é usada direto) e ``df_bb`` da
+    coluna 'Valor'; uma coluna 'data' (sem vazios) nos dois lados ativa o pareamento por proximidade
+    de datas. ``tolerancia`` é em reais (0 = só valores idênticos em centavos).
+
+    Retorna (df_conciliados, df_faltantes, df_extras): faltantes na ordem da
+    planilha e extras na ordem do extrato, como na comparação original.
+    """
+    centavos_pix = df_pix['centavos'].to_numpy() if 'centavos' in df_pix.columns else para_centavos(df_pix['valor'])
+    centavos_bb = para_centavos(df_bb['Valor'])
+    tol_centavos = int(round(tolerancia * 100))
+
+    tem_datas = (
+        'data' in df_pix.columns and 'data' in df_bb.columns
+        and df_pix['data'].notna().all() and df_bb['data'].notna().all()
+    )
+    datas_pix = _em_dias(df_pix['data']) if tem_datas else None
+    datas_bb = _em_dias(df_bb['data']) if tem_datas else None
+
+    # 1ª etapa: valores idênticos
+    if tem_datas:
+        # Chave composta (centavos, dia): dentro do mesmo valor, pareia as datas mais próximas
+        janela = janela_dias if janela_dias is not None else _ESCALA_CHAVE // 2 - 1
+        pos_pix, pos_bb = _parear_mais_proximo(
+            centavos_pix * _ESCALA_CHAVE + datas_pix,
+            centavos_bb * _ESCALA_CHAVE + datas_bb,
+            janela,
+        )
+    else:
+        pos_pix, pos_bb = _parear_exato(centavos_pix, centavos_bb)
+
+    # 2ª etapa: sobras dentro da tolerância
+    if tol_centavos > 0:
+        livres_pix = np.setdiff1d(np.arange(len(centavos_pix)), pos_pix)
+        livres_bb = np.setdiff1d(np.arange(len(centavos_bb)), pos_bb)
+        if len(livres_pix) and len(livres_bb):
+            extra_pix, extra_bb = _parear_ordenado(
+                centavos_pix[livres_pix], centavos_bb[livres_bb], tol_centavos,
+                datas_pix[livres_pix] if tem_datas else None,
+                datas_bb[livres_bb] if tem_datas else None,
+                janela_dias,
+            )
+            pos_pix = np.concatenate([pos_pix, livres_pix[extra_pix]])
+            pos_bb = np.concatenate([pos_bb, livres_bb[extra_bb]])
+
+    conciliados_pix = np.zeros(len(centavos_pix), dtype=bool)
+    conciliados_pix[pos_pix] = True
+    conciliados_bb = np.zeros(len(centavos_bb), dtype=bool)
+    conciliados_bb[pos_bb] = True
+
+    ordem = np.argsort(pos_pix, kind='stable')
+    df_conciliados = df_pix.iloc[pos_pix[ordem]].reset_index(drop=True)
+    df_conciliados['valor_banco'] = df_bb['Valor'].to_numpy()[pos_bb[ordem]]
+    df_conciliados['diferenca'] = (centavos_bb[pos_bb[ordem]] - centavos_pix[pos_pix[ordem]]) / 100
+
+    df_faltantes = df_pix[~conciliados_pix].reset_index(drop=True)
+    df_extras = df_bb[~conciliados_bb].reset_index(drop=True)
+    return df_conciliados, df_faltantes, df_extras
@@ -0,0 +1,516 @@
+import numpy as np
+import pandas as pd
+from datetime import timedelta
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from cache import ler_cacheado
+from desempenho import cronometrado, etapa
+from leitura import ler_planilha_podada
+from tarefas import informar_progresso
+
+# ==============================================================================
+# ANÁLISE DE PONTO (SEM DEPENDÊNCIA DO STREAMLIT)
+# ==============================================================================
+
+class ErroPonto(Exception):
+    """Erro de leitura ou de estrutura do arquivo de ponto (mensagem pronta para exibição)."""
+
+
+# ==============================================================================
+# LEITURA DOS HORÁRIOS (HH:MM[:SS]) COM MEMO
+# ==============================================================================
+# O relógio de ponto só produz algumas centenas de textos distintos ("08:03",
+# "12:00"...), repetidos em todos os dias de todos os arquivos. Cada texto é
+# interpretado uma vez e o resultado fica guardado numa tabela limitada.
+
+_MAX_MEMO_HORARIOS = 4096
+_RE_NAO_HORARIO = re.compile(r'[^\d:]')
+
+
+# Gramática de strptime("%H:%M") / strptime("%H:%M:%S"), usada fora do ASCII
+_RE_HORARIO = re.compile(r'(2[0-3]|[0-1]\d|\d):([0-5]\d|\d)(?::([0-5]\d|\d))?')
+
+
+def _interpretar_horario(s):
+    if not s.isascii():
+        # Dígitos não ASCII ("٣") seguem exatamente as regras do strptime
+        m = _RE_HORARIO.fullmatch(s)
+        return None if m is None else int(m[1]) * 3600 + int(m[2]) * 60 + int(m[3] or 0)
+
+    # Caminho rápido: 1 ou 2 dígitos por campo, hora 0-23, minuto e segundo 0-59
+    partes = s.split(':')
+    if len(partes) not in (2, 3):
+        return None
+    for p in partes:
+        if not (0 < len(p) <= 2 and p.isdigit()):
+            return None
+    horas, minutos = int(partes[0]), int(partes[1])
+    segundos = int(partes[2]) if len(partes) == 3 else 0
+    if horas > 23 or minutos > 59 or segundos > 59:
+        return None
+    return horas * 3600 + minutos * 60 + segundos
+
+
+@lru_cache(maxsize=_MAX_MEMO_HORARIOS)
+def _segundos_do_texto(texto):
+    s = texto.strip()
+    segundos = _interpretar_horario(s)
+    if segundos is None:
+        # Caminho lento: remove caracteres inválidos ("*13:20", "08:00 h") e tenta de novo
+        limpo = _RE_NAO_HORARIO.sub('', s)
+        if limpo != s:
+            segundos = _interpretar_horario(limpo)
+    return segundos
+
+
+def segundos_horario(valor_celula):
+    """Segundos desde 00:00 de uma célula de horário (int), ou None se vazia/inválida."""
+    if pd.isna(valor_celula): return None
+    return _segundos_do_texto(str(valor_celula))
+
+
+def limpar_celula_tempo(valor_celula):
+    segundos = segundos_horario(valor_celula)
+    if segundos is None: return None
+    return timedelta(seconds=segundos)
+
+
+def estatisticas_memo_horarios():
+    """Acertos, falhas e tamanho da tabela de horários já interpretados."""
+    info = _segundos_do_texto.cache_info()
+    return {'acertos': info.hits, 'falhas': info.misses, 'itens': info.currsize, 'max_itens': info.maxsize}
+
+
+def formatar_visual(td):
+    if td is None: return ""
+    total_segundos = int(td.total_seconds())
+    horas = total_segundos // 3600
+    minutos = (total_segundos % 3600) // 60
+    return f"{horas:02d}:{minutos:02d}"
+
+# ==============================================================================
+# MOTOR VETORIZADO DE ATRASOS
+# ==============================================================================
+
+def converter_tempo_segundos(serie):
+    """Versão em lote de limpar_celula_tempo: segundos desde 00:00 (NaN se inválido).
+
+    Cada texto distinto da coluna é interpretado uma única vez e o resultado é
+    espalhado de volta para as linhas.
+    """
+    validos = serie[serie.notna()]
+    codigos, unicos = pd.factorize(validos.astype(str))
+    tabela = np.array([_segundos_do_texto(u) for u in unicos], dtype=float)  # None -> NaN
+    return pd.Series(tabela[codigos], index=validos.index).reindex(serie.index)
+
+def _formatar_segundos(segundos):
+    # Mesmo formato de formatar_visual, a partir de segundos inteiros
+    return f"{int(segundos) // 3600:02d}:{(int(segundos) % 3600) // 60:02d}"
+
+def _padrao_em_segundos(td):
+    # timedelta nulo é "falso" no cálculo original, então vira ausente
+    return td.total_seconds() if td else float('nan')
+
+class BatidasPonto:
+    """Batidas de um arquivo já interpretadas, prontas para comparar com um horário padrão.
+
+    É o artefato intermediário da análise: trocar a tolerância, a duração do
+    almoço ou o horário padrão só refaz a comparação, sem reler o arquivo.
+    ``ent1``, ``sai1`` e ``ent2`` são arrays de segundos (NaN se vazio/inválido).
+    """
+
+    def __init__(self, nome, agendamento, datas, dias, ent1, sai1, ent2):
+        self.nome = nome
+        self.agendamento = agendamento
+        self.datas = datas
+        self.dias = dias
+        self.ent1 = ent1
+        self.sai1 = sai1
+        self.ent2 = ent2
+
+    def __len__(self):
+        return len(self.dias)
+
+
+def montar_batidas(nome, markers, agendamento, linhas_dados):
+    """Interpreta as linhas de batidas ("01/03/2024 - Seg" + horários) em um ``BatidasPonto``."""
+    # Data e dia da semana ("01/03/2024 - Seg")
+    col_data = linhas_dados[0].astype(str)
+    partes = col_data[col_data.str.contains('-', regex=False)].str.split('-')
+    data_val = partes.str[0].str.strip()
+    dow_val = partes.str[1].str.strip()
+
+    eh_sab = dow_val.str.contains('Sáb', regex=False) | dow_val.str.contains('Sab', regex=False)
+    eh_dom = dow_val.str.contains('Dom', regex=False)
+    chave_dow = dow_val.mask(eh_dom, 'Dom').mask(eh_sab, 'Sáb')
+
+    linhas = linhas_dados.loc[chave_dow.index]
+    real_ent1, real_sai1, real_ent2 = (
+        converter_tempo_segundos(linhas[markers[col]]).to_numpy(dtype=float)
+        for col in ('col_ent1_real', 'col_sai1_real', 'col_ent2_real')
+    )
+    return BatidasPonto(
+        nome, agendamento, data_val.to_numpy(dtype=object), chave_dow.to_numpy(dtype=object),
+        real_ent1, real_sai1, real_ent2,
+    )
+
+
+def _excessos(batidas, agendamento, duracao_almoco):
+    # Quanto cada batida passou do horário esperado (segundos, NaN quando a regra
+    # não se aplica). Há ocorrência quando o excesso é maior que a tolerância.
+    dias_validos = [dia for dia, padrao in agendamento.items() if padrao is not None]
+    linhas = np.flatnonzero(pd.Series(batidas.dias).isin(dias_validos).to_numpy())
+    dias = batidas.dias[linhas]
+
+    # Horário padrão de cada linha (junção por dia da semana)
+    std_ent1, std_sai1, std_ent2 = (
+        pd.Series(dias).map({dia: _padrao_em_segundos(agendamento[dia][campo]) for dia in dias_validos}).to_numpy(dtype=float)
+        for campo in ('std_ent1', 'std_sai1', 'std_ent2')
+    )
+    real_ent1, real_sai1, real_ent2 = batidas.ent1[linhas], batidas.sai1[linhas], batidas.ent2[linhas]
+    almoco = std_ent2 - std_sai1 if duracao_almoco is None else duracao_almoco.total_seconds()
+
+    # Comparações com NaN resultam em False: células vazias/inválidas (e 00:00, que é
+    # "falso" no cálculo original) nunca geram ocorrência
+    with np.errstate(invalid='ignore'):
+        # Atraso Entrada Manhã
+        aplica_manha = (std_ent1 > 0) & (real_ent1 > 0)
+        excesso_manha = np.where(aplica_manha, real_ent1 - std_ent1, np.nan)
+
+        # Atraso Volta Almoço
+        limite_almoco = real_sai1 + almoco
+        aplica_almoco = (std_ent2 > 0) & (std_sai1 > 0) & (real_sai1 > 0) & (real_ent2 > 0)
+        excesso_almoco = np.where(aplica_almoco, real_ent2 - limite_almoco, np.nan)
+
+    return linhas, excesso_manha, excesso_almoco, limite_almoco
+
+
+def _comparar_batidas(batidas, tolerancia=timedelta(minutes=5), agendamento=None, duracao_almoco=None):
+    agendamento = {**batidas.agendamento, **(agendamento or {})}
+    linhas, excesso_manha, excesso_almoco, limite_almoco = _excessos(batidas, agendamento, duracao_almoco)
+    if len(linhas) == 0:
+        return pd.DataFrame(), 0
+
+    tol = tolerancia.total_seconds()
+    with np.errstate(invalid='ignore'):
+        atraso_manha = excesso_manha > tol
+        atraso_almoco = excesso_almoco > tol
+
+    com_atraso = np.flatnonzero(atraso_manha | atraso_almoco)
+    if len(com_atraso) == 0:
+        return pd.DataFrame(), 0
+
+    # Só as linhas com ocorrência são formatadas
+    real_ent1, real_ent2 = batidas.ent1[linhas], batidas.ent2[linhas]
+    detalhes = []
+    for i in com_atraso:
+        motivos = []
+        if atraso_manha[i]:
+            motivos.append(f"Manhã ({_formatar_segundos(real_ent1[i])})")
+        if atraso_almoco[i]:
+            motivos.append(f"Volta Almoço (Lim {_formatar_segundos(limite_almoco[i] + tol)} vs Real {_formatar_segundos(real_ent2[i])})")
+        detalhes.append(", ".join(motivos))
+
+    qtd = atraso_manha[com_atraso].astype('int64') + atraso_almoco[com_atraso].astype('int64')
+    df_atrasos = pd.DataFrame({
+        'Data': batidas.datas[linhas][com_atraso],
+        'Dia': batidas.dias[linhas][com_atraso],
+        'Qtd': qtd,
+        'Detalhes': detalhes,
+    })
+    return df_atrasos, int(qtd.sum())
+
+
+def comparar_batidas(batidas, tolerancia=timedelta(minutes=5), agendamento=None, duracao_almoco=None):
+    """Compara as batidas com o horário padrão e retorna (df_atrasos, total_ocorrencias).
+
+    ``agendamento`` substitui, por dia da semana, o horário padrão lido do
+    arquivo (mesmo formato: {'Seg': {'std_ent1': timedelta, ...}}).
+    ``duracao_almoco`` (timedelta) substitui o intervalo padrão SAÍDA 1 -> ENTRADA 2.
+    """
+    with etapa('ponto.comparacao', linhas=len(batidas)) as medida:
+        df_atrasos, total = _comparar_batidas(batidas, tolerancia, agendamento, duracao_almoco)
+        medida['ocorrencias'] = total
+    return df_atrasos, total
+
+
+@cronometrado('ponto.varredura')
+def varrer_tolerancias(batidas, minutos=range(0, 31), agendamento=None, duracao_almoco=None):
+    """Contagem de ocorrências para várias tolerâncias (em minutos) de uma só vez.
+
+    Os excessos de cada batida são calculados uma vez e ordenados; a contagem
+    para cada tolerância é uma busca binária. Retorna um DataFrame com uma
+    linha por tolerância.
+    """
+    agendamento = {**batidas.agendamento, **(agendamento or {})}
+    _, excesso_manha, excesso_almoco, _ = _excessos(batidas, agendamento, duracao_almoco)
+    tolerancias = np.asarray(list(minutos), dtype=float) * 60
+
+    def contar_acima(excessos):
+        ordenados = np.sort(excessos[~np.isnan(excessos)])
+        return len(ordenados) - np.searchsorted(ordenados, tolerancias, side='right')
+
+    manha = contar_acima(excesso_manha)
+    almoco = contar_acima(excesso_almoco)
+    return pd.DataFrame({
+        'Tolerância (min)': list(minutos),
+        'Dias com Atraso': contar_acima(np.fmax(excesso_manha, excesso_almoco)),
+        'Atrasos Manhã': manha,
+        'Atrasos Almoço': almoco,
+        'Total de Ocorrências': manha + almoco,
+    })
+
+
+DIAS_AGENDAMENTO = ['Seg', 'Ter', 'Qua', 'Qui', 'Sex', 'Sáb', 'Dom']
+_CAMPOS_AGENDAMENTO = {'std_ent1': 'Entrada 1', 'std_sai1': 'Saída 1', 'std_ent2': 'Entrada 2'}
+
+
+def _texto_horario(td):
+    if td is None:
+        return None
+    segundos = int(td.total_seconds())
+    texto = f"{segundos // 3600:02d}:{segundos % 3600 // 60:02d}"
+    return texto if segundos % 60 == 0 else f"{texto}:{segundos % 60:02d}"
+
+
+def agendamento_para_tabela(agendamento):
+    """Horário padrão como tabela editável (uma linha por dia, horários em texto HH:MM)."""
+    linhas = []
+    for dia in DIAS_AGENDAMENTO:
+        padrao = agendamento.get(dia) or {}
+        linhas.append({'Dia': dia, **{rotulo: _texto_horario(padrao.get(campo)) for campo, rotulo in _CAMPOS_AGENDAMENTO.items()}})
+    return pd.DataFrame(linhas)
+
+
+def tabela_para_agendamento(tabela):
+    """Inverso de ``agendamento_para_tabela``; dias sem nenhum horário ficam sem expediente (None)."""
+    agendamento = {}
+    for _, linha in tabela.iterrows():
+        padrao = {}
+        for campo, rotulo in _CAMPOS_AGENDAMENTO.items():
+            segundos = segundos_horario(linha[rotulo])
+            padrao[campo] = None if segundos is None else timedelta(seconds=segundos)
+        agendamento[linha['Dia']] = padrao if any(v is not None for v in padrao.values()) else None
+    return agendamento
+
+
+def detectar_atrasos(linhas_dados, markers, agendamento, tolerancia):
+    """Compara as batidas com o horário padrão e retorna (df_atrasos, total_ocorrencias).
+
+    Trabalha em colunas inteiras (segundos) em vez de linha a linha; o resultado
+    é idêntico ao do laço original com iterrows/limpar_celula_tempo.
+    """
+    return comparar_batidas(montar_batidas(None, markers, agendamento, linhas_dados), tolerancia)
+
+# ==============================================================================
+# LOCALIZAÇÃO DAS ÂNCORAS (SEG / ENTRADA 1) COM CACHE DE LAYOUT
+# ==============================================================================
+# Todas as exportações do relógio de ponto seguem o mesmo modelo; depois que as
+# âncoras de um modelo são encontradas, os próximos arquivos só conferem as
+# células guardadas em vez de varrer o cabeçalho inteiro.
+
+_MAX_MODELOS_LAYOUT = 8
+_modelos_layout = OrderedDict()  # posições das âncoras -> impressão digital esperada
+_lock_layout = threading.Lock()
+_estatisticas_layout = {'acertos': 0, 'falhas': 0}
+
+def _normalizar_bloco(df, n_linhas):
+    # Uma passada só: mesmo texto que str(val).strip().upper() produziria, como matriz de strings
+    bloco = df.head(n_linhas).to_numpy(dtype=object)
+    textos = [str(v).strip().upper() for v in bloco.ravel()]
+    return np.array(textos, dtype=str).reshape(bloco.shape)
+
+def _texto_celula(df, r, c):
+    if r >= len(df) or c >= len(df.columns): return None
+    return str(df.iat[r, c]).strip().upper()
+
+def _impressao_digital(df, posicoes):
+    seg_r, seg_c, cab_r, ent1_c, sai1_c, ent2_c = posicoes
+    return (
+        len(df.columns),
+        _texto_celula(df, seg_r, seg_c),
+        _texto_celula(df, cab_r, ent1_c),
+        _texto_celula(df, cab_r, sai1_c),
+        _texto_celula(df, cab_r, ent2_c),
+    )
+
+def _varrer_ancoras(df):
+    """Varredura completa e vetorizada do cabeçalho; retorna as posições das âncoras."""
+    norm = _normalizar_bloco(df, 40)
+
+    # A) "SEG" (Cabeçalho do Horário Padrão) nas primeiras 30 linhas (primeira ocorrência em ordem de leitura)
+    achados_seg = np.argwhere(norm[:30] == "SEG")
+    if len(achados_seg) == 0:
+        raise ErroPonto("⚠️ Estrutura irreconhecível: Não foi possível encontrar a tabela de Horários (SEG/TER...).")
+    seg_r, seg_c = achados_seg[0]
+
+    # B) "ENTRADA 1" (Cabeçalho dos Dados) entre as linhas 15 e 39
+    erro_colunas = ErroPonto("⚠️ Estrutura irreconhecível: Não foi possível encontrar as colunas de ENTRADA 1, SAÍDA 1 ou ENTRADA 2.")
+    contem = lambda bloco, texto: np.char.find(bloco, texto) >= 0
+    achados_ent1 = np.argwhere(contem(norm[15:], "ENTRADA 1"))
+    if len(achados_ent1) == 0:
+        raise erro_colunas
+    cab_r, ent1_c = achados_ent1[0]
+    cab_r += 15
+
+    # Saída 1 e Entrada 2 na mesma linha, à direita (vale a última ocorrência, como na varredura original)
+    linha = norm[cab_r]
+    depois = np.arange(len(linha)) > ent1_c
+    sai1 = np.flatnonzero(depois & (contem(linha, "SAÍDA 1") | contem(linha, "SAIDA 1")))
+    ent2 = np.flatnonzero(depois & contem(linha, "ENTRADA 2"))
+    if len(sai1) == 0 or len(ent2) == 0:
+        raise erro_colunas
+
+    return int(seg_r), int(seg_c), int(cab_r), int(ent1_c), int(sai1[-1]), int(ent2[-1])
+
+def localizar_ancoras(df):
+    """Retorna o dicionário ``markers`` (linhas/colunas das âncoras) da planilha bruta.
+
+    Tenta primeiro os modelos de layout já conhecidos, validando a impressão
+    digital (textos das células-âncora); se nenhum confere, faz a varredura
+    completa e memoriza o novo modelo.
+    """
+    with _lock_layout:
+        modelos = list(_modelos_layout.items())
+
+    posicoes = None
+    for candidato, impressao in modelos:
+        if _impressao_digital(df, candidato) == impressao:
+            posicoes = candidato
+            break
+
+    with _lock_layout:
+        if posicoes is not None:
+            _estatisticas_layout['acertos'] += 1
+            _modelos_layout.move_to_end(posicoes)
+        else:
+            _estatisticas_layout['falhas'] += 1
+
+    if posicoes is None:
+        posicoes = _varrer_ancoras(df)
+        with _lock_layout:
+            _modelos_layout[posicoes] = _impressao_digital(df, posicoes)
+            while len(_modelos_layout) > _MAX_MODELOS_LAYOUT:
+                _modelos_layout.popitem(last=False)
+
+    seg_r, seg_c, cab_r, ent1_c, sai1_c, ent2_c = posicoes
+    return {
+        'seg_row': df.index[seg_r], 'seg_col': df.columns[seg_c],
+        'header_row': df.index[cab_r],
+        'col_ent1_real': df.columns[ent1_c],
+        'col_sai1_real': df.columns[sai1_c],
+        'col_ent2_real': df.columns[ent2_c],
+    }
+
+def estatisticas_layout():
+    """Contadores do cache de modelos de layout (acertos, falhas, modelos)."""
+    with _lock_layout:
+        return dict(_estatisticas_layout, modelos=len(_modelos_layout))
+
+def colunas_do_ponto(df_topo):
+    """Colunas usadas depois do cabeçalho: data/dia e ENTRADA 1, SAÍDA 1, ENTRADA 2.
+
+    O topo (âncoras até a linha 40, tabela de horários até SEG + 20 linhas)
+    é sempre lido por inteiro. Sem âncoras no topo, mantém todas as colunas e
+    deixa o erro para extrair_estrutura.
+    """
+    try:
+        markers = localizar_ancoras(df_topo)
+    except ErroPonto:
+        return None
+    return [0, markers['col_ent1_real'], markers['col_sai1_real'], markers['col_ent2_real']]
+
+def _ler_batidas(arquivo):
+    informar_progresso(0.05, "Lendo a planilha...")
+    with etapa('ponto.leitura') as medida:
+        df = ler_planilha_podada(arquivo, colunas_do_ponto)
+        medida['linhas'] = len(df)
+    informar_progresso(0.6, "Localizando cabeçalhos e horário padrão...")
+    with etapa('ponto.estrutura') as medida:
+        nome_funcionario, markers, agendamento, linhas_dados = extrair_estrutura(df)
+        medida['linhas'] = len(linhas_dados)
+    informar_progresso(0.8, "Interpretando as batidas...")
+    with etapa('ponto.batidas'):
+        return montar_batidas(nome_funcionario, markers, agendamento, linhas_dados)
+
+
+def carregar_batidas(uploaded_file):
+    """Lê e interpreta um arquivo de ponto, devolvendo o ``BatidasPonto`` (com cache pelo conteúdo).
+
+    Levanta ``ErroPonto`` se o arquivo não puder ser lido ou não tiver a
+    estrutura esperada.
+    """
+    # 1 a 4. CARREGAMENTO, ÂNCORAS, NOME E HORÁRIO PADRÃO (uma vez por conteúdo)
+    try:
+        return ler_cacheado(uploaded_file, _ler_batidas)
+    except ErroPonto:
+        raise
+    except Exception as e:
+        raise ErroPonto(f"Erro ao ler o arquivo: {e}") from e
+
+
+def processar_ponto(uploaded_file, tolerancia=timedelta(minutes=5)):
+    """Analisa um arquivo de ponto e retorna (nome, df_atrasos, total_ocorrencias).
+
+    Aceita qualquer objeto de arquivo com atributo ``name`` (UploadedFile do
+    Streamlit, BytesIO nomeado ou arquivo aberto). Levanta ``ErroPonto`` se o
+    arquivo não puder ser lido ou não tiver a estrutura esperada.
+    """
+    batidas = carregar_batidas(uploaded_file)
+
+    # 5. PROCESSAMENTO DAS BATIDAS
+    df_atrasos, total_ocorrencias_geral = comparar_batidas(batidas, tolerancia)
+
+    return batidas.nome, df_atrasos, total_ocorrencias_geral
+
+def extrair_estrutura(df):
+    """Localiza as âncoras da planilha bruta e retorna (nome, markers, agendamento, linhas_dados)."""
+    # 2. LOCALIZAÇÃO DINÂMICA (SCANNER)
+    # Procura onde estão as âncoras "SEG" (para horário padrão) e "ENTRADA 1" (para os dados)
+    markers = localizar_ancoras(df)
+
+    # 3. EXTRAÇÃO DO NOME
+    try:
+        nome_funcionario = df.iloc[18, 0]
+    except:
+        nome_funcionario = "Nome não encontrado"
+
+    # 4. MAPEAMENTO DOS HORÁRIOS PADRÃO
+    # Usa a coluna do "SEG" encontrada para buscar os outros dias
+    col_ref = markers['seg_col']
+    agendamento = {}
+    dias_sigla = ['SEG', 'TER', 'QUA', 'QUI', 'SEX', 'SAB', 'DOM', 'SÁB']
+
+    # Varre a coluna de referência para achar as linhas de cada dia
+    for r in range(markers['seg_row'], markers['seg_row'] + 20): # Olha 20 linhas para baixo
+        try:
+            celula = str(df.iloc[r, col_ref]).strip().upper()
+            # Mapeia SEG -> Seg, TER -> Ter...
+            dia_chave = None
+            if 'SEG' in celula: dia_chave = 'Seg'
+            elif 'TER' in celula: dia_chave = 'Ter'
+            elif 'QUA' in celula: dia_chave = 'Qua'
+            elif 'QUI' in celula: dia_chave = 'Qui'
+            elif 'SEX' in celula: dia_chave = 'Sex'
+            elif 'SAB' in celula or 'SÁB' in celula: dia_chave = 'Sáb'
+            elif 'DOM' in celula: dia_chave = 'Dom'
+
+            if dia_chave:
+                # Assume que os horários estão deslocados +2, +4, +6 colunas (padrão observado nos dois arquivos)
+                ent1 = limpar_celula_tempo(df.iloc[r, col_ref + 2])
+                sai1 = limpar_celula_tempo(df.iloc[r, col_ref + 4])
+                try: ent2 = limpar_celula_tempo(df.iloc[r, col_ref + 6])
+                except: ent2 = None
+
+                agendamento[dia_chave] = {'std_ent1': ent1, 'std_sai1': sai1, 'std_ent2': ent2}
+        except:
+            pass
+
+    # Linhas das batidas: começa 3 linhas após o cabeçalho "ENTRADA 1" (Padrão observado: Header -> Vazio -> Totais -> Dados)
+    start_row = markers['header_row'] + 3
+    linhas_dados = df.iloc[start_row:].copy()
+
+    return nome_funcionario, markers, agendamento, linhas_dados
@@ -0,0 +1,178 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+
+from desempenho import finalizar_execucao, iniciar_execucao
+
+# ==============================================================================
+# FILA DE TAREFAS EM SEGUNDO PLANO (COMPARTILHADA ENTRE SESSÕES)
+# ==============================================================================
+# Leituras longas (ponto grande, extrato BB anual, vários DREs, lote) rodam num
+# pool de threads único por processo do servidor, com número fixo de workers
+# para todos os usuários. Cada tarefa tem um id e uma chave (ex.: hash do
+# arquivo): enviar de novo a mesma chave devolve a tarefa existente, então um
+# rerun do Streamlit só consulta o andamento, sem refazer o trabalho.
+# As threads do pool não herdam o contexto de quem enviou a tarefa: cada tarefa
+# abre a sua própria Execucao (desempenho), e as etapas medidas dentro dela
+# ficam em ``tarefa.execucao``.
+
+MAX_WORKERS = int(os.environ.get('TAREFAS_MAX_WORKERS', min(4, os.cpu_count() or 1)))
+MAX_TAREFAS_GUARDADAS = 64
+
+PENDENTE, EXECUTANDO, CONCLUIDA, FALHOU = 'pendente', 'executando', 'concluída', 'falhou'
+
+_tarefa_atual = ContextVar('tarefa_atual', default=None)
+
+
+class Tarefa:
+    """Estado de uma tarefa: progresso (0 a 1), mensagem, resultado ou erro."""
+
+    def __init__(self, chave, descricao):
+        self.id = uuid.uuid4().hex
+        self.chave = chave
+        self.descricao = descricao
+        self.estado = PENDENTE
+        self.progresso = 0.0
+        self.mensagem = "Na fila..."
+        self.criada_em = time.time()
+        self.terminada_em = None
+        self.erro = None
+        self.execucao = None
+        self._resultado = None
+        self._futuro = None
+
+    @property
+    def terminada(self):
+        return self.estado in (CONCLUIDA, FALHOU)
+
+    def aguardar(self, timeout=None):
+        """Espera até ``timeout`` segundos; retorna True se a tarefa terminou."""
+        if self._futuro is not None and not self.terminada:
+            try:
+                self._futuro.exception(timeout=timeout)
+            except TimeoutError:
+                pass
+        return self.terminada
+
+    def resultado(self):
+        """Resultado da tarefa concluída; se ela falhou, relança a exceção original."""
+        if self.estado == FALHOU:
+            raise self.erro
+        if self.estado != CONCLUIDA:
+            raise RuntimeError(f"Tarefa {self.id} ainda não terminou ({self.estado}).")
+        return self._resultado
+
+
+def informar_progresso(fracao, mensagem=None):
+    """Atualiza o progresso da tarefa em execução nesta thread (fora de uma tarefa, não faz nada)."""
+    tarefa = _tarefa_atual.get()
+    if tarefa is None:
+        return
+    tarefa.progresso = min(max(float(fracao), 0.0), 1.0)
+    if mensagem is not None:
+        tarefa.mensagem = mensagem
+
+
+class FilaTarefas:
+    """Pool limitado de threads com as tarefas indexadas por id e por chave."""
+
+    def __init__(self, max_workers=MAX_WORKERS, max_guardadas=MAX_TAREFAS_GUARDADAS):
+        self.max_workers = max_workers
+        self.max_guardadas = max_guardadas
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tarefa')
+        self._tarefas = OrderedDict()
+        self._por_chave = {}
+        self._lock = threading.Lock()
+
+    def _executar(self, tarefa, funcao, args, kwargs):
+        token = _tarefa_atual.set(tarefa)
+        iniciar_execucao(rotulo=f"tarefa: {tarefa.descricao}")
+        tarefa.estado = EXECUTANDO
+        tarefa.mensagem = "Processando..."
+        try:
+            resultado = funcao(*args, **kwargs)
+        except Exception as e:
+            tarefa.erro = e
+        finally:
+            tarefa.execucao = finalizar_execucao()
+            tarefa.terminada_em = time.time()
+            _tarefa_atual.reset(token)
+        # O estado muda por último: quem vê a tarefa terminada já encontra a execução medida
+        if tarefa.erro is not None:
+            tarefa.mensagem = str(tarefa.erro)
+            tarefa.estado = FALHOU
+        else:
+            tarefa._resultado = resultado
+            tarefa.progresso, tarefa.mensagem = 1.0, "Concluída"
+            tarefa.estado = CONCLUIDA
+
+    def enviar(self, chave, funcao, *args, descricao=None, **kwargs):
+        """Agenda ``funcao(*args, **kwargs)`` e retorna a ``Tarefa``.
+
+        Se já houver uma tarefa com a mesma ``chave`` (na fila, rodando ou
+        concluída), ela é devolvida e nada é agendado; tarefas que falharam
+        são refeitas.
+        """
+        with self._lock:
+            existente = self._tarefas.get(self._por_chave.get(chave))
+            if existente is not None and existente.estado != FALHOU:
+                self._tarefas.move_to_end(existente.id)
+                return existente
+
+            tarefa = Tarefa(chave, descricao or getattr(funcao, '__name__', 'tarefa'))
+            self._tarefas[tarefa.id] = tarefa
+            self._por_chave[chave] = tarefa.id
+            self._descartar_antigas()
+        tarefa._futuro = self._executor.submit(self._executar, tarefa, funcao, args, kwargs)
+        return tarefa
+
+    def _descartar_antigas(self):
+        # Só tarefas terminadas saem, da mais antiga para a mais nova
+        excesso = len(self._tarefas) - self.max_guardadas
+        for id_tarefa in [i for i, t in self._tarefas.items() if t.terminada][:max(excesso, 0)]:
+            tarefa = self._tarefas.pop(id_tarefa)
+            if self._por_chave.get(tarefa.chave) == id_tarefa:
+                del self._por_chave[tarefa.chave]
+
+    def descartar(self, id_tarefa):
+        """Tira da fila uma tarefa terminada: o próximo envio da mesma chave é agendado de novo."""
+        with self._lock:
+            tarefa = self._tarefas.get(id_tarefa)
+            if tarefa is None or not tarefa.terminada:
+                return
+            del self._tarefas[id_tarefa]
+            if self._por_chave.get(tarefa.chave) == id_tarefa:
+                del self._por_chave[tarefa.chave]
+
+    def obter(self, id_tarefa):
+        with self._lock:
+            return self._tarefas.get(id_tarefa)
+
+    def estatisticas(self):
+        """Quantidade de tarefas por estado e o tamanho do pool."""
+        with self._lock:
+            estados = [t.estado for t in self._tarefas.values()]
+        return {
+            'pendentes': estados.count(PENDENTE),
+            'executando': estados.count(EXECUTANDO),
+            'concluidas': estados.count(CONCLUIDA),
+            'falhas': estados.count(FALHOU),
+            'max_workers': self.max_workers,
+        }
+
+
+_fila = None
+_lock_fila = threading.Lock()
+
+
+def fila_compartilhada():
+    """A fila única do processo (criada no primeiro uso)."""
+    global _fila
+    with _lock_fila:
+        if _fila is None:
+            _fila = FilaTarefas()
+        return _fila
@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from benchmarks.geradores import arquivo_nomeado, gerar_ponto, para_bytes
+from benchmarks.referencia import localizar_ancoras_legado
+import ponto
+from ponto import ErroPonto, estatisticas_layout, localizar_ancoras
+
+# ==============================================================================
+# LOCALIZADOR DE ÂNCORAS E CACHE DE MODELOS DE LAYOUT
+# ==============================================================================
+
+
+def planilha_gerada(seed, variar_layout=True):
+    """Planilha bruta de um ponto gerado; com ``variar_layout``, as tabelas mudam de coluna com a semente."""
+    col_h, col_b = (seed % 3 + 1, seed % 4 + 1) if variar_layout else (1, 2)
+    df = gerar_ponto(20, seed=seed, col_horarios=col_h, col_batidas=col_b)
+    return pd.read_excel(arquivo_nomeado(para_bytes(df), 'ponto.xlsx'), header=None)
+
+
+def conferir_ancoras(df):
+    """Mesmas âncoras (ou o mesmo erro) que a varredura original, na varredura e pelo modelo guardado."""
+    esperado = localizar_ancoras_legado(df)
+    for _ in range(2):  # 1ª vez varre, 2ª vez usa o modelo guardado
+        try:
+            obtido = localizar_ancoras(df)
+        except ErroPonto:
+            obtido = None
+        assert obtido == esperado, (obtido, esperado)
+
+
+@pytest.fixture(autouse=True)
+def sem_modelos_guardados():
+    ponto._modelos_layout.clear()
+    yield
+    ponto._modelos_layout.clear()
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_ancoras_iguais_a_varredura_original(seed):
+    conferir_ancoras(planilha_gerada(seed))
+
+
+def test_arquivo_sem_estrutura_da_erro_nas_duas_vezes():
+    df = pd.DataFrame([['x', 'y']] * 50)
+    assert localizar_ancoras_legado(df) is None
+    for _ in range(2):
+        with pytest.raises(ErroPonto):
+            localizar_ancoras(df)
+    assert estatisticas_layout()['modelos'] == 0
+
+
+def test_mesmo_layout_usa_o_modelo_guardado():
+    antes = estatisticas_layout()
+    localizar_ancoras(planilha_gerada(0, variar_layout=False))
+    localizar_ancoras(planilha_gerada(1, variar_layout=False))
+    depois = estatisticas_layout()
+    assert depois['falhas'] - antes['falhas'] == 1
+    assert depois['acertos'] - antes['acertos'] == 1
+    assert depois['modelos'] == 1
+
+
+def test_modelo_que_nao_confere_cai_na_varredura():
+    # Mesmas dimensões de um modelo guardado, mas as âncoras em outro lugar
+    localizar_ancoras(planilha_gerada(0))
+    outra = planilha_gerada(5)
+    assert localizar_ancoras(outra) == localizar_ancoras_legado(outra)
@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+from benchmarks.geradores import arquivo_nomeado, gerar_ponto, para_bytes
+from benchmarks.referencia import processar_batidas_legado
+from ponto import detectar_atrasos, extrair_estrutura
+
+# ==============================================================================
+# MOTOR VETORIZADO DE ATRASOS x LAÇO ORIGINAL
+# ==============================================================================
+# As conferências recebem uma semente; os testes rodam poucas e o benchmark
+# (benchmarks/bench_atrasos.py) reaproveita as mesmas funções com muitas.
+
+
+def ler_ponto_gerado(conteudo, formato):
+    """Planilha bruta (header=None) de um arquivo gerado por ``gerar_ponto``."""
+    arquivo = arquivo_nomeado(conteudo, f"ponto.{formato}")
+    if formato == 'csv':
+        return pd.read_csv(arquivo, header=None)
+    return pd.read_excel(arquivo, header=None)
+
+
+def estrutura_gerada(seed, n_dias, formato='csv'):
+    """(nome, markers, agendamento, linhas_dados) de um ponto gerado com 20% de batidas estranhas."""
+    return extrair_estrutura(ler_ponto_gerado(para_bytes(gerar_ponto(n_dias, seed=seed, prop_estranhas=0.2), formato), formato))
+
+
+def conferir_deteccao(seed, n_dias=120):
+    """``detectar_atrasos`` igual ao laço original, em XLSX e CSV, com tolerâncias de 0, 5 e 15 min."""
+    for formato in ('xlsx', 'csv'):
+        _, markers, agendamento, linhas_dados = estrutura_gerada(seed, n_dias, formato)
+        for minutos in (0, 5, 15):
+            tolerancia = timedelta(minutes=minutos)
+            esperado, total_esperado = processar_batidas_legado(linhas_dados, markers, agendamento, tolerancia)
+            obtido, total_obtido = detectar_atrasos(linhas_dados, markers, agendamento, tolerancia)
+            assert total_obtido == total_esperado, (seed, formato, minutos, total_obtido, total_esperado)
+            pd.testing.assert_frame_equal(obtido, esperado)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_deteccao_igual_ao_laco_original(seed):
+    conferir_deteccao(seed, n_dias=60)
+
@@ -0,0 +1,113 @@
+import io
+
+import pandas as pd
+import pytest
+
+from cache import CacheLRU, estatisticas_cache, ler_cacheado, limpar_cache
+
+# ==============================================================================
+# CACHE DE LEITURA (LRU POR HASH DO CONTEÚDO)
+# ==============================================================================
+
+
+@pytest.fixture(autouse=True)
+def cache_vazio():
+    limpar_cache()
+    yield
+    limpar_cache()
+
+
+def arquivo(conteudo, nome='planilha.csv'):
+    buffer = io.BytesIO(conteudo)
+    buffer.name = nome
+    return buffer
+
+
+class LeitorContado:
+    """``pd.read_csv`` que conta as leituras de fato (as que não vieram do cache)."""
+
+    def __init__(self):
+        self.chamadas = 0
+
+    def __call__(self, buffer, **opcoes):
+        self.chamadas += 1
+        return pd.read_csv(buffer, **opcoes)
+
+
+def test_lru_descarta_o_menos_usado():
+    cache = CacheLRU(max_itens=2)
+    cache.guardar('a', 1)
+    cache.guardar('b', 2)
+    assert cache.obter('a') == (True, 1)
+    cache.guardar('c', 3)
+    # 'a' foi usado depois de 'b': sai o 'b'
+    assert cache.obter('b') == (False, None)
+    assert cache.obter('a') == (True, 1)
+    assert cache.obter('c') == (True, 3)
+    assert cache.estatisticas()['itens'] == 2
+
+
+def test_lru_conta_acertos_e_falhas():
+    cache = CacheLRU(max_itens=4)
+    cache.obter('x')
+    cache.guardar('x', 10)
+    cache.obter('x')
+    cache.obter('x')
+    assert cache.estatisticas() == {'acertos': 2, 'falhas': 1, 'itens': 1, 'max_itens': 4, 'taxa_acerto': 2 / 3}
+    cache.limpar()
+    assert cache.estatisticas() == {'acertos': 0, 'falhas': 0, 'itens': 0, 'max_itens': 4, 'taxa_acerto': 0.0}
+
+
+def test_mesmo_conteudo_le_uma_vez():
+    leitor = LeitorContado()
+    primeiro = ler_cacheado(arquivo(b'a,b\n1,2\n'), leitor)
+    # Outro objeto, outro nome, mesmos bytes
+    segundo = ler_cacheado(arquivo(b'a,b\n1,2\n', 'outro.csv'), leitor)
+    assert leitor.chamadas == 1
+    pd.testing.assert_frame_equal(primeiro, segundo)
+    assert estatisticas_cache()['acertos'] == 1 and estatisticas_cache()['falhas'] == 1
+
+
+def test_opcoes_diferentes_sao_chaves_diferentes():
+    leitor = LeitorContado()
+    conteudo = b'a;b\n1;2\n'
+    com_sep = ler_cacheado(arquivo(conteudo), leitor, sep=';')
+    sem_cabecalho = ler_cacheado(arquivo(conteudo), leitor, sep=';', header=None)
+    assert leitor.chamadas == 2
+    assert list(com_sep.columns) == ['a', 'b'] and len(sem_cabecalho) == 2
+    # A ordem das opções não muda a chave
+    ler_cacheado(arquivo(conteudo), leitor, header=None, sep=';')
+    assert leitor.chamadas == 2
+
+
+def test_excecao_nao_fica_no_cache():
+    chamadas = []
+
+    def leitor_falho(buffer):
+        chamadas.append(buffer.name)
+        raise ValueError("ilegível")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            ler_cacheado(arquivo(b'qualquer', 'ruim.csv'), leitor_falho)
+    assert chamadas == ['ruim.csv', 'ruim.csv']
+    assert estatisticas_cache()['itens'] == 0
+
+
+def test_devolve_copias():
+    leitor = LeitorContado()
+    df = ler_cacheado(arquivo(b'a,b\n1,2\n'), leitor)
+    df.loc[0, 'a'] = 99
+    df.rename(columns={'b': 'c'}, inplace=True)
+    pd.testing.assert_frame_equal(ler_cacheado(arquivo(b'a,b\n1,2\n'), leitor), pd.DataFrame({'a': [1], 'b': [2]}))
+
+    # Tuplas de DataFrames (leitores que devolvem mais de um resultado) também
+    def leitor_par(buffer):
+        df = pd.read_csv(buffer)
+        return df, df['a']
+
+    df_par, serie = ler_cacheado(arquivo(b'a\n5\n'), leitor_par)
+    df_par.loc[0, 'a'] = 0
+    serie.iloc[0] = 0
+    df_par, serie = ler_cacheado(arquivo(b'a\n5\n'), leitor_par)
+    assert df_par.loc[0, 'a'] == 5 and serie.iloc[0] == 5
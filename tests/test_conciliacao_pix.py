@@ -0,0 +1,127 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.referencia import conciliar_pix_legado
+from pix import _parear_ordenado, conciliar_pix
+
+# ==============================================================================
+# CONCILIAÇÃO PIX x EXTRATO BB
+# ==============================================================================
+
+CEDO, TARDE = pd.Timestamp('2024-03-01'), pd.Timestamp('2024-03-10')
+
+
+def gerar_lancamentos(n, seed=0, prop_faltantes=0.05, prop_extras=0.05):
+    """Lançamentos da planilha (dicts) e valores do extrato com faltantes e extras."""
+    rng = np.random.default_rng(seed)
+    # Poucos valores distintos geram muitas repetições, o caso difícil da conciliação
+    centavos = rng.integers(500, 50_000, size=n)
+    pix_entries = [
+        {'valor': c / 100, 'linha': i + 1, 'coluna': 'D' if i % 2 else 'I'}
+        for i, c in enumerate(centavos.tolist())
+    ]
+    no_banco = centavos[rng.random(n) >= prop_faltantes]
+    extras = rng.integers(500, 50_000, size=int(n * prop_extras))
+    bb_centavos = np.concatenate([no_banco, extras])
+    rng.shuffle(bb_centavos)
+    return pix_entries, (bb_centavos / 100).tolist()
+
+
+def conferir_conciliacao(seed, n=3000):
+    """Sem tolerância nem datas, os mesmos confirmados, faltantes e extras da comparação original."""
+    pix_entries, bb_values = gerar_lancamentos(n, seed)
+    conciliados, faltantes, extras = conciliar_pix_legado(pix_entries, bb_values)
+    df_conc, df_falt, df_extra = conciliar_pix(pd.DataFrame(pix_entries), pd.DataFrame({'Valor': bb_values}))
+
+    assert [e['linha'] for e in conciliados] == df_conc['linha'].tolist()
+    assert [e['linha'] for e in faltantes] == df_falt['linha'].tolist()
+    assert extras == df_extra['Valor'].tolist()
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_conciliacao_igual_a_original(seed):
+    conferir_conciliacao(seed, n=500)
+
+
+def test_valores_quebrados_em_centavos():
+    # 0.1 + 0.2 != 0.3 em float; em centavos inteiros é o mesmo valor
+    conciliados, faltantes, extras = conciliar_pix(pd.DataFrame({'valor': [0.1 + 0.2]}), pd.DataFrame({'Valor': [0.3]}))
+    assert len(conciliados) == 1 and faltantes.empty and extras.empty
+
+
+def test_tolerancia_casa_as_sobras():
+    pix = pd.DataFrame({'valor': [10.00, 20.00, 30.00], 'linha': [1, 2, 3]})
+    bb = pd.DataFrame({'Valor': [20.00, 10.03, 30.10]})
+    conciliados, faltantes, extras = conciliar_pix(pix, bb, tolerancia=0.05)
+    assert conciliados['linha'].tolist() == [1, 2]
+    assert conciliados['diferenca'].tolist() == pytest.approx([0.03, 0.0])
+    assert faltantes['linha'].tolist() == [3]
+    assert extras['Valor'].tolist() == [30.10]
+
+
+def test_janela_de_dias_limita_os_pares():
+    pix = pd.DataFrame({'valor': [10.0, 10.0], 'linha': [1, 2], 'data': [CEDO, TARDE]})
+    bb = pd.DataFrame({'Valor': [10.0, 10.02], 'data': [TARDE + pd.Timedelta(days=30), TARDE]})
+    conciliados, faltantes, extras = conciliar_pix(pix, bb, tolerancia=0.05, janela_dias=3)
+    assert conciliados['linha'].tolist() == [2]
+    assert faltantes['linha'].tolist() == [1]
+    assert extras['Valor'].tolist() == [10.0]
+
+
+def test_valor_repetido_casa_com_a_data_mais_proxima():
+    # Dois na planilha, um no extrato
+    pix = pd.DataFrame({'valor': [10.0, 10.0], 'linha': [1, 2], 'data': [CEDO, TARDE]})
+    bb = pd.DataFrame({'Valor': [10.0], 'data': [TARDE]})
+    conciliados, faltantes, _ = conciliar_pix(pix, bb, janela_dias=15)
+    assert conciliados['linha'].tolist() == [2]
+    assert faltantes['linha'].tolist() == [1]
+
+    # Um na planilha, dois no extrato
+    pix = pd.DataFrame({'valor': [10.0], 'linha': [1], 'data': [TARDE]})
+    bb = pd.DataFrame({'Valor': [10.0, 10.0], 'data': [CEDO, TARDE]})
+    conciliados, _, extras = conciliar_pix(pix, bb, janela_dias=15)
+    assert conciliados['linha'].tolist() == [1]
+    assert extras['data'].tolist() == [CEDO]
+
+
+def test_com_datas_sem_janela_casa_o_maximo_por_valor():
+    rng = np.random.default_rng(3)
+    n = 2000
+    datas = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 365, n), 'D')
+    pix = pd.DataFrame({'valor': rng.integers(500, 600, n) / 100, 'data': datas})
+    bb = pix.sample(frac=0.9, random_state=1).rename(columns={'valor': 'Valor'})
+    bb['data'] = bb['data'] + pd.to_timedelta(rng.integers(-3, 4, len(bb)), 'D')
+    conciliados, faltantes, extras = conciliar_pix(pix, bb)
+    assert len(conciliados) == len(bb) and extras.empty
+    assert (conciliados['valor'] == conciliados['valor_banco']).all()
+
+
+def lancamentos_fora_da_janela(n):
+    """Caso adversário da tolerância: todos os valores casam, nenhuma data cabe na janela de 3 dias."""
+    pix = pd.DataFrame({'valor': [10.00] * n, 'data': pd.Timestamp('2024-01-01')})
+    bb = pd.DataFrame({'Valor': [10.01] * n, 'data': pd.Timestamp('2024-01-01') + pd.Timedelta(days=400)})
+    return pix, bb
+
+
+def test_tolerancia_com_janela_nao_revisita_datas_recusadas():
+    # Antes, cada lançamento percorria todos os do extrato no mesmo valor: O(n·m)
+    pix, bb = lancamentos_fora_da_janela(20_000)
+    inicio = time.perf_counter()
+    conciliados, faltantes, extras = conciliar_pix(pix, bb, tolerancia=0.05, janela_dias=3)
+    assert time.perf_counter() - inicio < 5
+    assert conciliados.empty and len(faltantes) == len(extras) == 20_000
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_tolerancia_com_janela_respeita_valor_e_data(seed):
+    rng = np.random.default_rng(seed)
+    centavos_a, centavos_b = rng.integers(1000, 1020, 500), rng.integers(1000, 1020, 400)
+    dias_a, dias_b = rng.integers(0, 60, 500), rng.integers(0, 60, 400)
+    pos_a, pos_b = _parear_ordenado(centavos_a, centavos_b, 3, dias_a, dias_b, janela_dias=2)
+    assert len(pos_a) > 200
+    assert len(set(pos_a.tolist())) == len(pos_a) and len(set(pos_b.tolist())) == len(pos_b)
+    assert (np.abs(centavos_a[pos_a] - centavos_b[pos_b]) <= 3).all()
+    assert (np.abs(dias_a[pos_a] - dias_b[pos_b]) <= 2).all()
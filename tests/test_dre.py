@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.geradores import gerar_dre
+from benchmarks.referencia import buscar_por_classificacao, limpar_valor_financeiro
+from dre import IndiceDRE, limpar_movimento
+
+# ==============================================================================
+# ÍNDICE DO DRE x BUSCA ORIGINAL POR CLASSIFICAÇÃO
+# ==============================================================================
+
+
+def tabela_gerada(n_linhas, seed=0):
+    """Classificação e Movimento de um DRE gerado (o recorte que a página recebe de ler_colunas_por_cabecalho)."""
+    bruto = gerar_dre(n_linhas, seed=seed, linhas_titulo=0)
+    df = bruto.iloc[1:, [1, 6]].reset_index(drop=True)
+    df.columns = ['Classificação', 'Movimento']
+    return df
+
+
+def tabela_suja(n_linhas, seed=0):
+    """``tabela_gerada`` com a sujeira que a limpeza original tolera: vazios, NaN, texto e números."""
+    df = tabela_gerada(n_linhas, seed)
+    df.loc[df.sample(frac=0.05, random_state=seed).index, 'Movimento'] = np.nan
+    df.loc[df.sample(frac=0.02, random_state=seed + 1).index, 'Movimento'] = ' '
+    df.loc[df.sample(frac=0.02, random_state=seed + 2).index, 'Movimento'] = 'n/d'
+    df.loc[df.sample(frac=0.02, random_state=seed + 3).index, 'Classificação'] = np.nan
+    return df
+
+
+def conferir_indice(df):
+    """Limpeza, busca exata e soma hierárquica do índice iguais à busca original."""
+    esperado = [limpar_valor_financeiro(v) for v in df['Movimento']]
+    assert limpar_movimento(df['Movimento']).tolist() == esperado
+
+    indice = IndiceDRE.de_dataframe(df)
+    codigos = df['Classificação'].dropna().unique().tolist() + ['99.9', '04']
+    obtido = indice.buscar(codigos)
+    for codigo in codigos:
+        assert obtido[codigo] == buscar_por_classificacao(df, codigo), codigo
+
+    # Soma hierárquica: folhas abaixo do prefixo, conferida por varredura simples
+    por_codigo = df.dropna(subset=['Classificação']).drop_duplicates('Classificação')
+    por_codigo = dict(zip(por_codigo['Classificação'], limpar_movimento(por_codigo['Movimento'])))
+    for prefixo in ('04', '04.2', '01', '05.1.1'):
+        filhos = [c for c in por_codigo if c.startswith(prefixo + '.')]
+        folhas = [c for c in filhos if not any(o.startswith(c + '.') for o in filhos)]
+        assert np.isclose(indice.buscar([prefixo + '.*'])[prefixo + '.*'], sum(por_codigo[c] for c in folhas))
+
+
+@pytest.mark.parametrize('seed', range(2))
+def test_indice_igual_a_busca_original(seed):
+    conferir_indice(tabela_suja(500, seed))
+
+
+def test_consolidacao_soma_os_arquivos():
+    a, b = tabela_gerada(300, 1), tabela_gerada(300, 2)
+    consolidado = IndiceDRE.consolidar([a, b]).buscar(['04.2'])['04.2']
+    assert np.isclose(consolidado, buscar_por_classificacao(a, '04.2') + buscar_por_classificacao(b, '04.2'))
+
+
+def test_limpeza_do_movimento():
+    serie = pd.Series(['1.234,56D', '1.234,56C', ' 10,5 ', '', 'n/d', 5, None], dtype=object)
+    assert limpar_movimento(serie).tolist() == [1234.56, 1234.56, 10.5, 0.0, 0.0, 5.0, 0.0]
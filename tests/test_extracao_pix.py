@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.geradores import arquivo_nomeado, gerar_planilha_pix
+from benchmarks.referencia import extrair_lancamentos_pix_legado
+from pix import detectar_pares_pix, extrair_lancamentos_pix, ler_planilha_pix
+
+# ==============================================================================
+# EXTRAÇÃO DOS LANÇAMENTOS DA PLANILHA PIX
+# ==============================================================================
+
+
+def planilha_com_ruido(n, seed=0):
+    """Planilha Pix gerada com células que a extração deve ignorar (texto no valor, rótulo vazio)."""
+    df, _ = gerar_planilha_pix(n, seed=seed)
+    rng = np.random.default_rng(seed)
+    df = df.astype(object)
+    for coluna_valor in (3, 8):
+        linhas = rng.choice(np.arange(2, len(df)), size=max(1, len(df) // 50), replace=False)
+        df.loc[linhas[::2], coluna_valor] = 'R$ --'
+        df.loc[linhas[1::2], coluna_valor - 1] = None
+    return df
+
+
+def conferir_lancamentos(df):
+    """Mesmos valores, linhas e colunas que a extração original célula a célula."""
+    legado = pd.DataFrame(extrair_lancamentos_pix_legado(df))
+    atual = extrair_lancamentos_pix(df)
+    assert legado['valor'].tolist() == atual['valor'].tolist()
+    assert legado['linha'].tolist() == atual['linha'].tolist()
+    assert legado['coluna'].tolist() == atual['coluna'].astype(str).tolist()
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_extracao_igual_a_original(seed):
+    conferir_lancamentos(planilha_com_ruido(500, seed))
+
+
+def test_valores_em_centavos_sem_totais():
+    df, valores = gerar_planilha_pix(60, seed=4)
+    lancamentos = extrair_lancamentos_pix(df)
+    assert lancamentos['valor'].tolist() == valores
+    assert lancamentos['centavos'].tolist() == [round(v * 100) for v in valores]
+    assert lancamentos['centavos'].dtype == np.int64
+
+
+def test_par_extra_com_o_mesmo_formato():
+    df, _ = gerar_planilha_pix(20, seed=1)
+    df[10] = None
+    df[11] = None
+    df.loc[2:6, 10] = [f"Cliente {i}" for i in range(5)]
+    df.loc[2:6, 11] = [1.5, 2.5, 3.5, 4.5, 5.5]
+    assert detectar_pares_pix(df) == [(2, 3), (7, 8), (10, 11)]
+    lancamentos = extrair_lancamentos_pix(df)
+    assert lancamentos[lancamentos['coluna'] == 'L']['linha'].tolist() == [3, 4, 5, 6, 7]
+
+
+def test_colunas_de_numeros_nao_viram_par():
+    df, _ = gerar_planilha_pix(20, seed=1)
+    df[10] = None
+    df[11] = None
+    df.loc[2:6, 10] = [101, 102, 103, 104, 105]
+    df.loc[2:6, 11] = [1.5, 2.5, 3.5, 4.5, 5.5]
+    assert detectar_pares_pix(df) == [(2, 3), (7, 8)]
+
+
+def test_planilha_sem_lancamentos():
+    lancamentos = extrair_lancamentos_pix(pd.DataFrame([['a', 'b']]))
+    assert lancamentos.empty
+    assert lancamentos.columns.tolist() == ['valor', 'centavos', 'linha', 'coluna']
+
+
+def test_coluna_de_datas_nao_vira_valor(tmp_path):
+    # Texto ("Vendedor") seguido de uma coluna de datas, lido do XLSX como datetime64
+    df, valores = gerar_planilha_pix(40, seed=1)
+    df[0] = None
+    df[1] = None
+    df.loc[2:22, 0] = 'Vendedor A'
+    df.loc[2:22, 1] = pd.Timestamp('2024-03-01')
+    df[1] = pd.to_datetime(df[1])
+    caminho = tmp_path / 'pix.xlsx'
+    df.to_excel(caminho, header=False, index=False)
+    with open(caminho, 'rb') as f:
+        lido = ler_planilha_pix(arquivo_nomeado(f.read(), 'pix.xlsx'))
+
+    assert pd.api.types.is_datetime64_any_dtype(lido[1])
+    assert detectar_pares_pix(lido) == [(2, 3), (7, 8)]
+    assert extrair_lancamentos_pix(lido)['valor'].tolist() == valores
+
+
+@pytest.mark.parametrize('coluna', [
+    pd.Series(pd.to_timedelta([1, 2, 3, 4, 5], unit='h')),
+    pd.Series([True, False, True, True, False]),
+])
+def test_duracoes_e_booleanos_nao_viram_valor(coluna):
+    df = pd.DataFrame({0: [f"Cliente {i}" for i in range(5)], 1: coluna})
+    assert detectar_pares_pix(df) == []
@@ -0,0 +1,67 @@
+import csv
+import io
+
+import pandas as pd
+import pytest
+
+from benchmarks.geradores import arquivo_nomeado, gerar_extrato_bb, para_bytes
+from pix import ErroExtrato, ler_extrato_bb
+
+# ==============================================================================
+# LEITURA DO EXTRATO BB EM BLOCOS
+# ==============================================================================
+
+CABECALHO_BB = '"Data";"Dependencia Origem";"Lote";"Documento";"Cod. Histórico";"Detalhamento";"Conta";"Agência";"Tipo";"Histórico";"Valor";"C/D"'
+
+
+def linha_bb(historico, valor, detalhamento='Operação Pix'):
+    """Linha do extrato BB sem aspas (como alguns exportadores gravam)."""
+    return f'01/01/2024;0000;14000;100000;821;{detalhamento};12345-6;1234;C;{historico};{valor};C'
+
+
+def valores_esperados(conteudo, encoding='latin1'):
+    """Valores dos Pix QR Code do CSV, lidos linha a linha com o módulo csv."""
+    linhas = list(csv.reader(io.StringIO(conteudo.decode(encoding)), delimiter=';'))[1:]
+    return [float(l[10].replace('.', '').replace(',', '.')) for l in linhas if 'Pix-Recebido QR Code' in l[9]]
+
+
+@pytest.mark.parametrize('tamanho_bloco', [7, 100, 100_000])
+def test_blocos_leem_os_mesmos_valores(tamanho_bloco):
+    conteudo = gerar_extrato_bb([i / 100 for i in range(500, 1500)], seed=3)
+    valores = ler_extrato_bb(arquivo_nomeado(conteudo, 'extrato.csv'), tamanho_bloco=tamanho_bloco)['Valor']
+    assert valores.tolist() == valores_esperados(conteudo)
+
+
+def test_byte_latin1_depois_da_amostra():
+    # O início (usado para detectar o encoding) é UTF-8 puro; o 'ç' latin1 só vem depois de 64 KB
+    linhas = [CABECALHO_BB] + [linha_bb('Pix-Recebido QR Code', '10,00') for _ in range(2000)]
+    conteudo = ('\r\n'.join(linhas) + '\r\n').encode('utf-8')
+    conteudo += (linha_bb('Pix-Recebido QR Code', '30,00', detalhamento='Devolução') + '\r\n').encode('latin1')
+    valores = ler_extrato_bb(arquivo_nomeado(conteudo, 'extrato.csv'), tamanho_bloco=500)['Valor']
+    assert len(valores) == 2001
+    assert valores.iloc[-1] == 30.0
+
+
+def test_extrato_sem_pix():
+    conteudo = ('\r\n'.join([CABECALHO_BB, linha_bb('Tarifa Pacote Serviços', '12,90')]) + '\r\n').encode('latin1')
+    valores = ler_extrato_bb(arquivo_nomeado(conteudo, 'extrato.csv'))['Valor']
+    assert valores.empty and valores.dtype == float
+
+
+def test_extrato_que_nao_e_csv():
+    conteudo = para_bytes(pd.DataFrame({'a': [1]}))
+    with pytest.raises(ErroExtrato):
+        ler_extrato_bb(arquivo_nomeado(conteudo, 'extrato.xlsx'))
+
+
+def test_extrato_com_poucas_colunas():
+    with pytest.raises(ErroExtrato):
+        ler_extrato_bb(arquivo_nomeado(b"Data;Valor\n01/01/2024;10,00\n", 'extrato.csv'))
+
+
+def test_linhas_sem_aspas_com_virgula_decimal():
+    # Sem aspas, ';' e ',' aparecem o mesmo número de vezes em cada linha: o separador é o do layout
+    linhas = [linha_bb('Pix-Recebido QR Code', f'1.234,{i:02d}') for i in range(20)]
+    conteudo = ('\r\n'.join([CABECALHO_BB.replace('"', '')] + linhas) + '\r\n').encode('utf-8')
+    valores = ler_extrato_bb(arquivo_nomeado(conteudo, 'extrato.csv'))['Valor']
+    assert valores.tolist() == [1234 + i / 100 for i in range(20)]
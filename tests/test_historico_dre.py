@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from benchmarks.geradores import arquivo_nomeado, gerar_dre, para_bytes
+from cache import hash_conteudo
+from historico_dre import COLUNAS_INDICADORES, ErroHistorico, HistoricoDRE, periodo_do_nome
+
+# ==============================================================================
+# HISTÓRICO MENSAL DO DRE
+# ==============================================================================
+
+
+@pytest.fixture
+def historico(tmp_path):
+    return HistoricoDRE(str(tmp_path / 'historico_dre.sqlite'))
+
+
+def gravar_rol(historico, periodo, rol):
+    historico.gravar(periodo, f"hash {periodo}", f"DRE {periodo}.xlsx", dict.fromkeys(COLUNAS_INDICADORES, rol))
+
+
+@pytest.mark.parametrize('nome, periodo', [
+    ('DRE 2024-01.xlsx', '2024-01'),
+    ('dre_01_2024.csv', '2024-01'),
+    ('DRE 3.2024.xlsx', '2024-03'),
+    ('DRE jan-24.xlsx', '2024-01'),
+    ('Balancete Março 2023.xlsx', '2023-03'),
+    ('pasta/DRE 202412.xlsx', '2024-12'),
+    ('DRE final.xlsx', None),
+    ('DRE 2024-13.xlsx', None),
+])
+def test_periodo_do_nome(nome, periodo):
+    assert periodo_do_nome(nome) == periodo
+
+
+def test_crescimento_so_entre_meses_seguidos(historico):
+    for periodo, rol in (('2024-01', 100.0), ('2024-03', 150.0), ('2024-04', 300.0), ('2025-01', 600.0)):
+        gravar_rol(historico, periodo, rol)
+    crescimento = historico.serie()['crescimento_rol']
+    assert np.isnan(crescimento['2024-01'])
+    assert np.isnan(crescimento['2024-03'])
+    assert crescimento['2024-04'] == 1.0
+    assert np.isnan(crescimento['2025-01'])
+
+
+def test_virada_de_ano_e_mes_seguido(historico):
+    gravar_rol(historico, '2023-12', 200.0)
+    gravar_rol(historico, '2024-01', 100.0)
+    assert historico.serie()['crescimento_rol']['2024-01'] == -0.5
+
+
+def test_mes_anterior_zerado_nao_tem_crescimento(historico):
+    gravar_rol(historico, '2024-01', 0.0)
+    gravar_rol(historico, '2024-02', 100.0)
+    assert np.isnan(historico.serie()['crescimento_rol']['2024-02'])
+
+
+def test_registrar_le_cada_conteudo_uma_vez(historico):
+    conteudo = para_bytes(gerar_dre(100, seed=1))
+    assert historico.registrar(arquivo_nomeado(conteudo, 'DRE 2024-05.xlsx')) == ('2024-05', True)
+    # Mesmo conteúdo com outro nome: já está no histórico, nada é lido
+    assert historico.registrar(arquivo_nomeado(conteudo, 'sem periodo.xlsx')) == ('2024-05', False)
+    assert historico.serie().index.tolist() == ['2024-05']
+
+
+def test_novo_arquivo_do_mesmo_periodo_substitui(historico):
+    historico.registrar(arquivo_nomeado(para_bytes(gerar_dre(100, seed=1)), 'DRE 2024-05.xlsx'))
+    historico.registrar(arquivo_nomeado(para_bytes(gerar_dre(100, seed=2)), 'DRE 05-2024 revisado.xlsx'))
+    serie = historico.serie()
+    assert serie.index.tolist() == ['2024-05']
+    assert serie['arquivo'].iloc[0] == 'DRE 05-2024 revisado.xlsx'
+
+
+def test_arquivo_sem_periodo_no_nome(historico):
+    with pytest.raises(ErroHistorico):
+        historico.registrar(arquivo_nomeado(para_bytes(gerar_dre(50)), 'DRE final.xlsx'))
+    assert historico.serie().empty
+
+
+def test_remover_periodo(historico):
+    gravar_rol(historico, '2024-01', 100.0)
+    gravar_rol(historico, '2024-02', 110.0)
+    historico.remover('2024-01')
+    assert historico.serie().index.tolist() == ['2024-02']
+    assert historico.periodo_do_hash('hash 2024-01') is None
+
+
+def test_registrar_arquivos_separa_erros_por_hash(historico):
+    bom = arquivo_nomeado(para_bytes(gerar_dre(50, seed=1)), 'DRE 2024-01.xlsx')
+    sem_periodo = arquivo_nomeado(para_bytes(gerar_dre(50, seed=2)), 'DRE final.xlsx')
+    ilegivel = arquivo_nomeado(b'\x00\x01 nada', 'DRE 2024-02.xlsx')
+    novos, erros = historico.registrar_arquivos([bom, sem_periodo, ilegivel])
+    assert novos == ['2024-01']
+    assert list(erros) == [hash_conteudo(sem_periodo.getvalue()), hash_conteudo(ilegivel.getvalue())]
+    assert 'período não identificado' in erros[hash_conteudo(sem_periodo.getvalue())]
+    assert erros[hash_conteudo(ilegivel.getvalue())].startswith('DRE 2024-02.xlsx: erro ao processar')
+    assert historico.periodo_do_hash(hash_conteudo(ilegivel.getvalue())) is None
@@ -0,0 +1,145 @@
+import pandas as pd
+import pytest
+
+from banco_local import conectar
+from benchmarks.geradores import popular_historico_ponto
+from historico_ponto import SEM_NOME, HistoricoPonto, mes_predominante
+
+# ==============================================================================
+# HISTÓRICO DE ATRASOS (PAINEL)
+# ==============================================================================
+
+
+@pytest.fixture
+def historico(tmp_path):
+    return HistoricoPonto(str(tmp_path / 'historico_ponto.sqlite'))
+
+
+def atrasos(*dias):
+    """Resultado de ``comparar_batidas`` com um atraso de manhã em cada 'dd/mm/aaaa' (e no almoço nos dias pares)."""
+    almoco = [int(d[:2]) % 2 == 0 for d in dias]
+    return pd.DataFrame({
+        'Data': list(dias),
+        'Dia': ['Seg'] * len(dias),
+        'Qtd': [1 + a for a in almoco],
+        'Detalhes': ["Manhã (08:12)" + (", Volta Almoço (Lim 13:05 vs Real 13:20)" if a else "") for a in almoco],
+    })
+
+
+def arquivos_gravados(historico):
+    with conectar(historico.caminho) as con:
+        return pd.read_sql_query("SELECT * FROM arquivos_ponto ORDER BY hash", con)
+
+
+def ocorrencias_gravadas(historico):
+    with conectar(historico.caminho) as con:
+        return pd.read_sql_query("SELECT * FROM ocorrencias_ponto", con)
+
+
+def conferir_consultas(historico):
+    """As consultas agregadas do painel batem com o mesmo cálculo em pandas sobre as tabelas gravadas."""
+    arquivos, ocorrencias = arquivos_gravados(historico), ocorrencias_gravadas(historico)
+    meses = historico.meses()
+    assert meses == sorted(arquivos['mes'].dropna().unique())
+    filtros = [{}, {'mes_inicio': meses[len(meses) // 2]}, {'mes_inicio': meses[0], 'mes_fim': meses[0]}]
+    filtros.append({'funcionarios': historico.funcionarios()[:2]})
+
+    for filtro in filtros:
+        arq = arquivos[
+            (arquivos['mes'] >= filtro.get('mes_inicio', '')) & (arquivos['mes'] <= filtro.get('mes_fim', '9999'))
+            & arquivos['funcionario'].isin(filtro.get('funcionarios', arquivos['funcionario']))
+        ]
+        oco = ocorrencias[
+            (ocorrencias['mes'] >= filtro.get('mes_inicio', '')) & (ocorrencias['mes'] <= filtro.get('mes_fim', '9999'))
+            & ocorrencias['funcionario'].isin(filtro.get('funcionarios', ocorrencias['funcionario']))
+        ]
+
+        assert historico.resumo(**filtro) == {
+            'arquivos': len(arq), 'funcionarios': arq['funcionario'].nunique(),
+            'dias_com_atraso': int(arq['dias_com_atraso'].sum()), 'ocorrencias': int(arq['total_ocorrencias'].sum()),
+        }
+
+        por_mes = oco.groupby('mes').agg(
+            Ocorrências=('qtd', 'sum'), Manhã=('manha', 'sum'), Almoço=('almoco', 'sum'), Funcionários=('funcionario', 'nunique'),
+        )
+        obtido = historico.por_mes(**filtro).set_index('Mês')
+        pd.testing.assert_frame_equal(obtido, por_mes.rename_axis('Mês'), check_dtype=False)
+
+        por_dia = oco.groupby('dia')[['qtd', 'manha', 'almoco']].sum()
+        obtido = historico.por_dia_semana(**filtro).set_index('Dia')
+        assert obtido['Ocorrências'].to_dict() == por_dia['qtd'].to_dict()
+        assert obtido['Almoço'].to_dict() == por_dia['almoco'].to_dict()
+
+        por_func = arq.groupby('funcionario')['total_ocorrencias'].sum()
+        obtido = historico.por_funcionario(limite=5, **filtro)
+        assert obtido['Ocorrências'].tolist() == sorted(por_func, reverse=True)[:5]
+        assert obtido['Arquivos'].sum() == arq['funcionario'].isin(obtido['Funcionário']).sum()
+
+        for min_meses in (1, 3):
+            meses_func = oco.groupby('funcionario')['mes'].nunique()
+            obtido = historico.reincidentes(min_meses, **filtro)
+            assert sorted(obtido['Funcionário']) == sorted(meses_func[meses_func >= min_meses].index)
+            assert (obtido['Meses com Atraso'] >= min_meses).all()
+            assert obtido['Meses com Atraso'].is_monotonic_decreasing
+
+
+def test_mesmo_conteudo_substitui(historico):
+    historico.registrar('h1', 'ponto.xlsx', 'ANA', '2024-03', atrasos('04/03/2024', '05/03/2024'))
+    historico.registrar('h1', 'ponto (1).xlsx', 'ANA', '2024-03', atrasos('04/03/2024', '05/03/2024'))
+    assert arquivos_gravados(historico)['arquivo'].tolist() == ['ponto (1).xlsx']
+    assert len(ocorrencias_gravadas(historico)) == 2
+
+
+def test_mesmo_funcionario_e_mes_substitui(historico):
+    historico.registrar('h1', 'ana marco.xlsx', 'ANA', '2024-03', atrasos('04/03/2024', '05/03/2024'))
+    # Nova versão do ponto (outro conteúdo) do mesmo mês; o mês seguinte fica
+    historico.registrar('h2', 'ana abril.xlsx', 'ANA', '2024-04', atrasos('02/04/2024'))
+    historico.registrar('h3', 'ana marco v2.xlsx', ' ANA ', '2024-03', atrasos('06/03/2024'))
+    assert arquivos_gravados(historico)['hash'].tolist() == ['h2', 'h3']
+    ocorrencias = ocorrencias_gravadas(historico)
+    assert sorted(ocorrencias['data']) == ['2024-03-06', '2024-04-02']
+    assert set(ocorrencias['funcionario']) == {'ANA'}
+
+
+def test_sem_nome_so_substitui_pelo_mesmo_conteudo(historico):
+    historico.registrar('h1', 'a.xlsx', None, '2024-03', atrasos('04/03/2024'))
+    historico.registrar('h2', 'b.xlsx', '  ', '2024-03', atrasos('05/03/2024'))
+    historico.registrar('h3', 'c.xlsx', float('nan'), '2024-03', atrasos('06/03/2024'))
+    assert arquivos_gravados(historico)['hash'].tolist() == ['h1', 'h2', 'h3']
+    assert set(arquivos_gravados(historico)['funcionario']) == {SEM_NOME}
+
+    historico.registrar('h2', 'b.xlsx', None, '2024-03', atrasos('05/03/2024', '07/03/2024'))
+    assert arquivos_gravados(historico)['hash'].tolist() == ['h1', 'h2', 'h3']
+    assert historico.resumo() == {'arquivos': 3, 'funcionarios': 1, 'dias_com_atraso': 4, 'ocorrencias': 6}
+
+
+def test_arquivo_sem_atrasos_conta_no_resumo(historico):
+    historico.registrar('h1', 'ana.xlsx', 'ANA', '2024-03', atrasos())
+    historico.registrar('h2', 'bia.xlsx', 'BIA', '2024-03', None)
+    historico.registrar('h3', 'caio.xlsx', 'CAIO', '2024-03', atrasos('04/03/2024', '06/03/2024'))
+    assert historico.resumo() == {'arquivos': 3, 'funcionarios': 3, 'dias_com_atraso': 2, 'ocorrencias': 4}
+    por_mes = historico.por_mes()
+    assert por_mes.to_dict('records') == [{'Mês': '2024-03', 'Ocorrências': 4, 'Manhã': 2, 'Almoço': 2, 'Funcionários': 1}]
+    assert historico.por_funcionario()['Funcionário'].tolist() == ['CAIO', 'ANA', 'BIA']
+
+
+def test_reincidentes_e_dias_da_semana(historico):
+    for i, mes in enumerate(['01', '02', '03']):
+        historico.registrar(f"ana{i}", 'ana.xlsx', 'ANA', f"2024-{mes}", atrasos(f"10/{mes}/2024"))
+    historico.registrar('bia', 'bia.xlsx', 'BIA', '2024-03', atrasos('04/03/2024', '05/03/2024', '06/03/2024'))
+    reincidentes = historico.reincidentes(3)
+    assert reincidentes.to_dict('records') == [
+        {'Funcionário': 'ANA', 'Meses com Atraso': 3, 'Ocorrências': 6, 'Último Mês': '2024-03'},
+    ]
+    assert historico.reincidentes(3, mes_inicio='2024-02').empty
+    assert historico.por_dia_semana()['Dia'].tolist() == ['Seg']
+
+
+def test_mes_predominante():
+    assert mes_predominante(['30/01/2024', '01/02/2024', '02/02/2024', 'inválida']) == '2024-02'
+    assert mes_predominante(['', None]) is None
+
+
+def test_consultas_agregadas(historico):
+    popular_historico_ponto(historico, n_funcionarios=12, n_meses=14)
+    conferir_consultas(historico)
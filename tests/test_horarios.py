@@ -0,0 +1,70 @@
+import random
+from datetime import time as hora, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.referencia import limpar_celula_tempo_legado
+from ponto import _segundos_do_texto, converter_tempo_segundos, estatisticas_memo_horarios, limpar_celula_tempo
+
+# ==============================================================================
+# LEITURA DE HORÁRIOS COM MEMO x FUNÇÃO ORIGINAL (STRPTIME)
+# ==============================================================================
+
+
+def todos_horarios():
+    """Todos os horários do dia em 'HH:MM', 'H:M' e 'HH:MM:SS'."""
+    valores = []
+    for h in range(24):
+        for m in range(60):
+            valores += [f"{h:02d}:{m:02d}", f"{h}:{m}", f"{h:02d}:{m:02d}:{(h * m) % 60:02d}"]
+    return valores
+
+
+def valores_estranhos(n, seed=0):
+    """Textos aleatórios de dígitos e separadores mais os casos de borda conhecidos."""
+    rnd = random.Random(seed)
+    alfabeto = '0123456789:::  *hx-.٣²'
+    valores = [''.join(rnd.choice(alfabeto) for _ in range(rnd.randint(0, 9))) for _ in range(n)]
+    valores += ['24:00', '23:60', '08:10:60', '8:5', '008:00', '08:00:00:00', ':', '', ' 07:59:30 ', '*13:20', 'Falta',
+                None, np.nan, 800, 8.5, hora(8, 7), hora(23, 59, 59), pd.Timestamp('2024-01-01 08:00')]
+    return valores
+
+
+def conferir_horarios(valores):
+    """Célula a célula e em lote, o mesmo resultado da função original."""
+    for v in valores:
+        assert limpar_celula_tempo(v) == limpar_celula_tempo_legado(v), repr(v)
+
+    serie = pd.Series(valores, dtype=object)
+    esperado = [np.nan if (td := limpar_celula_tempo_legado(v)) is None else td.total_seconds() for v in valores]
+    pd.testing.assert_series_equal(converter_tempo_segundos(serie), pd.Series(esperado, dtype=float))
+
+
+def test_todos_os_horarios_do_dia():
+    conferir_horarios(todos_horarios())
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_valores_estranhos(seed):
+    conferir_horarios(valores_estranhos(2000, seed))
+
+
+@pytest.mark.parametrize('texto, esperado', [
+    ('08:05', timedelta(hours=8, minutes=5)),
+    (' 7:5:9 ', timedelta(hours=7, minutes=5, seconds=9)),
+    ('*13:20', timedelta(hours=13, minutes=20)),
+    ('24:00', None),
+    ('Falta', None),
+])
+def test_casos_conhecidos(texto, esperado):
+    assert limpar_celula_tempo(texto) == esperado
+
+
+def test_texto_repetido_vem_do_memo():
+    _segundos_do_texto.cache_clear()
+    converter_tempo_segundos(pd.Series(['08:00', '12:00', '08:00', '08:00', None]))
+    limpar_celula_tempo('12:00')
+    memo = estatisticas_memo_horarios()
+    assert (memo['falhas'], memo['acertos'], memo['itens']) == (2, 1, 2)
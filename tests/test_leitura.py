@@ -0,0 +1,81 @@
+import codecs
+
+import pandas as pd
+import pytest
+
+from benchmarks.geradores import arquivo_nomeado, gerar_ponto, para_bytes
+from leitura import ErroLeitura, detectar_encoding, detectar_separador, formato_csv, ler_planilha, tipo_arquivo
+
+# ==============================================================================
+# CAMADA DE LEITURA: TIPO, ENCODING E SEPARADOR
+# ==============================================================================
+
+
+@pytest.mark.parametrize('texto, sep', [
+    ("data;descricao;valor\n01/03/2024;Pix;150,00\n02/03/2024;Tarifa;12,90\n", ';'),
+    ("data,descricao,valor\n01/03/2024,Pix,150.00\n02/03/2024,Tarifa,12.90\n", ','),
+    ('"data";"valor"\n"01/03/2024";"1.234,56"\n"02/03/2024";"7,00"\n', ';'),
+    ('data,valor\n01/03/2024,"1.234,56"\n02/03/2024,"7,00"\n', ','),
+    ("a\tb\tc\n1\t2\t3\n", '\t'),
+    ("a|b\n1|2\n", '|'),
+    ("uma coluna\nsem separador\n", ','),
+])
+def test_separador(texto, sep):
+    assert detectar_separador(texto) == sep
+
+
+def test_separador_ignora_a_ultima_linha_cortada():
+    texto = "a;b;c\n1;2,5;3\n4;5,5;6\n7;8,"
+    assert detectar_separador(texto) == ';'
+
+
+@pytest.mark.parametrize('conteudo, encoding', [
+    ("Histórico;Valor\n".encode('utf-8'), 'utf-8'),
+    (codecs.BOM_UTF8 + "Histórico;Valor\n".encode('utf-8'), 'utf-8-sig'),
+    ("Histórico;Valor\n".encode('latin1'), 'latin1'),
+    (b"Historico;Valor\n", 'utf-8'),
+    # Caractere multibyte cortado no fim da amostra continua UTF-8
+    ("Histórico;Transferência".encode('utf-8')[:-2], 'utf-8'),
+])
+def test_encoding(conteudo, encoding):
+    assert detectar_encoding(conteudo) == encoding
+
+
+def test_formato_csv_com_bom_e_ponto_e_virgula():
+    conteudo = codecs.BOM_UTF8 + "Funcionário;Cargo\nAna;Junior\n".encode('utf-8')
+    arquivo = arquivo_nomeado(conteudo, 'quadro.csv')
+    assert formato_csv(arquivo) == ('utf-8-sig', ';')
+    assert arquivo.tell() == 0
+    df = ler_planilha(arquivo, header=0)
+    assert df.columns.tolist() == ['Funcionário', 'Cargo']
+
+
+def test_csv_latin1_com_virgula_decimal():
+    conteudo = "Descrição;Valor\nTransferência;1.234,56\nPix;7,00\n".encode('latin1')
+    df = ler_planilha(arquivo_nomeado(conteudo, 'extrato.csv'), header=0, dtype=str)
+    assert df['Descrição'].tolist() == ['Transferência', 'Pix']
+    assert df['Valor'].tolist() == ['1.234,56', '7,00']
+
+
+def test_tipo_pelo_conteudo_e_nao_pela_extensao():
+    xlsx = para_bytes(gerar_ponto(5))
+    assert tipo_arquivo(arquivo_nomeado(xlsx, 'ponto.csv')) == 'xlsx'
+    assert tipo_arquivo(arquivo_nomeado(b"a;b\n1;2\n", 'ponto.xlsx')) == 'csv'
+    assert tipo_arquivo(arquivo_nomeado(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1' + b'\x00' * 100, 'antigo.xls')) == 'xls'
+
+
+@pytest.mark.parametrize('conteudo', [b'', b'  \r\n\n'])
+def test_arquivo_vazio(conteudo):
+    with pytest.raises(ErroLeitura, match='vazio'):
+        tipo_arquivo(arquivo_nomeado(conteudo, 'vazio.csv'))
+
+
+def test_binario_que_nao_e_planilha():
+    with pytest.raises(ErroLeitura, match='não reconhecido'):
+        ler_planilha(arquivo_nomeado(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR' + b'\x00' * 64, 'foto.xlsx'))
+
+
+def test_xlsx_lido_igual_ao_read_excel():
+    conteudo = para_bytes(gerar_ponto(10, seed=2))
+    esperado = pd.read_excel(arquivo_nomeado(conteudo, 'ponto.xlsx'), header=None)
+    pd.testing.assert_frame_equal(ler_planilha(arquivo_nomeado(conteudo, 'ponto.xlsx')), esperado, check_dtype=False)
@@ -0,0 +1,65 @@
+import io
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+from benchmarks.geradores import arquivo_nomeado, gerar_dre, gerar_ponto, para_bytes
+import leitura
+from cache import limpar_cache
+from ponto import detectar_atrasos, extrair_estrutura, processar_ponto
+
+# ==============================================================================
+# LEITURA PODADA DO XLSX x PD.READ_EXCEL COMPLETO
+# ==============================================================================
+# Com o openpyxl em streaming, só o topo da planilha vem com todas as colunas;
+# o resultado final (atrasos do ponto, colunas do DRE) tem de ser o mesmo.
+
+MOTORES = sorted({'openpyxl', leitura.MOTOR_XLSX})
+
+
+def conferir_ponto_podado(conteudo):
+    """``processar_ponto`` sobre a leitura podada dá os mesmos atrasos que sobre o pd.read_excel."""
+    nome, markers, agendamento, linhas = extrair_estrutura(pd.read_excel(io.BytesIO(conteudo), header=None))
+    esperado, total = detectar_atrasos(linhas, markers, agendamento, timedelta(minutes=5))
+    limpar_cache()
+    obtido_nome, obtido, obtido_total = processar_ponto(arquivo_nomeado(conteudo, 'ponto.xlsx'))
+    assert (obtido_nome, obtido_total) == (nome, total)
+    pd.testing.assert_frame_equal(obtido, esperado)
+
+
+def conferir_colunas_dre(conteudo):
+    """Classificação e Movimento lidos pelo cabeçalho iguais aos do pd.read_excel completo."""
+    bruto = pd.read_excel(io.BytesIO(conteudo), header=None)
+    idx = bruto.index[bruto.apply(lambda row: row.astype(str).str.contains('Classificação').any(), axis=1)][0]
+    bruto.columns = bruto.iloc[idx].astype(str).str.strip()
+    esperado = bruto[idx + 1:][['Classificação', 'Movimento']].astype(str).reset_index(drop=True)
+    obtido = leitura.ler_colunas_por_cabecalho(arquivo_nomeado(conteudo, 'dre.xlsx'), 'Classificação', ('Classificação', 'Movimento'))
+    pd.testing.assert_frame_equal(obtido.astype(str), esperado, check_dtype=False, check_names=False)
+
+
+@pytest.fixture(params=MOTORES)
+def motor(request, monkeypatch):
+    monkeypatch.setattr(leitura, 'MOTOR_XLSX', request.param)
+    return request.param
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_ponto_podado_igual_ao_completo(motor, seed):
+    conferir_ponto_podado(para_bytes(gerar_ponto(30 + seed * 40, seed=seed, prop_estranhas=0.3, col_batidas=seed % 3 + 1)))
+
+
+@pytest.mark.parametrize('linhas_titulo', [3, 70])
+def test_colunas_do_dre_iguais_ao_completo(motor, linhas_titulo):
+    # 70 linhas de título: o cabeçalho fica depois das LINHAS_CABECALHO lidas por inteiro
+    conferir_colunas_dre(para_bytes(gerar_dre(300, linhas_titulo=linhas_titulo)))
+
+
+def test_poda_deixa_vazias_as_colunas_nao_usadas(monkeypatch):
+    monkeypatch.setattr(leitura, 'MOTOR_XLSX', 'openpyxl')
+    df = pd.DataFrame([[f"{l}{c}" for c in range(6)] for l in range(80)])
+    podada = leitura.ler_planilha_podada(arquivo_nomeado(para_bytes(df), 'x.xlsx'), lambda topo: [0, 2], linhas_cabecalho=10)
+    assert podada.shape == (80, 6)
+    assert podada.iloc[:10].notna().all().all()
+    assert podada.iloc[10:, [0, 2]].notna().all().all()
+    assert podada.iloc[10:, [1, 3, 4, 5]].isna().all().all()
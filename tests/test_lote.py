@@ -0,0 +1,109 @@
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+
+import vale
+from benchmarks.geradores import gerar_ponto, para_bytes
+from lote import COLUNAS_LOTE, coletar_arquivos, main, processar_lote
+
+# ==============================================================================
+# PROCESSAMENTO EM LOTE (PONTO)
+# ==============================================================================
+
+
+def ponto_gerado(seed, nome="FUNCIONÁRIO TESTE", formato='xlsx'):
+    return para_bytes(gerar_ponto(31, seed=seed, nome=nome), formato)
+
+
+def zip_com(arquivos):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        for nome, conteudo in arquivos.items():
+            zf.writestr(nome, conteudo)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def pasta_lote(tmp_path):
+    """Pasta com dois pontos (um numa subpasta), um ZIP com um terceiro e um arquivo que não é de ponto."""
+    pasta = tmp_path / 'pasta'
+    (pasta / 'sub').mkdir(parents=True)
+    (pasta / 'ana.xlsx').write_bytes(ponto_gerado(1, "ANA"))
+    (pasta / 'sub' / 'bia.csv').write_bytes(ponto_gerado(2, "BIA", 'csv'))
+    (pasta / 'leia-me.txt').write_text("não é ponto")
+    (pasta / 'mes.zip').write_bytes(zip_com({
+        'carlos.xlsx': ponto_gerado(3, "CARLOS"),
+        '__MACOSX/._carlos.xlsx': b'\x00\x05\x16\x07 lixo do macOS',
+        'outros/': b'',
+    }))
+    return pasta
+
+
+def test_coletar_expande_pastas_e_zips(pasta_lote):
+    itens = coletar_arquivos([str(pasta_lote)])
+    nomes = sorted(nome.replace(str(pasta_lote), '') for nome, _ in itens)
+    assert nomes == ['/ana.xlsx', '/mes.zip/carlos.xlsx', '/sub/bia.csv']
+    # Arquivos soltos são lidos pelo processo de trabalho; os do ZIP já vêm em bytes
+    conteudos = {nome.replace(str(pasta_lote), ''): conteudo for nome, conteudo in itens}
+    assert conteudos['/ana.xlsx'] is None
+    with zipfile.ZipFile(pasta_lote / 'mes.zip') as zf:
+        assert conteudos['/mes.zip/carlos.xlsx'] == zf.read('carlos.xlsx')
+
+
+def test_coletar_aceita_tuplas_e_arquivos_abertos():
+    arquivo = io.BytesIO(zip_com({'a.csv': b'x', 'b.xlsx': b'y', 'c.pdf': b'z'}))
+    arquivo.name = 'envio.zip'
+    assert coletar_arquivos([('solto.csv', b'w'), arquivo]) == [
+        ('solto.csv', b'w'), ('envio.zip/a.csv', b'x'), ('envio.zip/b.xlsx', b'y'),
+    ]
+
+
+def test_zip_invalido_e_caminho_inexistente_viram_linhas_de_erro(tmp_path):
+    df = processar_lote([('quebrado.zip', b'PK\x03\x04 truncado'), str(tmp_path / 'sumiu.xlsx')], max_workers=1)
+    assert list(df.columns) == COLUNAS_LOTE
+    assert df['Arquivo'].tolist() == ['quebrado.zip', str(tmp_path / 'sumiu.xlsx')]
+    assert df['Erro'].notna().all()
+    assert df['Erro'].iloc[1].startswith('Erro ao ler o arquivo')
+    assert (df['Total de Ocorrências'] == 0).all()
+
+
+def test_erros_nao_interrompem_o_lote(pasta_lote):
+    df = processar_lote([str(pasta_lote), ('vazio.csv', b''), ('texto.csv', b'a;b\n1;2\n')], max_workers=1)
+    assert len(df) == 5
+    ok = df[df['Erro'].isna()]
+    assert sorted(ok['Funcionário']) == ['ANA', 'BIA', 'CARLOS']
+    assert (ok['Total de Ocorrências'] >= ok['Dias com Atraso']).all()
+    assert df.loc[df['Erro'].notna(), 'Arquivo'].tolist() == ['vazio.csv', 'texto.csv']
+
+
+def test_conteudo_repetido_conta_uma_vez(pasta_lote):
+    # O mesmo arquivo na pasta e num ZIP enviado à parte
+    mesmo = (pasta_lote / 'ana.xlsx').read_bytes()
+    df = processar_lote([str(pasta_lote), ('copia.zip', zip_com({'ana de novo.xlsx': mesmo}))], max_workers=1)
+    repetida = df[df['Arquivo'] == 'copia.zip/ana de novo.xlsx'].iloc[0]
+    assert repetida['Erro'].startswith('Conteúdo repetido de') and repetida['Erro'].endswith('ana.xlsx (não contado)')
+    assert repetida['Total de Ocorrências'] == 0
+    assert len(df) == 4 and df['Erro'].notna().sum() == 1
+
+    sozinho = processar_lote([str(pasta_lote)], max_workers=1)
+    assert df['Total de Ocorrências'].sum() == sozinho['Total de Ocorrências'].sum()
+
+
+def test_pool_de_processos_da_o_mesmo_resultado(pasta_lote):
+    entradas = [str(pasta_lote), ('vazio.csv', b'')]
+    sequencial = processar_lote(entradas, max_workers=1)
+    paralelo = processar_lote(entradas, max_workers=2)
+    pd.testing.assert_frame_equal(paralelo, sequencial)
+
+
+def test_vale_com_lote_repetido_nao_dobra_os_atrasos(pasta_lote, tmp_path):
+    consolidado = tmp_path / 'lote.csv'
+    mesmo = (pasta_lote / 'ana.xlsx').read_bytes()
+    (tmp_path / 'copia.zip').write_bytes(zip_com({'ana.xlsx': mesmo}))
+    assert main([str(pasta_lote), str(tmp_path / 'copia.zip'), '-w', '1', '-o', str(consolidado)]) == 0
+
+    sozinho = processar_lote([str(pasta_lote / 'ana.xlsx')], max_workers=1)
+    atrasos = vale.atrasos_por_funcionario(pd.read_csv(consolidado, sep=';', encoding='utf-8-sig'))
+    assert atrasos['ANA'] == sozinho['Total de Ocorrências'].iloc[0]
@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+from benchmarks.referencia import processar_batidas_legado
+from ponto import comparar_batidas, montar_batidas, varrer_tolerancias
+from tests.test_atrasos import estrutura_gerada
+
+# ==============================================================================
+# RE-ANÁLISE SEM RELER O ARQUIVO (HORÁRIO, ALMOÇO, TOLERÂNCIA)
+# ==============================================================================
+# A comparação sobre as batidas já interpretadas tem de dar o mesmo que a
+# análise completa (laço original) feita com os parâmetros alterados.
+
+HORARIO_ALTERADO = {
+    'Seg': {'std_ent1': timedelta(hours=7, minutes=30), 'std_sai1': timedelta(hours=11, minutes=30), 'std_ent2': timedelta(hours=12, minutes=30)},
+    'Sáb': None,
+}
+
+
+def conferir_parametros_alterados(seed, n_dias=120):
+    """Horário e almoço alterados e a varredura de tolerâncias batem com a comparação completa."""
+    _, markers, agendamento, linhas_dados = estrutura_gerada(seed, n_dias)
+    batidas = montar_batidas(None, markers, agendamento, linhas_dados)
+
+    # Re-análise sem reler o arquivo = análise completa com o horário já alterado
+    alterado = {**agendamento, **HORARIO_ALTERADO}
+    for minutos in (0, 10):
+        tolerancia = timedelta(minutes=minutos)
+        esperado, total = processar_batidas_legado(linhas_dados, markers, alterado, tolerancia)
+        obtido, total_obtido = comparar_batidas(batidas, tolerancia, agendamento=HORARIO_ALTERADO)
+        assert total_obtido == total, (seed, minutos)
+        pd.testing.assert_frame_equal(obtido, esperado)
+
+    # Duração fixa de almoço = horário padrão com ENTRADA 2 = SAÍDA 1 + duração
+    almoco = timedelta(minutes=75)
+    com_almoco = {
+        dia: p if p is None or not (p['std_sai1'] and p['std_ent2']) else {**p, 'std_ent2': p['std_sai1'] + almoco}
+        for dia, p in agendamento.items()
+    }
+    esperado, total = processar_batidas_legado(linhas_dados, markers, com_almoco, timedelta(minutes=5))
+    obtido, total_obtido = comparar_batidas(batidas, timedelta(minutes=5), duracao_almoco=almoco)
+    assert total_obtido == total, seed
+    pd.testing.assert_frame_equal(obtido, esperado)
+
+    varredura = varrer_tolerancias(batidas, range(0, 31, 3), agendamento=HORARIO_ALTERADO)
+    for _, linha in varredura.iterrows():
+        df_atrasos, total = comparar_batidas(batidas, timedelta(minutes=int(linha['Tolerância (min)'])), agendamento=HORARIO_ALTERADO)
+        assert (linha['Dias com Atraso'], linha['Total de Ocorrências']) == (len(df_atrasos), total), (seed, linha.tolist())
+
+
+@pytest.mark.parametrize('seed', range(2))
+def test_reanalise_igual_a_analise_completa(seed):
+    conferir_parametros_alterados(seed, n_dias=60)
+
+
+def test_sem_alteracao_repete_a_analise_padrao():
+    _, markers, agendamento, linhas_dados = estrutura_gerada(5, 60)
+    batidas = montar_batidas(None, markers, agendamento, linhas_dados)
+    esperado, total = processar_batidas_legado(linhas_dados, markers, agendamento, timedelta(minutes=5))
+    obtido, total_obtido = comparar_batidas(batidas, timedelta(minutes=5), agendamento={})
+    assert total_obtido == total
+    pd.testing.assert_frame_equal(obtido, esperado)
@@ -0,0 +1,131 @@
+import threading
+
+import pytest
+
+from tarefas import CONCLUIDA, EXECUTANDO, FALHOU, FilaTarefas, informar_progresso
+
+# ==============================================================================
+# FILA DE TAREFAS EM SEGUNDO PLANO
+# ==============================================================================
+
+ESPERA = 10  # segundos; só estoura se algo travar
+
+
+@pytest.fixture
+def fila():
+    fila = FilaTarefas(max_workers=1, max_guardadas=2)
+    yield fila
+    fila._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class Bloqueada:
+    """Função que só termina quando ``liberar`` é chamado; conta as chamadas."""
+
+    def __init__(self, resultado='ok'):
+        self.resultado = resultado
+        self.chamadas = 0
+        self.comecou = threading.Event()
+        self._liberada = threading.Event()
+
+    def __call__(self):
+        self.chamadas += 1
+        self.comecou.set()
+        assert self._liberada.wait(ESPERA)
+        return self.resultado
+
+    def liberar(self):
+        self._liberada.set()
+
+
+def test_mesma_chave_devolve_a_mesma_tarefa(fila):
+    funcao = Bloqueada(resultado=42)
+    tarefa = fila.enviar('chave', funcao, descricao="lenta")
+    assert funcao.comecou.wait(ESPERA)
+    assert fila.enviar('chave', funcao) is tarefa
+    assert tarefa.estado == EXECUTANDO and not tarefa.aguardar(timeout=0.01)
+    with pytest.raises(RuntimeError):
+        tarefa.resultado()
+
+    funcao.liberar()
+    assert tarefa.aguardar(ESPERA)
+    # Concluída continua valendo para a chave: o rerun só lê o resultado
+    assert fila.enviar('chave', funcao) is tarefa
+    assert tarefa.resultado() == 42 and funcao.chamadas == 1
+    assert tarefa.execucao is not None and tarefa.execucao.rotulo == "tarefa: lenta"
+
+
+def test_tarefa_que_falhou_e_refeita(fila):
+    chamadas = []
+
+    def falha_na_primeira():
+        chamadas.append(1)
+        if len(chamadas) == 1:
+            raise ValueError("arquivo ilegível")
+        return 'segunda'
+
+    primeira = fila.enviar('chave', falha_na_primeira)
+    assert primeira.aguardar(ESPERA) and primeira.estado == FALHOU
+    assert primeira.mensagem == "arquivo ilegível"
+    with pytest.raises(ValueError, match="ilegível"):
+        primeira.resultado()
+
+    segunda = fila.enviar('chave', falha_na_primeira)
+    assert segunda is not primeira
+    assert segunda.aguardar(ESPERA) and segunda.resultado() == 'segunda'
+    assert fila.enviar('chave', falha_na_primeira) is segunda
+
+
+def test_descartar_so_tira_tarefas_terminadas(fila):
+    funcao = Bloqueada()
+    tarefa = fila.enviar('chave', funcao)
+    assert funcao.comecou.wait(ESPERA)
+    fila.descartar(tarefa.id)
+    assert fila.obter(tarefa.id) is tarefa
+
+    funcao.liberar()
+    assert tarefa.aguardar(ESPERA)
+    fila.descartar(tarefa.id)
+    assert fila.obter(tarefa.id) is None
+    # A mesma chave volta a ser agendada
+    nova = fila.enviar('chave', funcao)
+    assert nova is not tarefa and nova.aguardar(ESPERA)
+    assert funcao.chamadas == 2
+    fila.descartar('id inexistente')
+
+
+def test_descarte_das_antigas_preserva_as_que_nao_terminaram(fila):
+    # max_guardadas=2, um worker: a primeira roda, as outras esperam na fila
+    bloqueadas = [Bloqueada(i) for i in range(4)]
+    tarefas = [fila.enviar(i, funcao) for i, funcao in enumerate(bloqueadas)]
+    assert bloqueadas[0].comecou.wait(ESPERA)
+    assert [fila.obter(t.id) for t in tarefas] == tarefas
+    assert fila.estatisticas() == {'pendentes': 3, 'executando': 1, 'concluidas': 0, 'falhas': 0, 'max_workers': 1}
+
+    for funcao in bloqueadas:
+        funcao.liberar()
+    for tarefa in tarefas:
+        assert tarefa.aguardar(ESPERA)
+    # O próximo envio tira as terminadas mais antigas até sobrar o limite
+    ultima = fila.enviar('nova', lambda: None)
+    assert ultima.aguardar(ESPERA)
+    assert [t for t in tarefas if fila.obter(t.id)] == [tarefas[3]]
+    assert fila.obter(ultima.id) is ultima
+    # A chave de uma tarefa descartada é agendada de novo
+    assert fila.enviar(0, lambda: 'de novo') is not tarefas[0]
+
+
+def test_progresso_dentro_e_fora_da_tarefa(fila):
+    informar_progresso(0.5, "fora de uma tarefa")
+    informou, liberar = threading.Event(), threading.Event()
+
+    def com_progresso():
+        informar_progresso(1.7, "quase")
+        informou.set()
+        assert liberar.wait(ESPERA)
+
+    tarefa = fila.enviar('progresso', com_progresso)
+    assert informou.wait(ESPERA)
+    assert (tarefa.progresso, tarefa.mensagem) == (1.0, "quase")
+    liberar.set()
+    assert tarefa.aguardar(ESPERA)
+    assert tarefa.estado == CONCLUIDA and tarefa.mensagem == "Concluída"
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.geradores import arquivo_nomeado
+from benchmarks.referencia import calcular_vale_legado
+from vale import TABELA_CARGOS, atrasos_por_funcionario, calcular_folha, calcular_vale_funcionario, ler_quadro
+
+# ==============================================================================
+# VALE ALIMENTAÇÃO: FAIXAS DE PENALIDADE E FOLHA EM LOTE
+# ==============================================================================
+
+
+def gerar_quadro(n, seed=0):
+    """Quadro com ``n`` funcionários, cargos da tabela e atrasos ~ Poisson(3)."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Funcionário': [f"FUNCIONÁRIO {i:06d}" for i in range(n)],
+        'Cargo': rng.choice(list(TABELA_CARGOS), size=n),
+        'Atrasos': rng.poisson(3, size=n),
+    })
+
+
+def conferir_cargo(cargo, max_atrasos=40):
+    """Valor, desconto, mensagem e nível iguais ao cálculo original de 0 a ``max_atrasos`` atrasos."""
+    for qtd in range(max_atrasos + 1):
+        final, diferenca, mensagem, nivel = calcular_vale_legado(cargo, qtd)
+        vale = calcular_vale_funcionario(cargo, qtd)
+        assert (vale['valor_final'], vale['desconto'], vale['mensagem'], vale['nivel']) == (final, diferenca, mensagem, nivel), (cargo, qtd)
+
+
+def conferir_folha(quadro):
+    """Cada linha da folha vetorizada paga o mesmo que o cálculo original, funcionário a funcionário."""
+    folha = calcular_folha(quadro)
+    legado = [calcular_vale_legado(c, q) for c, q in zip(quadro['Cargo'], quadro['Atrasos'])]
+    assert np.allclose(folha['Valor a Receber'], np.round([v[0] for v in legado], 2))
+
+
+@pytest.mark.parametrize('cargo', list(TABELA_CARGOS))
+def test_faixas_iguais_ao_calculo_original(cargo):
+    conferir_cargo(cargo)
+
+
+def test_folha_igual_ao_calculo_um_a_um():
+    conferir_folha(gerar_quadro(500))
+
+
+def test_atrasos_do_consolidado_preenchem_o_quadro():
+    quadro = pd.DataFrame({'Funcionário': ['José da Silva', 'Ana', 'Bruno'], 'Cargo': ['Junior', 'Cargo X', 'Senior'], 'Atrasos': [np.nan, 1, np.nan]})
+    consolidado = pd.DataFrame({
+        'Funcionário': ['JOSE  DA SILVA', 'jose da silva', 'Ana', None],
+        'Total de Ocorrências': [2, 3, 10, 7],
+        'Erro': [None, None, None, 'arquivo ruim'],
+    })
+    folha = calcular_folha(quadro, atrasos_por_funcionario(consolidado))
+    assert folha['Atrasos'].tolist() == [5, 1, 0]
+    assert np.isnan(folha.loc[1, 'Valor Base'])
+    assert pd.isna(folha.loc[0, 'Observação'])
+    assert folha['Observação'].tolist()[1:] == ["Cargo não encontrado na tabela", "Sem atrasos apurados (considerado 0)"]
+
+
+def test_quadro_csv_com_ponto_e_virgula():
+    conteudo = "Nome;Cargo;Ocorrências\nAna; Premium ;2\n;Junior;1\nBia;Master;\n".encode('utf-8')
+    quadro = ler_quadro(arquivo_nomeado(conteudo, 'quadro.csv'))
+    assert quadro['Funcionário'].tolist() == ['Ana', 'Bia']
+    assert quadro['Cargo'].tolist() == ['Premium', 'Master']
+    assert quadro['Atrasos'].iloc[0] == 2 and np.isnan(quadro['Atrasos'].iloc[1])
+
+
+def test_quadro_sem_cargo_e_rejeitado():
+    with pytest.raises(ValueError):
+        ler_quadro(arquivo_nomeado(b"Nome,Setor\nAna,RH\n", 'quadro.csv'))
@@ -0,0 +1,209 @@
+import argparse
+import io
+import sys
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from desempenho import cronometrado
+from leitura import ler_planilha
+
+# ==============================================================================
+# VALE ALIMENTAÇÃO: TABELA DE CARGOS E REGRAS DE PENALIDADE
+# ==============================================================================
+# As faixas de penalidade são dados, não ramificações: a calculadora individual
+# e a folha em lote passam pela mesma função vetorizada (calcular_vale), então
+# as duas telas sempre chegam ao mesmo valor.
+
+TABELA_CARGOS = {"Junior": 252.07, "Premium": 348.45, "Senior": 444.84, "Master": 548.64}
+
+DIAS_BASE = 30
+VALOR_CESTA_BASICA = 148.27
+
+# (mínimo de atrasos, dias descontados, valor fixo, nível do alerta, mensagem);
+# cada faixa vale do seu mínimo até o mínimo da seguinte
+FAIXAS_PENALIDADE = [
+    (0, 0, None, 'success', "✅ Nenhuma penalidade aplicada (Menos de 3 atrasos)."),
+    (3, 2, None, 'warning', "⚠️ Penalidade: Desconto de 2 dias (R$ {desconto:.2f})."),
+    (4, 7, None, 'error', "⛔ Penalidade: Desconto de 7 dias (R$ {desconto:.2f})."),
+    (8, 0, VALOR_CESTA_BASICA, 'error', "🚨 Penalidade Máxima: Redução para valor fixo de cesta básica."),
+]
+
+COLUNAS_FOLHA = ['Funcionário', 'Cargo', 'Atrasos', 'Valor Base', 'Desconto', 'Valor a Receber', 'Penalidade', 'Observação']
+
+
+def calcular_vale(cargos, atrasos):
+    """Valor do vale para vários funcionários de uma vez.
+
+    ``cargos`` e ``atrasos`` são sequências do mesmo tamanho. Retorna um
+    DataFrame com 'Valor Base', 'Desconto' (negativo), 'Valor a Receber',
+    'Faixa' (índice em ``FAIXAS_PENALIDADE``) e 'Penalidade'. Cargos fora de
+    ``TABELA_CARGOS`` ficam com valores NaN.
+    """
+    codigos_cargo, nomes_cargo = pd.factorize(pd.Series(cargos, dtype=object))
+    base_cargo = np.array([TABELA_CARGOS.get(c, np.nan) for c in nomes_cargo], dtype=float)
+    base = np.append(base_cargo, np.nan)[codigos_cargo]
+    qtd = np.asarray(atrasos, dtype=float)
+
+    minimos = np.array([f[0] for f in FAIXAS_PENALIDADE], dtype=float)
+    faixa = np.clip(np.searchsorted(minimos, qtd, side='right') - 1, 0, len(FAIXAS_PENALIDADE) - 1)
+    dias = np.array([f[1] for f in FAIXAS_PENALIDADE], dtype=float)[faixa]
+    fixo = np.array([np.nan if f[2] is None else f[2] for f in FAIXAS_PENALIDADE], dtype=float)[faixa]
+
+    final = np.where(np.isnan(fixo), base - dias * (base / DIAS_BASE), fixo)
+    final = np.where(np.isnan(base), np.nan, final)
+    desconto = final - base
+
+    # A mensagem só depende de (faixa, cargo): formata uma vez por par distinto
+    # (cargo vazio tem código -1, por isso o +1)
+    par = faixa * (len(nomes_cargo) + 1) + codigos_cargo + 1
+    _, primeira, inverso = np.unique(par, return_index=True, return_inverse=True)
+    mensagens = np.array([
+        None if np.isnan(desconto[i]) else FAIXAS_PENALIDADE[faixa[i]][4].format(desconto=-desconto[i])
+        for i in primeira.tolist()
+    ], dtype=object)
+    penalidade = mensagens[inverso]
+    return pd.DataFrame({
+        'Valor Base': base,
+        'Desconto': desconto,
+        'Valor a Receber': final,
+        'Faixa': faixa,
+        'Penalidade': penalidade,
+    })
+
+
+def calcular_vale_funcionario(cargo, atrasos):
+    """Resultado de um funcionário: dict com valor_base, desconto, valor_final, nivel e mensagem."""
+    linha = calcular_vale([cargo], [atrasos]).iloc[0]
+    return {
+        'valor_base': float(linha['Valor Base']),
+        'desconto': float(linha['Desconto']),
+        'valor_final': float(linha['Valor a Receber']),
+        'nivel': FAIXAS_PENALIDADE[int(linha['Faixa'])][3],
+        'mensagem': linha['Penalidade'],
+    }
+
+
+# ==============================================================================
+# FOLHA EM LOTE
+# ==============================================================================
+
+def normalizar_nome(nome):
+    """Chave para casar nomes do quadro com os do ponto (sem acentos, caixa ou espaços extras)."""
+    if pd.isna(nome):
+        return ''
+    texto = unicodedata.normalize('NFKD', str(nome)).encode('ascii', 'ignore').decode()
+    return ' '.join(texto.upper().split())
+
+
+def _coluna(df, *opcoes):
+    nomes = {normalizar_nome(c): c for c in df.columns}
+    for opcao in opcoes:
+        if normalizar_nome(opcao) in nomes:
+            return nomes[normalizar_nome(opcao)]
+    return None
+
+
+def ler_quadro(arquivo):
+    """Quadro de funcionários (XLSX ou CSV com ',' ou ';') com as colunas Funcionário e Cargo.
+
+    A coluna Atrasos é opcional. Retorna um DataFrame com as colunas
+    'Funcionário', 'Cargo' e 'Atrasos' (NaN quando ausente). Levanta
+    ``ValueError`` se faltar Funcionário ou Cargo.
+    """
+    df = ler_planilha(arquivo, header=0, dtype=object)
+
+    col_func = _coluna(df, 'Funcionário', 'Nome')
+    col_cargo = _coluna(df, 'Cargo')
+    if col_func is None or col_cargo is None:
+        raise ValueError("O quadro precisa das colunas 'Funcionário' e 'Cargo'.")
+    col_atrasos = _coluna(df, 'Atrasos', 'Total de Ocorrências', 'Ocorrências')
+
+    quadro = pd.DataFrame({
+        'Funcionário': df[col_func].astype(object),
+        'Cargo': df[col_cargo].astype(object).map(lambda c: c.strip() if isinstance(c, str) else c),
+        'Atrasos': pd.to_numeric(df[col_atrasos], errors='coerce') if col_atrasos else np.nan,
+    })
+    return quadro[quadro['Funcionário'].notna()].reset_index(drop=True)
+
+
+def atrasos_por_funcionario(df):
+    """Soma 'Total de Ocorrências' por nome normalizado (ex.: consolidado do lote ou do painel)."""
+    coluna = 'Total de Ocorrências' if 'Total de Ocorrências' in df.columns else 'Ocorrências'
+    if 'Erro' in df.columns:
+        df = df[df['Erro'].isna()]
+    return df.groupby(df['Funcionário'].map(normalizar_nome))[coluna].sum()
+
+
+@cronometrado('vale.folha', contagem=lambda folha: {'linhas': len(folha)})
+def calcular_folha(quadro, atrasos=None):
+    """Folha do vale para o quadro inteiro.
+
+    As quantidades de atraso vêm da coluna 'Atrasos' do quadro e, onde ela
+    estiver vazia, de ``atrasos`` (Series nome normalizado -> ocorrências, ver
+    ``atrasos_por_funcionario``). Funcionários sem nenhuma das duas entram com
+    zero atrasos e uma observação; cargos desconhecidos ficam sem valor.
+    """
+    qtd = pd.to_numeric(quadro['Atrasos'], errors='coerce') if 'Atrasos' in quadro.columns else pd.Series(np.nan, index=quadro.index)
+    if atrasos is not None:
+        qtd = qtd.fillna(quadro['Funcionário'].map(normalizar_nome).map(atrasos))
+    sem_apuracao = qtd.isna()
+    qtd = qtd.fillna(0).astype('int64')
+
+    valores = calcular_vale(quadro['Cargo'], qtd)
+    observacao = np.where(sem_apuracao, "Sem atrasos apurados (considerado 0)", None)
+    observacao = np.where(valores['Valor Base'].isna(), "Cargo não encontrado na tabela", observacao)
+
+    folha = pd.DataFrame({
+        'Funcionário': quadro['Funcionário'].to_numpy(),
+        'Cargo': quadro['Cargo'].to_numpy(),
+        'Atrasos': qtd.to_numpy(),
+        'Valor Base': valores['Valor Base'].round(2),
+        'Desconto': valores['Desconto'].round(2),
+        'Valor a Receber': valores['Valor a Receber'].round(2),
+        'Penalidade': valores['Penalidade'],
+        'Observação': observacao,
+    })
+    return folha[COLUNAS_FOLHA]
+
+
+def folha_para_csv(folha):
+    return folha.to_csv(index=False, sep=';', decimal=',').encode('utf-8-sig')
+
+
+def folha_para_xlsx(folha):
+    buffer = io.BytesIO()
+    folha.to_excel(buffer, index=False, sheet_name='Vale Alimentação')
+    return buffer.getvalue()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Folha do vale alimentação para um quadro de funcionários.")
+    parser.add_argument('quadro', help="XLSX/CSV com Funcionário, Cargo e (opcional) Atrasos")
+    parser.add_argument('--lote', help="CSV consolidado do lote de ponto (lote.py -o) com os atrasos")
+    parser.add_argument('-o', '--saida', help="Caminho da folha (.csv ou .xlsx; padrão: imprime na tela)")
+    args = parser.parse_args(argv)
+
+    with open(args.quadro, 'rb') as f:
+        arquivo = io.BytesIO(f.read())
+    arquivo.name = args.quadro
+    atrasos = None
+    if args.lote:
+        atrasos = atrasos_por_funcionario(pd.read_csv(args.lote, sep=';', encoding='utf-8-sig'))
+
+    folha = calcular_folha(ler_quadro(arquivo), atrasos)
+    if args.saida:
+        with open(args.saida, 'wb') as f:
+            f.write(folha_para_xlsx(folha) if args.saida.lower().endswith('.xlsx') else folha_para_csv(folha))
+    else:
+        print(folha.to_string(index=False))
+
+    sem_cargo = folha['Valor Base'].isna().sum()
+    if sem_cargo:
+        print(f"{sem_cargo} funcionário(s) com cargo desconhecido.", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())